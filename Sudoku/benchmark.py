@@ -0,0 +1,341 @@
+import argparse  # Import the argparse module
+import fnmatch  # Import the fnmatch module
+import json  # Import the json module
+import os  # Import the os module
+import platform  # Import the platform module
+import random  # Import the random module
+import sys  # Import the sys module
+import time  # Import the time module
+import tracemalloc  # Import the tracemalloc module
+
+from logic.Board import Board  # Import the Board class
+from logic.Generator import Generator  # Import the Generator class
+from logic.GridPool import GridPool  # Import the GridPool class
+from logic.Solver import Solver  # Import the Solver class
+from logic.SolveCache import SolveCache  # Import the SolveCache class
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks')  # Corpora and baselines
+CORPORA = ('easy', 'minimal17', 'hardest')  # Bundled puzzle files, benchmarks/<name>.txt
+ENGINES = ('bitmask', 'dlx')  # Engines run on every corpus
+REFERENCE_CORPORA = ('easy',)  # The backtracking reference mode is too slow for the other corpora
+SEED = 1234  # Random seed for the generation benchmarks
+# Generated large-board corpora (size, difficulty, puzzles); harder levels take minutes per puzzle on 25x25
+LARGE_CORPORA = ((16, 'easy', 3), (16, 'medium', 3), (25, 'easy', 2))
+
+
+def load_corpus(name):
+    """
+    Load a bundled corpus.
+    :param name: The corpus name
+    :return: List of boards (2D lists)
+    """
+    with open(os.path.join(BENCH_DIR, f"{name}.txt")) as corpus:
+        return [Generator.decode(line) for line in corpus if line.strip() and not line.startswith('#')]
+
+
+def solve_all(mode, puzzles):
+    """
+    Build an operation that solves every puzzle of a corpus.
+    :return: Callable returning its metrics
+    """
+    def run():
+        solver = Solver(mode, collect_stats=True)
+        for puzzle in puzzles:
+            solver.solve([row[:] for row in puzzle])
+        return {'nodes': solver.totals.nodes}
+    return run
+
+
+def count_all(mode, puzzles):
+    """
+    Build an operation that counts the solutions (capped at 2) of every puzzle of a corpus.
+    :return: Callable returning its metrics
+    """
+    def run():
+        solver = Solver(mode, collect_stats=True)
+        for puzzle in puzzles:
+            solver.count_solutions([row[:] for row in puzzle])
+        return {'nodes': solver.totals.nodes}
+    return run
+
+
+def symmetric_copies(puzzles, count):
+    """
+    Make copies of puzzles with shuffled bands, stacks, rows, columns and digits, some of them transposed.
+    :param puzzles: List of 9x9 boards
+    :param count: Copies per puzzle
+    :return: List of boards, in shuffled order
+    """
+    rng = random.Random(SEED)  # Same copies on every run
+    copies = []
+    for puzzle in puzzles:
+        for _ in range(count):
+            rows = [band * 3 + row for band in rng.sample(range(3), 3) for row in rng.sample(range(3), 3)]
+            cols = [stack * 3 + col for stack in rng.sample(range(3), 3) for col in rng.sample(range(3), 3)]
+            labels = [0] + rng.sample(range(1, 10), 9)
+            copy = [[labels[puzzle[row][col]] for col in cols] for row in rows]
+            copies.append([list(line) for line in zip(*copy)] if rng.random() < 0.5 else copy)
+    rng.shuffle(copies)
+    return copies
+
+
+def check_unique_all(puzzles, cache_size):
+    """
+    Build an operation that solves every puzzle and checks that its solution is unique.
+    :param cache_size: Capacity of the SolveCache, 0 for no cache
+    :return: Callable returning its metrics
+    """
+    def run():
+        solver = Solver(collect_stats=True, cache=SolveCache(cache_size) if cache_size else None)
+        for puzzle in puzzles:
+            solver.solve([row[:] for row in puzzle])
+            solver.has_unique_solution(puzzle)
+        return {'nodes': solver.totals.nodes}
+    return run
+
+
+def fill_grids(count):
+    """
+    Build an operation that fills count boards with Board.fill_grid.
+    :return: Callable returning its metrics
+    """
+    def run():
+        for _ in range(count):
+            Board().fill_grid()
+        return {}
+    return run
+
+
+def solved_grids(mode, count):
+    """
+    Build an operation that builds count solved grids with a Generator in the given mode.
+    :return: Callable returning its metrics
+    """
+    def run():
+        generator = Generator(mode=mode)
+        for _ in range(count):
+            generator.solved_grid()
+        return {}
+    return run
+
+
+def large_puzzles(size, difficulty, count):
+    """
+    Generate the puzzles of a large-board corpus, the same ones on every call.
+    :return: List of boards (2D lists)
+    """
+    random.seed(SEED)
+    GridPool.reset_shared()
+    generator = Generator(size=size)
+    return [generator.generate(difficulty) for _ in range(count)]
+
+
+def generate_all(size, difficulty, count):
+    """
+    Build an operation that generates count puzzles of a difficulty with the engine Solver.for_size picks.
+    :return: Callable returning its metrics
+    """
+    def run():
+        generator = Generator(size=size)
+        checks = 0
+        for _ in range(count):
+            generator.generate(difficulty)
+            checks += generator.uniqueness_checks
+        return {'uniqueness_checks': checks}
+    return run
+
+
+def remove_numbers(count, clues):
+    """
+    Build an operation that runs Board.remove_numbers with uniqueness checks on count filled boards.
+    :return: Callable returning its metrics
+    """
+    def run():
+        checks = 0
+        for _ in range(count):
+            board = Board()
+            board.fill_grid()
+            board.remove_numbers(81 - clues)
+            checks += board.uniqueness_checks
+        return {'uniqueness_checks': checks}
+    return run
+
+
+def board_snapshots(count):
+    """
+    Build an operation that keeps count boards alive and snapshots and restores each of them.
+    Peak memory of this operation tracks the per-board footprint.
+    :return: Callable returning its metrics
+    """
+    def run():
+        board = Board()
+        board.fill_grid()
+        board.remove_numbers(81 - 28, unique=False)
+        boards = []
+        for _ in range(count):
+            copy = Board()
+            copy.restore(board.snapshot())
+            boards.append(copy)
+        return {}
+    return run
+
+
+def replay_session(harness, frames):
+    """
+    Build an operation that replays a UI session without a window.
+    :param harness: The ReplayHarness
+    :param frames: The session's input frames
+    :return: Callable returning its metrics
+    """
+    def run():
+        return harness.run(frames)
+    return run
+
+
+def ui_operations(logs=()):
+    """
+    List the UI replay operations: the scripted session and every recorded session given.
+    :param logs: Paths of sessions recorded with main.py --record
+    :return: List of (name, callable) tuples, empty when Pygame is not installed
+    """
+    try:
+        from ui.ReplayHarness import ReplayHarness  # Pygame is only needed for the UI operations
+    except ImportError:
+        return []
+    harness = ReplayHarness()
+    ops = [("ui/replay/scripted", replay_session(harness, harness.scripted()))]
+    for path in logs:
+        recorded, frames = ReplayHarness.from_log(path)
+        ops.append((f"ui/replay/{os.path.splitext(os.path.basename(path))[0]}", replay_session(recorded, frames)))
+    return ops
+
+
+def operations(logs=()):
+    """
+    List every benchmark operation.
+    :param logs: Paths of recorded UI sessions to replay (default is none)
+    :return: List of (name, callable) tuples
+    """
+    ops = []
+    corpora = {name: load_corpus(name) for name in CORPORA}
+    for name, puzzles in corpora.items():
+        for mode in ENGINES:
+            ops.append((f"solve/{name}/{mode}", solve_all(mode, puzzles)))
+            ops.append((f"count_solutions/{name}/{mode}", count_all(mode, puzzles)))
+    for name in REFERENCE_CORPORA:
+        ops.append((f"solve/{name}/backtrack", solve_all('backtrack', corpora[name])))
+    for size, difficulty, count in LARGE_CORPORA:
+        puzzles = large_puzzles(size, difficulty, count)
+        for mode in ENGINES:
+            ops.append((f"solve/{size}x{size}-{difficulty}/{mode}", solve_all(mode, puzzles)))
+            ops.append((f"count_solutions/{size}x{size}-{difficulty}/{mode}", count_all(mode, puzzles)))
+        ops.append((f"generate/{size}x{size}-{difficulty}/x{count}", generate_all(size, difficulty, count)))
+    copies = symmetric_copies(corpora['hardest'], 4)
+    ops.append(("unique/hardest-copies/bitmask", check_unique_all(copies, 0)))
+    ops.append(("unique/hardest-copies/cached", check_unique_all(copies, 256)))
+    ops.append(("fill_grid/x20", fill_grids(20)))
+    ops.append(("solved_grid/search/x20", solved_grids('search', 20)))
+    ops.append(("solved_grid/transform/x1000", solved_grids('transform', 1000)))
+    ops.append(("remove_numbers/28-clues/x10", remove_numbers(10, 28)))
+    ops.append(("board_snapshots/x1000", board_snapshots(1000)))
+    return ops + ui_operations(logs)
+
+
+def measure(run, repeat):
+    """
+    Time an operation (best of repeat runs), then run it once more under tracemalloc for peak memory.
+    Timings the operation reports itself, the '*_time' metrics, are also the best of the runs.
+    The random module is reseeded and the shared grid pools are dropped before every run so the work is identical.
+    :param run: The operation
+    :param repeat: Number of timed runs
+    :return: Dictionary of metrics
+    """
+    best = float('inf')
+    timings = {}  # Best value of each '*_time' metric
+    for _ in range(repeat):
+        random.seed(SEED)
+        GridPool.reset_shared()
+        started = time.perf_counter()
+        metrics = run()
+        best = min(best, time.perf_counter() - started)
+        for metric, value in metrics.items():
+            if metric.endswith('_time'):
+                timings[metric] = min(timings.get(metric, value), value)
+    metrics.update(timings)
+    random.seed(SEED)
+    GridPool.reset_shared()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'time': best, 'peak_memory': peak, **metrics}
+
+
+def compare(baseline, results, threshold, min_time_delta):
+    """
+    Find the metrics that regressed against a baseline.
+    :param baseline: Baseline results, {operation: {metric: value}}
+    :param results: Current results in the same shape
+    :param threshold: Allowed relative increase, e.g. 0.25 for 25%
+    :param min_time_delta: Increases of 'time' and '*_time' metrics below this many seconds are ignored as noise
+    :return: List of (operation, metric, baseline value, current value) tuples
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base is None:  # New operation or metric
+                continue
+            if (metric == 'time' or metric.endswith('_time')) and value - base < min_time_delta:
+                continue
+            if value > base * (1 + threshold):
+                regressions.append((name, metric, base, value))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Run the benchmarks, print a report and optionally save or compare against a JSON baseline.
+    Exits with status 1 when a compared metric regresses beyond the threshold.
+    :param argv: Command line arguments (default is sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Sudoku solver, generator and UI.")
+    parser.add_argument('--replay', metavar='LOG', nargs='*', default=(),
+                        help="also replay UI sessions recorded with main.py --record")
+    parser.add_argument('--only', help="run only operations matching this glob, e.g. 'solve/hardest/*'")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per operation (best is kept)")
+    parser.add_argument('--save', metavar='FILE', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE', help="compare against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed relative regression (default 0.25)")
+    parser.add_argument('--min-time-delta', type=float, default=0.002,
+                        help="ignore time regressions smaller than this many seconds (default 0.002)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'operation':<34}{'time ms':>12}{'nodes':>12}{'peak KB':>12}")
+    for name, run in operations(args.replay):
+        if args.only and not fnmatch.fnmatch(name, args.only):
+            continue
+        metrics = measure(run, args.repeat)
+        results[name] = metrics
+        nodes = metrics.get('nodes', metrics.get('uniqueness_checks', metrics.get('frames', '')))
+        print(f"{name:<34}{metrics['time'] * 1000:>12.2f}{nodes:>12}{metrics['peak_memory'] / 1024:>12.1f}")
+
+    if args.save:
+        with open(args.save, 'w') as out:
+            json.dump({'python': platform.python_version(), 'results': results}, out, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare(baseline, results, args.threshold, args.min_time_delta)
+        for name, metric, base, value in regressions:
+            print(f"REGRESSION {name} {metric}: {base:.6g} -> {value:.6g} (+{(value / base - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+import argparse  # Import the argparse module
+import os  # Import the os module
+import random  # Import the random module
+import sys  # Import the sys module
+import time  # Import the time module
+from multiprocessing import Pool  # Import the process Pool
+
+from logic.Generator import Generator, CLUE_RANGES  # Import the Generator class and difficulty table
+from logic.PuzzleBank import PuzzleBank  # Import the PuzzleBank class
+from logic.SolverStats import SolverStats  # Import the SolverStats class
+
+
+def seed_worker():
+    """
+    Reseed the random module in each worker so forked processes do not generate identical puzzles.
+    """
+    random.seed()  # Seed from the operating system
+
+
+def generate_chunk(task):
+    """
+    Generate a chunk of puzzles in a worker process.
+    :param task: Tuple (difficulty, count, graded, stats)
+    :return: Tuple (difficulty, list of puzzles encoded as 81-character strings, list of their encoded solutions,
+             solver stats dictionary or None)
+    """
+    difficulty, count, graded, stats = task
+    generator = Generator(collect_stats=stats)  # One generator per chunk
+    puzzles = []
+    solutions = []
+    for _ in range(count):
+        puzzles.append(Generator.encode(generator.generate(difficulty, graded)))
+        solutions.append(Generator.encode(generator.last_solution))  # Kept for banks that store solutions
+    return difficulty, puzzles, solutions, generator.stats.as_dict() if stats else None
+
+
+def chunk_tasks(difficulties, count, chunk_size, graded=False, stats=False):
+    """
+    Split the requested number of puzzles into worker tasks.
+    :param difficulties: The difficulty levels
+    :param count: Number of puzzles per difficulty
+    :param chunk_size: Number of puzzles per task
+    :param graded: Whether puzzles must match their difficulty's logical grade (default is False)
+    :param stats: Whether workers collect solver statistics (default is False)
+    :return: Generator of (difficulty, count, graded, stats) tuples
+    """
+    for difficulty in difficulties:
+        for start in range(0, count, chunk_size):
+            yield difficulty, min(chunk_size, count - start), graded, stats
+
+
+def merge_stats(chunks, totals):
+    """
+    Add the solver statistics of each finished chunk to the totals.
+    :param chunks: Iterable of (difficulty, puzzles, solutions, stats) tuples
+    :param totals: SolverStats collecting the totals
+    :return: Generator of (difficulty, puzzles, solutions) tuples
+    """
+    for difficulty, chunk, solutions, stats in chunks:
+        if stats is not None:
+            totals.merge(stats)
+        yield difficulty, chunk, solutions
+
+
+def verify_chunks(chunks, validator, rejected):
+    """
+    Drop puzzles that repeat a digit in a row, column or box, checking each chunk in one vectorized pass.
+    :param chunks: Iterable of (difficulty, puzzles, solutions) tuples
+    :param validator: The BatchValidator class
+    :param rejected: List collecting the rejected puzzles
+    :return: Generator of (difficulty, puzzles, solutions) tuples
+    """
+    for difficulty, chunk, solutions in chunks:
+        conflicted = validator.conflicts(validator.from_strings(chunk)).any(axis=(1, 2))
+        rejected.extend(puzzle for puzzle, bad in zip(chunk, conflicted) if bad)
+        yield (difficulty, [puzzle for puzzle, bad in zip(chunk, conflicted) if not bad],
+               [solution for solution, bad in zip(solutions, conflicted) if not bad])
+
+
+def write_text(chunks, difficulties, output, total, started):
+    """
+    Stream finished chunks to text files, one encoded puzzle per line and one file per difficulty.
+    :param chunks: Iterable of (difficulty, puzzles, solutions) tuples
+    :param difficulties: The difficulty levels
+    :param output: Output file for a single difficulty, or None for puzzles_<difficulty>.txt
+    :param total: Total number of puzzles
+    :param started: Start time from time.perf_counter()
+    :return: Number of puzzles written
+    """
+    files = {difficulty: open(output or f"puzzles_{difficulty}.txt", 'w') for difficulty in difficulties}
+    done = 0
+    try:
+        for difficulty, chunk, _ in chunks:
+            files[difficulty].write('\n'.join(chunk) + '\n')  # Stream each finished chunk to disk
+            done += len(chunk)
+            report_progress(done, total, started)
+    finally:
+        for out in files.values():
+            out.close()
+    return done
+
+
+def write_bank(chunks, output, total, started):
+    """
+    Collect finished chunks into a puzzle bank file, storing each puzzle with its solution.
+    :param chunks: Iterable of (difficulty, puzzles, solutions) tuples
+    :param output: Path of the bank file
+    :param total: Total number of puzzles
+    :param started: Start time from time.perf_counter()
+    :return: Number of puzzles written
+    """
+    def records():
+        done = 0
+        for difficulty, chunk, solutions in chunks:
+            for puzzle, solution in zip(chunk, solutions):
+                yield difficulty, Generator.decode(puzzle), Generator.decode(solution)
+            done += len(chunk)
+            report_progress(done, total, started)
+
+    return sum(PuzzleBank.write(output, records()).values())
+
+
+def report_progress(done, total, started):
+    """
+    Print throughput and estimated time remaining to stderr.
+    :param done: Number of puzzles written so far
+    :param total: Total number of puzzles
+    :param started: Start time from time.perf_counter()
+    """
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed if elapsed > 0 else 0.0
+    eta = (total - done) / rate if rate > 0 else float('inf')
+    sys.stderr.write(f"\r{done}/{total} puzzles  {rate:.1f} puzzles/s  ETA {eta:.0f}s ")
+    sys.stderr.flush()
+
+
+def main(argv=None):
+    """
+    Generate puzzles in parallel and stream them to text files or collect them into a puzzle bank.
+    :param argv: Command line arguments (default is sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Generate Sudoku puzzles in batch.")
+    parser.add_argument('--count', type=int, default=1000, help="number of puzzles per difficulty")
+    parser.add_argument('--difficulty', nargs='+', choices=sorted(CLUE_RANGES), default=['medium'],
+                        help="difficulty levels")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument('--chunk-size', type=int, default=100, help="puzzles per worker task")
+    parser.add_argument('--format', choices=('text', 'bank'), default='text',
+                        help="one puzzle per line, or a memory-mapped puzzle bank")
+    parser.add_argument('--output', help="output file (default is puzzles_<difficulty>.txt or puzzles.bank)")
+    parser.add_argument('--graded', action='store_true', help="reject puzzles until their logical grade matches; "
+                                                                 "graded medium and hard keep fewer clues than CLUE_RANGES")
+    parser.add_argument('--verify', action='store_true', help="re-check puzzles with the NumPy batch validator")
+    parser.add_argument('--stats', action='store_true', help="collect and print solver search statistics")
+    args = parser.parse_args(argv)
+    if args.verify:
+        try:
+            from logic.BatchValidator import BatchValidator  # NumPy is only needed for --verify
+        except ImportError:
+            parser.error("--verify requires numpy")
+    difficulties = list(dict.fromkeys(args.difficulty))  # Drop repeated difficulties
+    if args.format == 'text' and args.output and len(difficulties) > 1:
+        parser.error("--output with several difficulties requires --format bank")
+
+    total = args.count * len(difficulties)
+    started = time.perf_counter()
+    totals = SolverStats()  # Solver counters summed over every worker
+    with Pool(args.workers, initializer=seed_worker) as pool:
+        tasks = chunk_tasks(difficulties, args.count, args.chunk_size, args.graded, args.stats)
+        chunks = merge_stats(pool.imap_unordered(generate_chunk, tasks), totals)
+        rejected = []  # Puzzles dropped by the post-check
+        if args.verify:
+            chunks = verify_chunks(chunks, BatchValidator, rejected)
+        if args.format == 'bank':
+            output = args.output or 'puzzles.bank'
+            done = write_bank(chunks, output, total, started)
+        else:
+            output = args.output or ', '.join(f"puzzles_{difficulty}.txt" for difficulty in difficulties)
+            done = write_text(chunks, difficulties, args.output, total, started)
+    sys.stderr.write(f"\nWrote {done} puzzles to {output} in {time.perf_counter() - started:.1f}s\n")
+    if rejected:
+        sys.stderr.write(f"Dropped {len(rejected)} puzzles that failed verification\n")
+    if args.stats:
+        sys.stderr.write(f"Solver: {totals.calls} calls, {totals.nodes} nodes, {totals.backtracks} backtracks, "
+                         f"max depth {totals.max_depth}, {totals.wall_time:.2f}s in search\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,12 +12,13 @@ class BoardInterface:
         """
         raise NotImplementedError("This method must be overridden by subclasses")
 
-    def remove_numbers(self, difficulty):
+    def remove_numbers(self, difficulty, unique=True):
         """
         Remove numbers from the board based on the difficulty level to create the puzzle.
 
         Args:
             difficulty (int): The number of cells to remove based on difficulty.
+            unique (bool): Whether every removal must keep the puzzle's solution unique.
         """
         raise NotImplementedError("This method must be overridden by subclasses")
 
@@ -37,4 +38,156 @@ class BoardInterface:
         Args:
             values (list of list of int): 2D list representing the values to set on the board.
         """
-        raise NotImplementedError("This method must be overridden by subclasses")
\ No newline at end of file
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def load_puzzle(self, puzzle, solution=None):
+        """
+        Load a puzzle onto the board, marking the given cells as fixed.
+
+        Args:
+            puzzle (list of list of int): 2D list representing the puzzle, 0 for empty cells.
+            solution (list of list of int): 2D list representing its solution, or None if unknown.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def load_from_bank(self, bank, difficulty):
+        """
+        Load a random puzzle of the given difficulty from a puzzle bank.
+
+        Args:
+            bank (PuzzleBank): An open puzzle bank.
+            difficulty (str): The difficulty level (e.g., 'easy', 'medium', 'hard').
+
+        Returns:
+            bool: True if a puzzle was loaded, False if the bank has none for this difficulty.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def get(self, row, col):
+        """
+        Get the value of a single cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            int: The value of the cell, 0 if it is empty.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_fixed(self, row, col):
+        """
+        Check if a cell is a clue of the puzzle.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            bool: True if the cell is fixed, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def clues(self):
+        """
+        Get the puzzle without the player's entries.
+
+        Returns:
+            list of list of int: 2D list of the fixed cells, 0 for every other cell.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_wrong(self, row, col):
+        """
+        Check an entry against the stored solution.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            bool: True if the cell holds a value that differs from the solution, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def set_fixed(self, row, col, fixed):
+        """
+        Mark a cell as a clue or as a player cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            fixed (bool): True to make the cell a clue.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def snapshot(self):
+        """
+        Capture the state of the board.
+
+        Returns:
+            tuple: An opaque snapshot to pass to restore().
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def restore(self, snapshot):
+        """
+        Restore a state captured by snapshot().
+
+        Args:
+            snapshot (tuple): A snapshot of a board of the same size.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def view(self):
+        """
+        Get a read-only view of the cell values without copying them.
+
+        Returns:
+            memoryview: size * size unsigned bytes in row-major order.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def set_cell(self, row, col, value):
+        """
+        Set the value of a single cell and keep the board counters up to date.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The value to set, 0 to clear the cell.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_move_legal(self, row, col, value):
+        """
+        Check if a value can be placed in a cell without repeating a digit in its row, column or box.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The value to check.
+
+        Returns:
+            bool: True if the move is legal, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_full(self):
+        """
+        Check if every cell of the board is filled.
+
+        Returns:
+            bool: True if the board is full, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_solved(self):
+        """
+        Check if the board is full and free of repeated digits.
+
+        Returns:
+            bool: True if the board is solved, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
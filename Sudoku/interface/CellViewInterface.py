@@ -1,21 +1,31 @@
-class CellInterface:
-    def set_value(self, value):
+class CellViewInterface:
+    def set_value(self, value, color):
         """
         Set the value of the cell and update its display.
 
         Args:
             value (int): The value to set.
+            color (tuple): The RGB color of the value text.
         """
         raise NotImplementedError("This method must be overridden by subclasses")
 
-    def draw(self, surface, font, colors):
+    def set_color(self, color):
+        """
+        Set the color of the cell's value.
+
+        Args:
+            color (tuple): The RGB color of the value text.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def draw(self, surface, font, glyphs=None):
         """
         Draw the cell on the given surface.
 
         Args:
             surface (pygame.Surface): The surface where the cell will be drawn.
             font (pygame.font.Font): The font to be used for drawing the cell value.
-            colors (dict): Dictionary containing colors for drawing the cell.
+            glyphs (GlyphCache): Optional cache of pre-rendered values.
         """
         raise NotImplementedError("This method must be overridden by subclasses")
 
@@ -0,0 +1,25 @@
+class ConflictCheckerInterface:
+
+    def conflicts(self, board):
+        """
+        Find every cell whose digit is repeated in its row, column or box.
+
+        Args:
+            board (list of list of int or bytes): 2D list or flat row-major sequence of the cell values, 0 for empty cells.
+
+        Returns:
+            dict: Maps (row, col) of each conflicting cell to its list of (kind, index) units, kind being 'row', 'col' or 'box'.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_solution(self, board):
+        """
+        Check if every cell is filled and no digit is repeated in a row, column or box.
+
+        Args:
+            board (list of list of int or bytes): 2D list or flat row-major sequence of the cell values, 0 for empty cells.
+
+        Returns:
+            bool: True if the board is a valid solution, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
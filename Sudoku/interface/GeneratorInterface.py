@@ -0,0 +1,45 @@
+class GeneratorInterface:
+
+    def solved_grid(self):
+        """
+        Build a random solved Sudoku grid.
+
+        Returns:
+            list of list of int: 2D list representing a solved Sudoku grid.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def refresh_pool(self, count):
+        """
+        Add freshly searched grids to the pool of solved grids used by transformation-based generation.
+
+        Args:
+            count (int): The number of grids to search.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def generate(self, difficulty, graded=False):
+        """
+        Generate a puzzle with a unique solution for a difficulty level.
+
+        Args:
+            difficulty (str): The difficulty level (e.g., 'easy', 'medium', 'hard').
+            graded (bool): Whether the puzzle's logical grade must match the difficulty.
+
+        Returns:
+            list of list of int: 2D list representing the puzzle, 0 for empty cells.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def remove_clues(self, solution, clues):
+        """
+        Remove clues from a solved grid while keeping the puzzle's solution unique.
+
+        Args:
+            solution (list of list of int): 2D list representing a solved Sudoku grid.
+            clues (int): The number of clues the puzzle should keep.
+
+        Returns:
+            list of list of int: 2D list representing the puzzle, 0 for removed clues.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
@@ -0,0 +1,38 @@
+class GridPoolInterface:
+
+    def add(self, grid):
+        """
+        Add a solved grid to the pool, dropping the oldest one when the pool is full.
+
+        Args:
+            grid (list of list of int): 2D list representing a solved Sudoku grid.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def refresh(self, build, count):
+        """
+        Add freshly searched grids to the pool.
+
+        Args:
+            build (callable): Function returning a new solved grid as a 2D list.
+            count (int): The number of grids to add.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def refresh_due(self):
+        """
+        Check whether enough grids were drawn since the last refresh that a new grid should be searched.
+
+        Returns:
+            bool: True if the caller should refresh the pool, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def draw(self):
+        """
+        Build a new solved grid by applying a random symmetry to a grid of the pool.
+
+        Returns:
+            list of list of int: 2D list representing a solved Sudoku grid.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
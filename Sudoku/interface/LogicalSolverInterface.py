@@ -0,0 +1,37 @@
+class LogicalSolverInterface:
+
+    def solve(self, board):
+        """
+        Solve the Sudoku board in place using only human solving techniques.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+
+        Returns:
+            bool: True if the techniques solved the board, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def next_step(self, board):
+        """
+        Find the next cell that the techniques can fill, without changing the board.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+
+        Returns:
+            dict or None: The 'row', 'col', 'value', 'technique' and 'reason' of the deduction, or None if there is none.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def grade(self, board):
+        """
+        Grade a puzzle by the hardest technique it needs and the number of steps.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+
+        Returns:
+            dict: The grading result, including the 'difficulty' level (e.g., 'easy', 'medium', 'hard').
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
@@ -0,0 +1,63 @@
+class MoveLogInterface:
+
+    def reset(self):
+        """
+        Clear the history and make the current board the starting point.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def record(self, row, col, value):
+        """
+        Write a value into a cell and log the move, dropping any moves that were undone.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The value to write, 0 to clear the cell.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def undo(self):
+        """
+        Take back the last move.
+
+        Returns:
+            tuple or None: (row, col, value) of the cell after the undo, or None if there is nothing to undo.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def redo(self):
+        """
+        Play again the last move that was undone.
+
+        Returns:
+            tuple or None: (row, col, value) of the cell after the redo, or None if there is nothing to redo.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def goto(self, position):
+        """
+        Move the board to any point of the history.
+
+        Args:
+            position (int): The number of moves applied, from 0 (the starting point) to the length of the log.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def can_undo(self):
+        """
+        Check if there is a move to undo.
+
+        Returns:
+            bool: True if undo() would change the board, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def can_redo(self):
+        """
+        Check if there is a move to redo.
+
+        Returns:
+            bool: True if redo() would change the board, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
@@ -0,0 +1,69 @@
+class PuzzleBankInterface:
+
+    def count(self, difficulty):
+        """
+        Get the number of puzzles stored for a difficulty level.
+
+        Args:
+            difficulty (str): The difficulty level (e.g., 'easy', 'medium', 'hard').
+
+        Returns:
+            int: The number of puzzles, 0 for unknown difficulties.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def get(self, difficulty, index):
+        """
+        Read one puzzle of a difficulty level.
+
+        Args:
+            difficulty (str): The difficulty level.
+            index (int): The position of the puzzle within its difficulty.
+
+        Returns:
+            list of list of int: 2D list representing the puzzle, 0 for empty cells.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def get_solution(self, difficulty, index):
+        """
+        Read the solution stored with one puzzle of a difficulty level.
+
+        Args:
+            difficulty (str): The difficulty level.
+            index (int): The position of the puzzle within its difficulty.
+
+        Returns:
+            list of list of int or None: 2D list representing the solution, or None if the bank does not store it.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def random_puzzle(self, difficulty):
+        """
+        Read a random puzzle of a difficulty level.
+
+        Args:
+            difficulty (str): The difficulty level.
+
+        Returns:
+            list of list of int or None: 2D list representing the puzzle, or None if there are no puzzles.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def random_entry(self, difficulty):
+        """
+        Read a random puzzle of a difficulty level together with its solution.
+
+        Args:
+            difficulty (str): The difficulty level.
+
+        Returns:
+            tuple or None: (puzzle, solution) 2D lists, solution being None if not stored, or None if there are no puzzles.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def close(self):
+        """
+        Release the memory map and the underlying file.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
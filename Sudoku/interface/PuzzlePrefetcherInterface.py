@@ -0,0 +1,46 @@
+class PuzzlePrefetcherInterface:
+
+    def start(self):
+        """
+        Start the background worker that keeps the puzzle queues filled.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def get(self, difficulty):
+        """
+        Take a ready puzzle from the queue, generating one synchronously if the queue is empty.
+
+        Args:
+            difficulty (str): The difficulty level (e.g., 'easy', 'medium', 'hard').
+
+        Returns:
+            list of list of int: 2D list representing the puzzle, 0 for empty cells.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def get_with_solution(self, difficulty):
+        """
+        Take a ready puzzle and its solution from the queue, generating them synchronously if the queue is empty.
+
+        Args:
+            difficulty (str): The difficulty level (e.g., 'easy', 'medium', 'hard').
+
+        Returns:
+            tuple: (puzzle, solution) 2D lists.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def stats(self):
+        """
+        Get the queue hit and miss counters.
+
+        Returns:
+            dict: The number of hits, misses and puzzles currently queued per difficulty.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def stop(self):
+        """
+        Stop the background worker.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
@@ -0,0 +1,85 @@
+class ServiceClientInterface:
+
+    def request(self, op, **fields):
+        """
+        Send one request to the service and wait for its response.
+
+        Args:
+            op (str): The operation, 'solve', 'count', 'validate', 'generate' or 'stats'.
+            **fields: The operation's arguments.
+
+        Returns:
+            dict: The response.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def many(self, requests):
+        """
+        Send several requests at once and wait for every response.
+
+        Args:
+            requests (list of dict): The requests, each with an 'op' key.
+
+        Returns:
+            list of dict: The responses, in request order.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def solve(self, puzzle):
+        """
+        Solve a puzzle.
+
+        Args:
+            puzzle (list of list of int or str): The puzzle, 0 for empty cells.
+
+        Returns:
+            list of list of int or None: The solution, or None if the puzzle has no solution.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def count(self, puzzle, limit=2):
+        """
+        Count the solutions of a puzzle.
+
+        Args:
+            puzzle (list of list of int or str): The puzzle, 0 for empty cells.
+            limit (int): The number of solutions after which the search stops.
+
+        Returns:
+            int: The number of solutions, at most limit.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def validate(self, board):
+        """
+        Find the cells whose digit is repeated in a row, column or box.
+
+        Args:
+            board (list of list of int or str): The board, 0 for empty cells.
+
+        Returns:
+            list of tuple: (row, col) of each conflicting cell.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def generate(self, difficulty, size=9):
+        """
+        Generate a puzzle with a unique solution.
+
+        Args:
+            difficulty (str): The difficulty level (e.g., 'easy', 'medium', 'hard').
+            size (int): The board size.
+
+        Returns:
+            tuple: The puzzle and its solution as 2D lists.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def stats(self):
+        """
+        Get the service counters.
+
+        Returns:
+            dict: The queue depth, latency percentiles and throughput.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
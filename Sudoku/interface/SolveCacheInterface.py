@@ -0,0 +1,38 @@
+class SolveCacheInterface:
+
+    def get(self, key):
+        """
+        Look up the entry of a canonical grid and mark it as recently used.
+
+        Args:
+            key (bytes): The canonical grid.
+
+        Returns:
+            dict or None: The entry, or None on a miss.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def put(self, key, entry):
+        """
+        Store the entry of a canonical grid, evicting the least recently used entry when full.
+
+        Args:
+            key (bytes): The canonical grid.
+            entry (dict): The entry to store.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: The hits, misses, evictions, size, capacity and hit rate.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def clear(self):
+        """
+        Drop every entry and reset the counters.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
@@ -0,0 +1,39 @@
+class SolverEngineInterface:
+
+    def solve(self, board):
+        """
+        Solve the Sudoku board in place.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board, 0 for empty cells.
+
+        Returns:
+            bool: True if the board was solved, False if it has no solution.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def count_solutions(self, board, limit=2):
+        """
+        Count the solutions of the Sudoku board, stopping once the limit is reached.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board, 0 for empty cells.
+            limit (int): The number of solutions after which the search stops.
+
+        Returns:
+            int: The number of solutions found, never more than the limit.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def find_solutions(self, board, limit):
+        """
+        Collect solutions of the Sudoku board without modifying it, stopping once the limit is reached.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board, 0 for empty cells.
+            limit (int): The maximum number of solutions to collect.
+
+        Returns:
+            list of list of int: The solutions found, each a flat list of 81 values in row-major order.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
@@ -37,3 +37,76 @@ class SolverInterface:
             bool: True if the board is a valid solution, False otherwise.
         """
         raise NotImplementedError("This method must be overridden by subclasses")
+
+    def set_mode(self, mode):
+        """
+        Select the search engine used to solve and count solutions.
+
+        Args:
+            mode (str): The name of the search engine (e.g., 'bitmask', 'dlx', 'backtrack').
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def solve(self, board):
+        """
+        Solve the Sudoku board in place.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+
+        Returns:
+            bool: True if the board was solved, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def count_solutions(self, board, limit=2):
+        """
+        Count the solutions of the Sudoku board, stopping once the limit is reached.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+            limit (int): The number of solutions after which the search stops.
+
+        Returns:
+            int: The number of solutions found, never more than the limit.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def find_solutions(self, board, limit=2):
+        """
+        Collect solutions of the Sudoku board without modifying it, stopping once the limit is reached.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+            limit (int): The maximum number of solutions to collect.
+
+        Returns:
+            list of list of int: The solutions found, each a flat list of 81 values in row-major order.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def step_solver(self, board, limit=1, cancel=None):
+        """
+        Create a resumable solver that searches in slices instead of one blocking call.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+            limit (int): The number of solutions after which the search stops.
+            cancel (threading.Event): The cancellation token, or None to create one.
+
+        Returns:
+            StepSolver: The solver, not started yet.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def has_unique_solution(self, board):
+        """
+        Check if the Sudoku board has exactly one solution.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board.
+
+        Returns:
+            bool: True if the board has a unique solution, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
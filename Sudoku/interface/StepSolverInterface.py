@@ -0,0 +1,60 @@
+class StepSolverInterface:
+
+    def step(self, max_nodes=None, max_time=None):
+        """
+        Continue the search until it finishes, is cancelled or a budget runs out.
+
+        Args:
+            max_nodes (int): The number of search nodes to visit before pausing, None for no limit.
+            max_time (float): The number of seconds to run before pausing, None for no limit.
+
+        Returns:
+            str: The search status ('running', 'solved', 'no-solution' or 'cancelled').
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def iterate(self, max_nodes=None, max_time=None):
+        """
+        Run the search in slices, yielding progress after each one until the search stops.
+
+        Args:
+            max_nodes (int): The number of search nodes per slice, None for no limit.
+            max_time (float): The number of seconds per slice, None for no limit.
+
+        Returns:
+            generator of dict: The progress after each slice.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def cancel(self):
+        """
+        Cancel the search; the next step returns 'cancelled'.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def progress(self):
+        """
+        Get the progress of the search.
+
+        Returns:
+            dict: The status, nodes visited, current depth, filled cells, solutions found and seconds spent.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def values(self):
+        """
+        Get the current partial assignment of the search, for example to animate it.
+
+        Returns:
+            list of list of int: 2D list of the cells filled so far, 0 for empty cells.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def solution(self):
+        """
+        Get the first solution found.
+
+        Returns:
+            list of list of int or None: 2D list representing the solution, or None if none was found.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
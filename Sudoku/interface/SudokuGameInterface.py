@@ -20,9 +20,88 @@ class SudokuGameInterface:
         """
         raise NotImplementedError("This method must be overridden by subclasses")
 
-    def solve_game(self):
+    def solve_game(self, collect_stats=False):
         """
         Solve the current state of the Sudoku board.
+
+        Args:
+            collect_stats (bool): Whether to collect search statistics for the solve.
+
+        Returns:
+            SolverStats: The statistics of the solve, or None when not collected.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def start_solve(self, cancel=None):
+        """
+        Start solving the current board without blocking; advance it with step() on the returned solver.
+
+        Args:
+            cancel (threading.Event): The cancellation token, or None to create one.
+
+        Returns:
+            StepSolver: The resumable solver working on a copy of the board.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def finish_solve(self, step_solver):
+        """
+        Copy the solution of a finished resumable solve onto the board.
+
+        Args:
+            step_solver (StepSolver): The solver returned by start_solve.
+
+        Returns:
+            bool: True if a solution was applied, False otherwise.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def undo_move(self):
+        """
+        Take back the last move of the player.
+
+        Returns:
+            tuple or None: (row, col, value) of the cell after the undo, or None if there is nothing to undo.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def redo_move(self):
+        """
+        Play again the last move that was undone.
+
+        Returns:
+            tuple or None: (row, col, value) of the cell after the redo, or None if there is nothing to redo.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def hint(self):
+        """
+        Suggest the next cell to fill and the reason for it.
+
+        Returns:
+            dict or None: The 'row', 'col', 'value', 'technique' and 'reason' of the hint, or None if the board is full.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def is_entry_wrong(self, row, col):
+        """
+        Check an entry against the solution of the puzzle.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            bool: True if the cell holds a wrong value, False if it is empty or right.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def wrong_entries(self):
+        """
+        Find every entry that differs from the solution of the puzzle.
+
+        Returns:
+            list of tuple: (row, col) positions of the wrong entries.
         """
         raise NotImplementedError("This method must be overridden by subclasses")
 
@@ -0,0 +1,39 @@
+class SymmetryInterface:
+
+    def canonical(self, board):
+        """
+        Find the canonical form of a grid under the Sudoku symmetries and the transform that produces it.
+
+        Args:
+            board (list of list of int): 2D list representing the Sudoku board, 0 for empty cells.
+
+        Returns:
+            tuple: (key, transform), key being the canonical grid as bytes.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def to_canonical(self, board, transform):
+        """
+        Apply a transform to a grid.
+
+        Args:
+            board (list of list of int): 2D list representing the grid.
+            transform (tuple): A transform returned by canonical().
+
+        Returns:
+            list of list of int: 2D list representing the transformed grid.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
+
+    def from_canonical(self, cells, transform):
+        """
+        Map a grid in canonical space back through the inverse of a transform.
+
+        Args:
+            cells (list of int or bytes): Flat row-major values of the canonical grid.
+            transform (tuple): A transform returned by canonical().
+
+        Returns:
+            list of list of int: 2D list representing the grid in the original space.
+        """
+        raise NotImplementedError("This method must be overridden by subclasses")
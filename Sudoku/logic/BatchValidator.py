@@ -0,0 +1,71 @@
+import numpy as np  # Import NumPy, an optional dependency used only by the batch tools
+
+DIGITS = np.arange(1, 10, dtype=np.uint8)  # Digit values 1-9
+DIGIT_BITS = (1 << np.arange(1, 10)).astype(np.uint16)  # Bit d set for digit d, as in BitmaskSolver
+FULL_MASK = np.uint16(0b1111111110)  # Bits 1-9 set
+
+
+class BatchValidator:
+    """
+    Vectorized checks over many boards at once. Boards are an (N, 9, 9) uint8 array, 0 for empty cells.
+    """
+
+    @staticmethod
+    def from_strings(lines):
+        """
+        Convert 81-character grid strings into a board array.
+        :param lines: List of grid strings, '0' or '.' for empty cells
+        :return: (N, 9, 9) uint8 array
+        """
+        text = ''.join(line[:81] for line in lines).replace('.', '0').encode('ascii')
+        return (np.frombuffer(text, dtype=np.uint8) - ord('0')).reshape(-1, 9, 9)
+
+    @staticmethod
+    def unit_counts(boards):
+        """
+        Count every digit in every row, column and box.
+        :param boards: (N, 9, 9) uint8 array
+        :return: Tuple of (N, 9, 9) arrays indexed [board, unit, digit - 1] for rows, columns and boxes
+        """
+        onehot = boards[..., None] == DIGITS  # (N, 9, 9, 9): cell holds digit
+        rows = onehot.sum(axis=2, dtype=np.uint8)
+        cols = onehot.sum(axis=1, dtype=np.uint8)
+        boxes = onehot.reshape(-1, 3, 3, 3, 3, 9).sum(axis=(2, 4), dtype=np.uint8).reshape(-1, 9, 9)
+        return rows, cols, boxes
+
+    @staticmethod
+    def conflicts(boards):
+        """
+        Find the cells whose digit is repeated in their row, column or box.
+        :param boards: (N, 9, 9) uint8 array
+        :return: (N, 9, 9) bool array, True for conflicting cells
+        """
+        rows, cols, boxes = BatchValidator.unit_counts(boards)
+        onehot = boards[..., None] == DIGITS
+        boxes = boxes.reshape(-1, 3, 3, 9).repeat(3, axis=1).repeat(3, axis=2)  # Box counts per cell
+        repeated = (rows[:, :, None, :] > 1) | (cols[:, None, :, :] > 1) | (boxes > 1)
+        return (onehot & repeated).any(axis=3)
+
+    @staticmethod
+    def validate(boards):
+        """
+        Check which boards are complete, valid solutions.
+        :param boards: (N, 9, 9) uint8 array
+        :return: (N,) bool array
+        """
+        rows, cols, boxes = BatchValidator.unit_counts(boards)
+        return ((rows == 1).all(axis=(1, 2)) & (cols == 1).all(axis=(1, 2)) & (boxes == 1).all(axis=(1, 2)))
+
+    @staticmethod
+    def candidates(boards):
+        """
+        Compute the candidate digits of every empty cell.
+        :param boards: (N, 9, 9) uint8 array
+        :return: (N, 9, 9) uint16 array of candidate bitmasks (bit d for digit d), 0 for filled cells
+        """
+        rows, cols, boxes = BatchValidator.unit_counts(boards)
+        row_used = ((rows > 0) * DIGIT_BITS).sum(axis=2, dtype=np.uint16)  # (N, 9) digits used per row
+        col_used = ((cols > 0) * DIGIT_BITS).sum(axis=2, dtype=np.uint16)
+        box_used = ((boxes > 0) * DIGIT_BITS).sum(axis=2, dtype=np.uint16).reshape(-1, 3, 3)
+        used = row_used[:, :, None] | col_used[:, None, :] | box_used.repeat(3, axis=1).repeat(3, axis=2)
+        return np.where(boards == 0, ~used & FULL_MASK, 0).astype(np.uint16)
@@ -0,0 +1,221 @@
+from logic.Geometry import Geometry  # Import the Geometry class
+from interface.SolverEngineInterface import SolverEngineInterface  # Import the SolverEngineInterface class
+
+
+class BitmaskSolver(SolverEngineInterface):
+    """
+    Constraint engine that keeps row, column and box candidate bitmasks,
+    fills naked and hidden singles and branches on the most constrained cell (MRV).
+    Works on any board size from Geometry, taken from the number of rows of the board.
+    """
+
+    def __init__(self):
+        """
+        Initialize the BitmaskSolver.
+        """
+        self.stats = None  # SolverStats filled during a call, None when collection is off
+
+    def solve(self, board):
+        """
+        Solve the Sudoku puzzle in place.
+        :param board: 2D list representing the Sudoku board
+        :return: True if the puzzle is solved, False otherwise
+        """
+        try:
+            solutions = self.find_solutions(board, 1)  # Stop at the first solution
+            if not solutions:  # No solution exists
+                return False
+            size = len(board)
+            for row in range(size):  # Copy the solution back onto the board
+                board[row][:] = solutions[0][row * size:row * size + size]
+            return True
+        except Exception as e:
+            print(f"Error solving the board: {e}")
+            return False
+
+    def count_solutions(self, board, limit=2):
+        """
+        Count the number of solutions to the Sudoku puzzle.
+        :param board: 2D list representing the Sudoku board
+        :param limit: Number of solutions after which the search stops
+        :return: Number of solutions, at most limit
+        """
+        try:
+            return len(self.find_solutions(board, limit))
+        except Exception as e:
+            print(f"Error counting solutions: {e}")
+            return 0
+
+    def find_solutions(self, board, limit):
+        """
+        Collect up to limit solutions of the Sudoku puzzle without modifying the board.
+        :param board: 2D list representing the Sudoku board
+        :param limit: Maximum number of solutions to collect
+        :return: List of solutions, each a flat list of size * size values
+        """
+        geometry = Geometry.of(len(board))  # Index tables for this board size
+        cells = [value for row in board for value in row]  # Flatten the board
+        rows = [0] * geometry.size  # Digits used in each row
+        cols = [0] * geometry.size  # Digits used in each column
+        boxes = [0] * geometry.size  # Digits used in each box
+        for i, value in enumerate(cells):  # Register the givens
+            if value:
+                bit = 1 << value
+                r, c, b = geometry.row_of[i], geometry.col_of[i], geometry.box_of[i]
+                if (rows[r] | cols[c] | boxes[b]) & bit:  # The givens already conflict
+                    return []
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+        empties = [i for i in range(geometry.cells) if cells[i] == 0]  # Cells left to fill
+        masks = [0] * geometry.cells  # Candidates of each empty cell from the last propagation pass, 0 once filled
+        solutions = []
+        self._search(geometry, cells, masks, rows, cols, boxes, empties, solutions, limit, 0)
+        return solutions
+
+    def _search(self, geometry, cells, masks, rows, cols, boxes, empties, solutions, limit, depth):
+        """
+        Depth-first search with naked and hidden single propagation and MRV branching.
+        :return: None, solutions are appended to the solutions list
+        """
+        stats = self.stats
+        if stats is not None:  # Only touch the counters when collection is on
+            stats.nodes += 1
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+        trail = []  # Cells filled by propagation at this depth
+        found = self.propagate(geometry, cells, masks, rows, cols, boxes, empties, trail)
+        if found is None:  # Dead end, propagation is already undone
+            if stats is not None:
+                stats.backtracks += 1
+            return
+        best, best_mask = found
+        if best < 0:  # Every cell is filled
+            solutions.append(cells[:])
+            self.undo(geometry, cells, rows, cols, boxes, trail)
+            return
+
+        remaining = [i for i in empties if not cells[i]]  # Shrink the work list for the next depth
+        r, c, b = geometry.row_of[best], geometry.col_of[best], geometry.box_of[best]
+        mask = best_mask
+        while mask:  # Try each candidate of the most constrained cell
+            bit = mask & -mask
+            mask ^= bit
+            cells[best] = bit.bit_length() - 1
+            masks[best] = 0
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            self._search(geometry, cells, masks, rows, cols, boxes, remaining, solutions, limit, depth + 1)
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            cells[best] = 0
+            if len(solutions) >= limit:  # Enough solutions found
+                break
+        self.undo(geometry, cells, rows, cols, boxes, trail)
+
+    @staticmethod
+    def propagate(geometry, cells, masks, rows, cols, boxes, empties, trail):
+        """
+        Place naked and hidden singles until none is left, and find the most constrained empty cell.
+        Shared by the recursive search and StepSolver, so both engines propagate the same way.
+        :param geometry: Geometry of the board
+        :param cells: Flat cell values, changed in place
+        :param masks: Candidates of each empty cell, refreshed for the cells left empty
+        :param rows: Digits used in each row, changed in place
+        :param cols: Digits used in each column, changed in place
+        :param boxes: Digits used in each box, changed in place
+        :param empties: Cells that may still be empty
+        :param trail: List the placed cells are appended to, so undo() can take them back
+        :return: Tuple (cell, candidates) of the most constrained empty cell, (-1, 0) when every cell is filled,
+                 or None on a dead end, with the placements already undone
+        """
+        ROW_OF, COL_OF, BOX_OF = geometry.row_of, geometry.col_of, geometry.box_of
+        full_mask = geometry.full_mask
+        while True:
+            best = -1  # Most constrained cell found in this pass
+            best_mask = 0
+            best_count = geometry.size + 1
+            progress = False
+            for i in empties:
+                if cells[i]:  # Already filled by propagation
+                    continue
+                r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+                mask = full_mask & ~(rows[r] | cols[c] | boxes[b])  # Remaining candidates
+                if not mask:  # Dead end
+                    BitmaskSolver.undo(geometry, cells, rows, cols, boxes, trail)
+                    return None
+                count = mask.bit_count()
+                if count == 1:  # Forced single, place it right away
+                    cells[i] = mask.bit_length() - 1
+                    masks[i] = 0
+                    rows[r] |= mask
+                    cols[c] |= mask
+                    boxes[b] |= mask
+                    trail.append(i)
+                    progress = True
+                else:
+                    masks[i] = mask
+                    if count < best_count:
+                        best, best_mask, best_count = i, mask, count
+            if not progress and best >= 0:  # No naked single left, look for hidden singles
+                progress = BitmaskSolver._hidden_singles(geometry, cells, masks, rows, cols, boxes, trail)
+                if progress is None:  # A digit has no place left in some unit
+                    BitmaskSolver.undo(geometry, cells, rows, cols, boxes, trail)
+                    return None
+            if not progress:  # Nothing more to propagate
+                return best, best_mask
+
+    @staticmethod
+    def _hidden_singles(geometry, cells, masks, rows, cols, boxes, trail):
+        """
+        Place every digit that fits a single empty cell of a row, column or box.
+        Uses the candidates of the propagation pass that just ran; placements only shrink them,
+        so each cell is re-checked before a digit is placed.
+        :return: True if a cell was placed, False if none, None if a digit has no place left in a unit
+        """
+        ROW_OF, COL_OF, BOX_OF = geometry.row_of, geometry.col_of, geometry.box_of
+        full_mask = geometry.full_mask
+        size = geometry.size
+        progress = False
+        for u, unit in enumerate(geometry.units):
+            once = more = 0  # Digits possible in one cell, in several cells
+            for i in unit:
+                mask = masks[i]
+                more |= once & mask
+                once |= mask
+            used = rows[u] if u < size else cols[u - size] if u < 2 * size else boxes[u - 2 * size]
+            if (once | used) != full_mask:  # Some digit fits nowhere in the unit
+                return None
+            single = once & ~more & ~used
+            while single:
+                bit = single & -single
+                single ^= bit
+                for i in unit:
+                    if cells[i]:
+                        continue
+                    r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+                    if masks[i] & bit and not (rows[r] | cols[c] | boxes[b]) & bit:  # The only cell left
+                        cells[i] = bit.bit_length() - 1
+                        masks[i] = 0
+                        rows[r] |= bit
+                        cols[c] |= bit
+                        boxes[b] |= bit
+                        trail.append(i)
+                        progress = True
+                        break
+        return progress
+
+    @staticmethod
+    def undo(geometry, cells, rows, cols, boxes, trail):
+        """
+        Clear the cells placed by propagate() and release their digits.
+        :param trail: The cells placed, as appended by propagate()
+        """
+        for i in trail:
+            bit = 1 << cells[i]
+            rows[geometry.row_of[i]] ^= bit
+            cols[geometry.col_of[i]] ^= bit
+            boxes[geometry.box_of[i]] ^= bit
+            cells[i] = 0
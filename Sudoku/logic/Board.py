@@ -1,82 +1,131 @@
 import random  # Import the random module
-from logic.Solver import Solver  # Import the Solver class
-from logic.Cell import Cell  # Import the Cell class
+from logic.Generator import Generator  # Import the Generator class
+from logic.Geometry import Geometry  # Import the Geometry class
 from interface.BoardInterface import BoardInterface  # Import the BoardInterface class
 
 
 class Board(BoardInterface):  # Define the Board class inheriting from BoardInterface
-    def __init__(self):
+    """
+    Board stored as one byte per cell in row-major order, an integer bitmap of the fixed clues
+    and per-unit digit counters kept in flat bytearrays.
+    """
+
+    def __init__(self, size=9, buffer=None):
         """
-        Initialize the board with a 9x9 grid of cells.
+        Initialize the board with a size x size grid of empty cells.
+        :param size: Number of rows, columns, boxes and digits, 9, 16 or 25 (default is 9)
+        :param buffer: Writable buffer of size * size bytes to hold the cell values, for example
+                       shared memory (default is None, a new bytearray); its contents are kept
         """
         try:
-            self.grid = [[Cell(row, col, 550 // 9) for col in range(9)] for row in range(9)]  # Create a 9x9 grid of Cell objects
+            self.geometry = Geometry.of(size)  # Box layout of this board size
+            self.size = size  # Number of rows and columns
+            self.values = buffer if buffer is not None else bytearray(self.geometry.cells)  # Cell values, 0 for empty
+            self.fixed = 0  # Bit i is set when cell i is a clue
+            self.solution = None  # Solved grid of the puzzle as size * size bytes, None when unknown
+            self.rebuild_counts()  # Initialize the occupancy counters
         except Exception as e:
             print(f"Error initializing the board: {e}")
 
     def reset_board(self):
         """
-        Reset the board to an empty state with a 9x9 grid of cells.
+        Reset the board to an empty state.
         """
         try:
-            self.grid = [[Cell(row, col, 550 // 9) for col in range(9)] for row in range(9)]  # Reset the grid with new Cell objects
+            self.values[:] = bytes(self.geometry.cells)  # Clear every cell in place
+            self.fixed = 0  # No clues left
+            self.solution = None  # No puzzle, no solution
+            self.rebuild_counts()  # Clear the occupancy counters
         except Exception as e:
             print(f"Error resetting the board: {e}")
 
     def fill_grid(self):
         """
-        Fill the grid with a valid Sudoku solution using the Solver.
+        Fill the grid with a valid Sudoku solution using the Generator, transforming a pooled grid instead of searching.
         """
         try:
-            solver = Solver()  # Create an instance of the Solver
-            temp_board = [[0 for _ in range(9)] for _ in range(9)]  # Create a temporary 9x9 grid filled with zeros
-            self.shuffle_board(temp_board)  # Shuffle the board to introduce variability
-            solver.solve(temp_board)  # Solve the temporary board to generate a Sudoku solution
-            if solver.has_unique_solution(temp_board):  # Ensure the puzzle has a unique solution
-                for row in range(9):  # Iterate through each row
-                    for col in range(9):  # Iterate through each column
-                        self.grid[row][col] = Cell(row, col, 550 // 9, value=temp_board[row][col],
-                                                   fixed=True)  # Fill the grid with solved values
-            else:
-                self.fill_grid()  # Retry if the generated puzzle does not have a unique solution
+            temp_board = Generator(size=self.size, mode='transform').solved_grid()  # Generate a solved Sudoku grid
+            self.values[:] = bytes(value for row in temp_board for value in row)  # Fill the grid with solved values
+            self.fixed = (1 << self.geometry.cells) - 1  # Every cell is a clue
+            self.solution = bytes(self.values)  # Kept when numbers are removed
+            self.rebuild_counts()  # Recount the filled grid
         except Exception as e:
             print(f"Error filling the grid: {e}")
 
-    def shuffle_board(self, board):
-        """
-        Shuffle the board to introduce variability.
-        :param board: 2D list representing the Sudoku board
-        """
-        numbers = list(range(1, 10))  # Create a list of numbers 1-9
-        random.shuffle(numbers)  # Shuffle the numbers list
-        for i in range(9):  # Iterate through the board
-            board[i][i] = numbers[i]  # Assign shuffled numbers diagonally
-
-    def remove_numbers(self, difficulty):
+    def remove_numbers(self, difficulty, unique=True):
         """
         Remove numbers from the filled grid to create a Sudoku puzzle of the given difficulty.
+        With unique=True a removal is kept only if the puzzle still has a single solution, so fewer
+        cells may be removed than requested; the number of solution counts spent is stored in
+        self.uniqueness_checks.
         :param difficulty: Number of cells to be removed to create the puzzle
+        :param unique: Whether to guarantee a unique solution (default is True)
         """
         try:
+            if unique:  # Remove clues one at a time with uniqueness checks
+                generator = Generator(size=self.size)  # Create an instance of the Generator
+                puzzle = generator.remove_clues(self.get_values(), self.geometry.cells - difficulty)  # Build the puzzle
+                self.uniqueness_checks = generator.uniqueness_checks  # Report the checks spent
+                for row in range(self.size):  # Iterate through each row
+                    for col in range(self.size):  # Iterate through each column
+                        if puzzle[row][col] == 0:  # The clue was removed
+                            self.set_cell(row, col, 0)  # Set the cell value to 0 (empty)
+                            self.set_fixed(row, col, False)  # Mark the cell as not fixed
+                return
+
+            self.uniqueness_checks = 0  # Random removal runs no checks
             num_remove = difficulty  # Set the number of cells to remove based on difficulty
             count = 0  # Initialize a counter for removed cells
             while count < num_remove:  # Continue until the required number of cells are removed
-                row = random.randint(0, 8)  # Generate a random row index
-                col = random.randint(0, 8)  # Generate a random column index
-                if self.grid[row][col].value != 0:  # Check if the cell is not already empty
-                    self.grid[row][col].value = 0  # Set the cell value to 0 (empty)
-                    self.grid[row][col].fixed = False  # Mark the cell as not fixed
+                row = random.randint(0, self.size - 1)  # Generate a random row index
+                col = random.randint(0, self.size - 1)  # Generate a random column index
+                if self.get(row, col) != 0:  # Check if the cell is not already empty
+                    self.set_cell(row, col, 0)  # Set the cell value to 0 (empty)
+                    self.set_fixed(row, col, False)  # Mark the cell as not fixed
                     count += 1  # Increment the counter
         except Exception as e:
             print(f"Error removing numbers: {e}")
 
+    def load_puzzle(self, puzzle, solution=None):
+        """
+        Load a puzzle onto the board, marking the given cells as fixed.
+        :param puzzle: 2D list representing the puzzle, 0 for empty cells
+        :param solution: 2D list representing its solution (default is None, unknown)
+        """
+        try:
+            self.values[:] = bytes(value for row in puzzle for value in row)  # Copy the puzzle values
+            self.solution = bytes(value for row in solution for value in row) if solution else None
+            self.fixed = 0
+            for i, value in enumerate(self.values):  # Every given is a clue
+                if value:
+                    self.fixed |= 1 << i
+            self.rebuild_counts()  # Recount the loaded values
+        except Exception as e:
+            print(f"Error loading the puzzle: {e}")
+
+    def load_from_bank(self, bank, difficulty):
+        """
+        Load a random puzzle of the given difficulty from a puzzle bank.
+        :param bank: An open PuzzleBank
+        :param difficulty: The difficulty level ('easy', 'medium' or 'hard')
+        :return: True if a puzzle was loaded, False if the bank has none for this difficulty or board size
+        """
+        if self.size != 9:  # Bank records hold 9x9 puzzles
+            return False
+        entry = bank.random_entry(difficulty)  # Read a single record from the bank
+        if entry is None:  # No puzzle stored for this difficulty
+            return False
+        self.load_puzzle(*entry)  # Place the puzzle on the board with its stored solution
+        return True
+
     def get_values(self):
         """
         Get the current values of the board.
         :return: 2D list representing the current values of the board
         """
         try:
-            return [[cell.value for cell in row] for row in self.grid]  # Return a 2D list of cell values
+            size = self.size
+            return [list(self.values[row * size:row * size + size]) for row in range(size)]  # Return a 2D list of cell values
         except Exception as e:
             print(f"Error getting board values: {e}")
             return []
@@ -87,8 +136,153 @@ class Board(BoardInterface):  # Define the Board class inheriting from BoardInte
         :param values: 2D list representing the values to set on the board
         """
         try:
-            for row in range(9):  # Iterate through each row
-                for col in range(9):  # Iterate through each column
-                    self.grid[row][col].value = values[row][col]  # Set the cell value to the given value
+            self.values[:] = bytes(value for row in values for value in row)  # Copy every value in one pass
+            self.rebuild_counts()  # Recount the new values
         except Exception as e:
             print(f"Error setting board values: {e}")
+
+    def get(self, row, col):
+        """
+        Get the value of a cell.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :return: The value, 0 for an empty cell
+        """
+        return self.values[row * self.size + col]
+
+    def is_fixed(self, row, col):
+        """
+        Check if a cell is a clue of the puzzle.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :return: True if the cell is fixed, False otherwise
+        """
+        return bool(self.fixed >> (row * self.size + col) & 1)
+
+    def clues(self):
+        """
+        Get the puzzle without the player's entries.
+        :return: 2D list of the fixed cells, 0 for every other cell
+        """
+        size = self.size
+        return [[self.values[row * size + col] if self.fixed >> (row * size + col) & 1 else 0
+                 for col in range(size)] for row in range(size)]
+
+    def is_wrong(self, row, col):
+        """
+        Check an entry against the stored solution, without any search.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :return: True if the cell holds a value that differs from the solution, False if it is empty, right
+                 or no solution is stored
+        """
+        i = row * self.size + col
+        return self.solution is not None and self.values[i] != 0 and self.values[i] != self.solution[i]
+
+    def set_fixed(self, row, col, fixed):
+        """
+        Mark a cell as a clue or as a player cell.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :param fixed: True to make the cell a clue
+        """
+        bit = 1 << (row * self.size + col)
+        self.fixed = self.fixed | bit if fixed else self.fixed & ~bit
+
+    def snapshot(self):
+        """
+        Capture the board state with a few buffer copies, without walking the cells.
+        :return: Opaque snapshot for restore()
+        """
+        return (bytes(self.values), self.fixed, bytes(self.row_counts), bytes(self.col_counts),
+                bytes(self.box_counts), self.filled, self.duplicates)
+
+    def restore(self, snapshot):
+        """
+        Restore a state captured by snapshot() on a board of the same size.
+        :param snapshot: The snapshot
+        """
+        values, self.fixed, row_counts, col_counts, box_counts, self.filled, self.duplicates = snapshot
+        self.values[:] = values  # Copy back in place, so shared buffers stay attached
+        self.row_counts[:] = row_counts  # The counters come back with the values, no recount needed
+        self.col_counts[:] = col_counts
+        self.box_counts[:] = box_counts
+
+    def view(self):
+        """
+        Get a read-only view of the cell values through the buffer protocol, without copying.
+        NumPy wraps it with numpy.frombuffer(board.view(), dtype=numpy.uint8).reshape(size, size).
+        :return: memoryview of size * size unsigned bytes in row-major order
+        """
+        return memoryview(self.values).toreadonly()
+
+    def rebuild_counts(self):
+        """
+        Recompute the per-row, per-column and per-box digit counters from the grid.
+        The count of digit d in unit u is stored at index u * (size + 1) + d.
+        """
+        size = self.size
+        self.row_counts = bytearray(size * (size + 1))  # Occurrences of each digit in each row
+        self.col_counts = bytearray(size * (size + 1))  # Occurrences of each digit in each column
+        self.box_counts = bytearray(size * (size + 1))  # Occurrences of each digit in each box
+        self.filled = 0  # Number of non-empty cells
+        self.duplicates = 0  # Number of extra copies of a digit inside a row, column or box
+        for i, value in enumerate(self.values):  # Register every cell value
+            self._count(i // size, i % size, value, 1)
+
+    def _count(self, row, col, value, delta):
+        """
+        Add (delta=1) or remove (delta=-1) one occurrence of value at (row, col) from the counters.
+        """
+        if value == 0:  # Empty cells are not counted
+            return
+        self.filled += delta  # Track the number of filled cells
+        stride = self.size + 1
+        for counts, unit in ((self.row_counts, row), (self.col_counts, col),
+                             (self.box_counts, self.geometry.box_index(row, col))):
+            index = unit * stride + value
+            if delta > 0:
+                if counts[index] >= 1:  # The digit is already present in this unit
+                    self.duplicates += 1
+            elif counts[index] >= 2:  # Removing one of several copies
+                self.duplicates -= 1
+            counts[index] += delta
+
+    def set_cell(self, row, col, value):
+        """
+        Write a value into a cell and update the counters in constant time.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :param value: The value to write, 0 to clear the cell
+        """
+        i = row * self.size + col
+        self._count(row, col, self.values[i], -1)  # Remove the old value
+        self.values[i] = value  # Write the new value
+        self._count(row, col, value, 1)  # Add the new value
+
+    def is_move_legal(self, row, col, value):
+        """
+        Check in constant time if value can be placed at (row, col) without repeating a digit.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :param value: The value to check
+        :return: True if the value does not appear elsewhere in the row, column or box
+        """
+        own = 1 if self.get(row, col) == value else 0  # The cell itself does not count as a conflict
+        stride = self.size + 1
+        return (self.row_counts[row * stride + value] == own and self.col_counts[col * stride + value] == own
+                and self.box_counts[self.geometry.box_index(row, col) * stride + value] == own)
+
+    def is_full(self):
+        """
+        Check in constant time if every cell is filled.
+        :return: True if the board is full, False otherwise
+        """
+        return self.filled == self.geometry.cells
+
+    def is_solved(self):
+        """
+        Check in constant time if the board is full and has no repeated digit in any row, column or box.
+        :return: True if the board is solved, False otherwise
+        """
+        return self.filled == self.geometry.cells and self.duplicates == 0
@@ -0,0 +1,78 @@
+from logic.Geometry import Geometry  # Import the Geometry class
+from interface.ConflictCheckerInterface import ConflictCheckerInterface  # Import the ConflictCheckerInterface class
+
+UNIT_KINDS = ('row', 'col', 'box')  # Kinds of units, in the order of Geometry.units
+
+
+class ConflictChecker(ConflictCheckerInterface):
+    """
+    Board validation in a single pass over the cells, using the row, column and box index tables of Geometry.
+    Accepts a 2D list or a flat row-major sequence such as Board.values.
+    """
+
+    def __init__(self, size=9):
+        """
+        Initialize the ConflictChecker.
+        :param size: Number of rows, columns, boxes and digits, 9, 16 or 25 (default is 9)
+        """
+        self.geometry = Geometry.of(size)  # Index tables for this board size
+
+    def conflicts(self, board):
+        """
+        Find every cell whose digit is repeated in its row, column or box.
+        :param board: 2D list or flat row-major sequence of the cell values, 0 for empty cells
+        :return: Dictionary mapping (row, col) of each conflicting cell to its list of (kind, index) units
+        """
+        geometry = self.geometry
+        size = geometry.size
+        stride = size + 1
+        cells = self._cells(board)
+        first = [-1] * (3 * size * stride)  # First cell holding each digit in each unit, -1 if none yet
+        found = {}
+        for i, value in enumerate(cells):
+            if not value:  # Empty cells never conflict
+                continue
+            for kind, unit in enumerate((geometry.row_of[i], geometry.col_of[i], geometry.box_of[i])):
+                slot = (kind * size + unit) * stride + value
+                j = first[slot]
+                if j < 0:  # First copy of the digit in this unit
+                    first[slot] = i
+                    continue
+                where = (UNIT_KINDS[kind], unit)
+                for cell in (j, i):  # Flag both copies, the first one only once per unit
+                    units = found.setdefault(divmod(cell, size), [])
+                    if where not in units:
+                        units.append(where)
+        return found
+
+    def is_solution(self, board):
+        """
+        Check if every cell is filled and no digit is repeated in a row, column or box.
+        Stops at the first empty cell or repeated digit.
+        :param board: 2D list or flat row-major sequence of the cell values, 0 for empty cells
+        :return: True if the board is a valid solution, False otherwise
+        """
+        geometry = self.geometry
+        rows = [0] * geometry.size  # Digits seen in each row
+        cols = [0] * geometry.size  # Digits seen in each column
+        boxes = [0] * geometry.size  # Digits seen in each box
+        for i, value in enumerate(self._cells(board)):
+            if not value:  # Empty cell
+                return False
+            bit = 1 << value
+            r, c, b = geometry.row_of[i], geometry.col_of[i], geometry.box_of[i]
+            if (rows[r] | cols[c] | boxes[b]) & bit:  # Repeated digit
+                return False
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+        return True
+
+    def _cells(self, board):
+        """
+        Get the cell values in row-major order.
+        :return: The board itself when it is already flat, else a flat list
+        """
+        if len(board) == self.geometry.cells:  # Flat sequence
+            return board
+        return [value for row in board for value in row]
@@ -0,0 +1,217 @@
+from logic.Geometry import Geometry  # Import the Geometry class
+from interface.SolverEngineInterface import SolverEngineInterface  # Import the SolverEngineInterface class
+
+
+class DLXSolver(SolverEngineInterface):
+    """
+    Exact cover engine running Knuth's Algorithm X on Dancing Links.
+
+    Sudoku is modelled as 4 * size * size constraint columns (cell filled, digit in row,
+    digit in column, digit in box) and size ** 3 candidate rows (one per cell and digit),
+    324 columns and 729 rows on a 9x9 board.
+    The links are stored in flat integer lists instead of node objects.
+    """
+
+    _templates = {}  # Untouched link lists of each board size, copied for every search
+
+    def __init__(self):
+        """
+        Initialize the DLXSolver.
+        """
+        self.stats = None  # SolverStats filled during a call, None when collection is off
+
+    def solve(self, board):
+        """
+        Solve the Sudoku puzzle in place.
+        :param board: 2D list representing the Sudoku board
+        :return: True if the puzzle is solved, False otherwise
+        """
+        try:
+            solutions = self.find_solutions(board, 1)  # Stop at the first solution
+            if not solutions:  # No solution exists
+                return False
+            size = len(board)
+            for row in range(size):  # Copy the solution back onto the board
+                board[row][:] = solutions[0][row * size:row * size + size]
+            return True
+        except Exception as e:
+            print(f"Error solving the board: {e}")
+            return False
+
+    def count_solutions(self, board, limit=2):
+        """
+        Count the number of solutions to the Sudoku puzzle.
+        :param board: 2D list representing the Sudoku board
+        :param limit: Number of solutions after which the search stops
+        :return: Number of solutions, at most limit
+        """
+        try:
+            return len(self.find_solutions(board, limit))
+        except Exception as e:
+            print(f"Error counting solutions: {e}")
+            return 0
+
+    def find_solutions(self, board, limit):
+        """
+        Collect up to limit solutions of the Sudoku puzzle without modifying the board.
+        :param board: 2D list representing the Sudoku board
+        :param limit: Maximum number of solutions to collect
+        :return: List of solutions, each a flat list of size * size values
+        """
+        self.size = len(board)  # Digits per cell
+        self._build(Geometry.of(self.size))  # Fresh link structure for this board
+        cells = [value for row in board for value in row]  # Flatten the board
+        covered = set()  # Constraint columns satisfied by the givens
+        for i, value in enumerate(cells):  # Select the rows of the givens
+            if value:
+                node = self.row_start[i * self.size + value - 1]
+                columns = [self.C[node]]
+                j = self.R[node]
+                while j != node:
+                    columns.append(self.C[j])
+                    j = self.R[j]
+                if covered.intersection(columns):  # The givens already conflict
+                    return []
+                for column in columns:
+                    self._cover(column)
+                covered.update(columns)
+        solutions = []
+        self._search(cells, [], solutions, limit, 0)
+        return solutions
+
+    def _build(self, geometry):
+        """
+        Set up fresh link lists for a board size, copying a template built on first use.
+        :param geometry: Geometry of the board size
+        """
+        template = self._templates.get(geometry.size)
+        if template is None:  # First board of this size
+            self._build_template(geometry)
+            template = self._templates[geometry.size] = (self.L, self.R, self.U, self.D, self.C, self.S,
+                                                         self.row_id, self.row_start)
+        L, R, U, D, C, S, row_id, row_start = template
+        self.L, self.R, self.U, self.D, self.S = L[:], R[:], U[:], D[:], S[:]  # Links changed by the search
+        self.C, self.row_id, self.row_start = C, row_id, row_start  # Never modified, shared
+
+    def _build_template(self, geometry):
+        """
+        Build the exact cover matrix as circular doubly linked lists.
+        :param geometry: Geometry of the board size
+        """
+        n = geometry.size
+        cells = geometry.cells
+        columns = 4 * cells
+        self.L = list(range(-1, columns))  # Header ring: root is node 0, column j is node j + 1
+        self.R = list(range(1, columns + 2))
+        self.L[0] = columns
+        self.R[columns] = 0
+        self.U = list(range(columns + 1))  # Empty columns point at themselves
+        self.D = list(range(columns + 1))
+        self.C = list(range(columns + 1))
+        self.S = [0] * (columns + 1)  # Number of rows left in each column
+        self.row_id = [-1] * (columns + 1)  # Candidate row of each node, -1 for headers
+        self.row_start = []  # First node of each candidate row
+        for cell in range(cells):
+            row, col, box = geometry.row_of[cell], geometry.col_of[cell], geometry.box_of[cell]
+            for digit in range(n):
+                candidate = cell * n + digit
+                first = len(self.C)
+                headers = (1 + cell, 1 + cells + row * n + digit, 1 + 2 * cells + col * n + digit,
+                           1 + 3 * cells + box * n + digit)
+                for k, header in enumerate(headers):
+                    node = first + k
+                    self.C.append(header)
+                    self.row_id.append(candidate)
+                    self.U.append(self.U[header])  # Append at the bottom of the column
+                    self.D.append(header)
+                    self.D[self.U[header]] = node
+                    self.U[header] = node
+                    self.S[header] += 1
+                    self.L.append(first + (k - 1) % 4)  # Link the four nodes of the row in a ring
+                    self.R.append(first + (k + 1) % 4)
+                self.row_start.append(first)
+
+    def _cover(self, c):
+        """
+        Remove column c from the header ring and its rows from every other column.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, c):
+        """
+        Restore column c, undoing _cover in reverse order.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def _search(self, cells, partial, solutions, limit, depth):
+        """
+        Algorithm X: pick the column with the fewest rows and try each of them.
+        :return: None, solutions are appended to the solutions list
+        """
+        stats = self.stats
+        if stats is not None:  # Only touch the counters when collection is on
+            stats.nodes += 1
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+        R, S = self.R, self.S
+        if R[0] == 0:  # Every constraint is satisfied
+            solution = cells[:]
+            size = self.size
+            for candidate in partial:
+                solution[candidate // size] = candidate % size + 1
+            solutions.append(solution)
+            return
+
+        best = R[0]  # Column with the fewest remaining rows
+        c = R[best]
+        while c != 0:
+            if S[c] < S[best]:
+                best = c
+                if S[c] <= 1:
+                    break
+            c = R[c]
+        if S[best] == 0:  # Unsatisfiable constraint
+            if stats is not None:
+                stats.backtracks += 1
+            return
+
+        self._cover(best)
+        r = self.D[best]
+        while r != best:
+            partial.append(self.row_id[r])
+            j = R[r]
+            while j != r:
+                self._cover(self.C[j])
+                j = R[j]
+            self._search(cells, partial, solutions, limit, depth + 1)
+            j = self.L[r]
+            while j != r:
+                self._uncover(self.C[j])
+                j = self.L[j]
+            partial.pop()
+            if len(solutions) >= limit:  # Early exit once enough solutions are found
+                break
+            r = self.D[r]
+        self._uncover(best)
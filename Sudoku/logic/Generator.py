@@ -0,0 +1,195 @@
+import random  # Import the random module
+from math import isqrt  # Import the integer square root function
+from logic.Solver import Solver  # Import the Solver class
+from logic.Geometry import Geometry, SYMBOLS  # Import the Geometry class and value characters
+from logic.GridPool import GridPool, POOL_SEEDS  # Import the GridPool class and its seed count
+from logic.LogicalSolver import LogicalSolver  # Import the LogicalSolver class
+from interface.GeneratorInterface import GeneratorInterface  # Import the GeneratorInterface class
+
+# Range of clues kept for each difficulty level on a 9x9 board, scaled by the cell count for other sizes.
+# Graded generation only follows it for 'easy', see Generator.clues_for
+CLUE_RANGES = {
+    'easy': (50, 67),
+    'medium': (32, 49),
+    'hard': (28, 31),
+}
+# Levels each board size offers: below these clue counts, the uniqueness checks of 16x16 and 25x25 boards take
+# seconds to minutes per puzzle instead of a fraction of a second
+SIZE_LEVELS = {
+    9: ('easy', 'medium', 'hard'),
+    16: ('easy', 'medium'),
+    25: ('easy',),
+}
+DEFAULT_CLUES = 36  # Clues kept when the difficulty is not set properly
+GRADED_ATTEMPTS = 100  # Puzzles tried before graded generation settles for the last one
+GENERATOR_MODES = ('search', 'transform')  # How solved grids are built, 'transform' draws from a GridPool
+
+
+class Generator(GeneratorInterface):
+    def __init__(self, solver=None, collect_stats=False, size=9, mode='search', pool=None):
+        """
+        Initialize the Generator.
+        :param solver: The Solver used for uniqueness checks (default is Solver.for_size(size))
+        :param collect_stats: Whether the solver collects search statistics (default is False)
+        :param size: Board size of the generated grids, 9, 16 or 25 (default is 9)
+        :param mode: How solved grids are built, one of GENERATOR_MODES (default is 'search')
+        :param pool: GridPool used in 'transform' mode (default is GridPool.of(size), shared by every generator)
+        """
+        if mode not in GENERATOR_MODES:
+            raise ValueError(f"Unknown generator mode: {mode}")
+        self.geometry = Geometry.of(size)  # Board size and box layout
+        self.levels = SIZE_LEVELS[size]  # Difficulty levels offered on this board size
+        self.mode = mode  # How solved grids are built
+        self.pool = pool if pool is not None else GridPool.of(size) if mode == 'transform' else None
+        self.solver = solver if solver is not None else Solver.for_size(size)  # Solver used to count solutions
+        if collect_stats:
+            self.solver.collecting = True
+        self.stats = self.solver.totals  # Solver counters summed over every grid and uniqueness check
+        self.uniqueness_checks = 0  # Number of solution counts run by the last remove_clues call
+        self.last_grade = None  # Grading result of the last graded puzzle
+        self.last_solution = None  # Solved grid of the last puzzle, kept for hints and mistake checks
+
+    def clues_for(self, difficulty):
+        """
+        Pick a random number of clues for a difficulty level, from CLUE_RANGES. This is the clue count of
+        ungraded puzzles, as used by the UI, the prefetcher, the service and SudokuGame. Graded generation
+        (generate with graded=True, generate.py --graded) keeps it for 'easy' only: 'medium' and 'hard'
+        puzzles are reduced as far as uniqueness allows, about 22-27 clues, because at the floors of their
+        ranges only 1-2% of puzzles grade as 'medium'. A graded 'medium' or 'hard' puzzle, including one
+        from a bank written with --graded, therefore has fewer clues than the table says.
+        :param difficulty: The difficulty level, one of self.levels
+        :return: The number of clues the puzzle should keep
+        """
+        cells = self.geometry.cells
+        if difficulty not in CLUE_RANGES:  # Unknown difficulty, never below the floor of the hardest level offered
+            return max(DEFAULT_CLUES, CLUE_RANGES[self.levels[-1]][0]) * cells // 81
+        if difficulty not in self.levels:
+            raise ValueError(f"The {difficulty} level is not offered on {self.geometry.size}x{self.geometry.size} boards")
+        low, high = CLUE_RANGES[difficulty]
+        return random.randint(low * cells // 81, high * cells // 81)
+
+    def solved_grid(self):
+        """
+        Build a random solved grid: with a search in 'search' mode, or in 'transform' mode by applying a
+        random symmetry to a grid of the pool, which is seeded with POOL_SEEDS searched grids when empty and
+        gains one freshly searched grid every POOL_REFRESH draws, so long sessions keep meeting new grids.
+        :return: 2D list representing a solved Sudoku grid
+        """
+        if self.mode == 'search':
+            return self.search_grid()
+        if not self.pool:  # First draw, seed the pool from the search engine
+            self.pool.refresh(self.search_grid, POOL_SEEDS)
+        elif self.pool.refresh_due():  # Bring a new symmetry class into the pool
+            self.pool.refresh(self.search_grid, 1)
+        return self.pool.draw()
+
+    def refresh_pool(self, count=POOL_SEEDS):
+        """
+        Add freshly searched grids to the pool, bringing new symmetry classes into 'transform' mode.
+        :param count: Number of grids to search (default is POOL_SEEDS)
+        """
+        if self.pool is None:
+            raise ValueError("Only 'transform' mode uses a grid pool")
+        self.pool.refresh(self.search_grid, count)
+
+    def search_grid(self):
+        """
+        Build a random solved grid by seeding the main diagonal with shuffled digits and solving it.
+        :return: 2D list representing a solved Sudoku grid
+        """
+        size = self.geometry.size
+        grid = [[0 for _ in range(size)] for _ in range(size)]  # Create an empty grid
+        numbers = list(range(1, size + 1))  # Create a list of every digit
+        random.shuffle(numbers)  # Shuffle the numbers list
+        for i in range(size):  # Iterate through the diagonal
+            grid[i][i] = numbers[i]  # Assign shuffled numbers diagonally
+        self.solver.solve(grid)  # Solve the seeded grid
+        return grid
+
+    def generate(self, difficulty, graded=False, max_attempts=GRADED_ATTEMPTS):
+        """
+        Generate a puzzle with a unique solution for a difficulty level.
+        With graded=True, puzzles are rejected until the LogicalSolver grade matches the difficulty.
+        Medium and hard puzzles are then reduced as far as uniqueness allows, since their clue
+        ranges almost never need more than singles.
+        :param difficulty: The difficulty level, one of self.levels (SIZE_LEVELS of the board size)
+        :param graded: Whether the puzzle must grade as the requested difficulty (default is False)
+        :param max_attempts: Puzzles tried before returning the last one (default is GRADED_ATTEMPTS)
+        :return: 2D list representing the puzzle, 0 for empty cells
+        """
+        if not graded:
+            return self.remove_clues(self.solved_grid(), self.clues_for(difficulty))
+        if self.geometry.size != 9:  # The logical techniques are written for 9x9 boards
+            raise ValueError("Graded generation only supports 9x9 boards")
+
+        grader = LogicalSolver()
+        for _ in range(max_attempts):
+            clues = self.clues_for(difficulty) if difficulty == 'easy' else 0
+            puzzle = self.remove_clues(self.solved_grid(), clues)
+            self.last_grade = grader.grade(puzzle)
+            if self.last_grade['difficulty'] == difficulty:  # The grade matches
+                break
+        return puzzle
+
+    def remove_clues(self, solution, clues):
+        """
+        Remove clues one at a time, keeping a removal only if the puzzle still has a single solution.
+        Every rejected removal yields an alternate solution; it is cached and used to reject later
+        removals it also rules out, without running another search. The solution is kept in self.last_solution.
+        :param solution: 2D list representing a solved Sudoku grid
+        :param clues: Number of clues the puzzle should keep
+        :return: 2D list representing the puzzle, with at least clues filled cells
+        """
+        size = len(solution)
+        cells = size * size
+        solution_cells = [value for row in solution for value in row]  # Flatten the solution
+        puzzle = solution_cells[:]  # Start from the full grid
+        clue_mask = (1 << cells) - 1  # Bit i is set while cell i is still a clue
+        alternates = []  # Cells where each cached alternate solution differs from the solution, as bitmasks
+        self.uniqueness_checks = 0  # Reset the check counter
+        self.last_solution = [row[:] for row in solution]  # The puzzle's only solution
+
+        order = list(range(cells))  # Try the cells in random order
+        random.shuffle(order)
+        remaining = cells
+        for i in order:
+            if remaining <= clues:  # Enough clues removed
+                break
+            bit = 1 << i
+            # An alternate that agrees with every clue except this one solves the reduced puzzle too
+            if any(diff & clue_mask == bit for diff in alternates):
+                continue
+            puzzle[i] = 0
+            self.uniqueness_checks += 1
+            found = self.solver.find_solutions([puzzle[r * size:r * size + size] for r in range(size)], 2)
+            if len(found) > 1:  # The removal made the puzzle ambiguous, keep the clue
+                for other in found:
+                    if other != solution_cells:
+                        alternates.append(sum(1 << j for j in range(cells) if other[j] != solution_cells[j]))
+                puzzle[i] = solution_cells[i]
+                continue
+            clue_mask ^= bit
+            remaining -= 1
+        return [puzzle[r * size:r * size + size] for r in range(size)]
+
+    @staticmethod
+    def encode(grid):
+        """
+        Encode a grid as a string of one character per cell, '0' for empty cells and letters for values above 9.
+        A 9x9 grid gives an 81-character string of digits.
+        :param grid: 2D list representing a Sudoku grid
+        :return: The encoded grid
+        """
+        return ''.join(SYMBOLS[value] for row in grid for value in row)
+
+    @staticmethod
+    def decode(text):
+        """
+        Decode a string of one character per cell into a grid, '0' or '.' for empty cells.
+        The board size is taken from the length of the string.
+        :param text: The encoded grid
+        :return: 2D list representing the Sudoku grid
+        """
+        values = [0 if char == '.' else SYMBOLS.index(char.upper()) for char in text.strip()]
+        size = isqrt(len(values))
+        return [values[row * size:row * size + size] for row in range(size)]
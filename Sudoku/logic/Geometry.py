@@ -0,0 +1,63 @@
+from math import isqrt  # Import the integer square root function
+
+SIZES = (9, 16, 25)  # Supported board sizes, each a perfect square
+SYMBOLS = '0123456789ABCDEFGHIJKLMNOP'  # Character of each value, '0' for empty cells, letters above 9
+
+
+class Geometry:
+    """
+    Index tables for a size x size board with sqrt(size) x sqrt(size) boxes, built once per size.
+    Cells are numbered row by row, cell = row * size + col.
+    """
+
+    _cache = {}  # Geometry of each size built so far
+
+    def __init__(self, size):
+        """
+        Initialize the Geometry. Use Geometry.of(size) to share the tables between callers.
+        :param size: Number of rows, columns, boxes and digits
+        """
+        if size not in SIZES:  # Only perfect squares have square boxes
+            raise ValueError(f"Unsupported board size: {size}")
+        self.size = size  # Rows, columns, boxes and digits
+        self.box = isqrt(size)  # Rows and columns of each box
+        self.cells = size * size  # Number of cells
+        self.full_mask = ((1 << size) - 1) << 1  # Bits 1-size set, one bit per digit
+        self.row_of = [i // size for i in range(self.cells)]  # Row index of each cell
+        self.col_of = [i % size for i in range(self.cells)]  # Column index of each cell
+        self.box_of = [self.box_index(i // size, i % size) for i in range(self.cells)]  # Box index of each cell
+        rows = [[row * size + col for col in range(size)] for row in range(size)]
+        cols = [[row * size + col for row in range(size)] for col in range(size)]
+        boxes = [[row * size + col for row, col in self.box_cells(box)] for box in range(size)]
+        self.units = rows + cols + boxes  # Cell indexes of every row, column and box
+
+    @classmethod
+    def of(cls, size):
+        """
+        Get the shared Geometry of a board size.
+        :param size: Number of rows, columns, boxes and digits
+        :return: The Geometry
+        """
+        geometry = cls._cache.get(size)
+        if geometry is None:  # First board of this size
+            geometry = cls._cache[size] = cls(size)
+        return geometry
+
+    def box_index(self, row, col):
+        """
+        Get the index of the box holding a cell.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :return: The box index, numbered row by row
+        """
+        return (row // self.box) * self.box + col // self.box
+
+    def box_cells(self, box):
+        """
+        Get the (row, col) positions of every cell of a box.
+        :param box: The box index
+        :return: List of (row, col) tuples
+        """
+        top = (box // self.box) * self.box
+        left = (box % self.box) * self.box
+        return [(row, col) for row in range(top, top + self.box) for col in range(left, left + self.box)]
@@ -0,0 +1,116 @@
+import random  # Import the random module
+import threading  # Import the threading module
+from collections import deque  # Import the deque class
+from logic.Geometry import Geometry  # Import the Geometry class
+from interface.GridPoolInterface import GridPoolInterface  # Import the GridPoolInterface class
+
+POOL_CAPACITY = 32  # Solved grids kept per board size
+POOL_SEEDS = 4  # Grids searched when an empty pool is first drawn from
+POOL_REFRESH = 8  # Draws after which a freshly searched grid joins the pool
+
+
+class GridPool(GridPoolInterface):
+    """
+    Pool of solved grids from which new solved grids are made by random symmetries instead of a search:
+    digit relabeling, row swaps within bands, column swaps within stacks, band and stack swaps, and
+    transposition. Rotations and reflections are compositions of these, so they are covered too.
+
+    Each grid of the pool stands for its whole symmetry class, up to 6^8 x 2 = 3,359,232 grids on 9x9 before
+    relabeling; refresh() brings in new classes from the search engine, and refresh_due() tells the drawing
+    generator when to do so. The shared pool is drawn from by the prefetch thread and the UI thread, so its
+    grids and counters are guarded by a lock.
+    """
+
+    _cache = {}  # GridPool of each size built so far
+
+    def __init__(self, size, capacity=POOL_CAPACITY, refresh_every=POOL_REFRESH):
+        """
+        Initialize an empty GridPool. Use GridPool.of(size) to share the pool between generators.
+        :param size: Number of rows, columns, boxes and digits
+        :param capacity: Maximum number of grids kept (default is POOL_CAPACITY)
+        :param refresh_every: Draws after which refresh_due() asks for a new grid (default is POOL_REFRESH)
+        """
+        self.geometry = Geometry.of(size)  # Board size and box layout
+        self.grids = deque(maxlen=capacity)  # Solved grids as flat bytes, oldest first
+        self.refresh_every = refresh_every  # Draws between two refreshes
+        self.draws = 0  # Grids built by draw()
+        self.stale = 0  # Draws since the last refresh was asked for
+        self.lock = threading.Lock()  # Guards grids, draws and stale between threads
+
+    _cache_lock = threading.Lock()  # Guards _cache
+
+    @classmethod
+    def of(cls, size):
+        """
+        Get the shared GridPool of a board size.
+        :param size: Number of rows, columns, boxes and digits
+        :return: The GridPool
+        """
+        with cls._cache_lock:
+            pool = cls._cache.get(size)
+            if pool is None:  # First grid of this size
+                pool = cls._cache[size] = cls(size)
+            return pool
+
+    @classmethod
+    def reset_shared(cls):
+        """
+        Drop the shared pools, so the next draw of each size seeds a new pool. Reseeding the random module
+        and then resetting makes the following grids repeat exactly, as benchmarks and replays need.
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def add(self, grid):
+        """
+        Add a solved grid to the pool, dropping the oldest one when the pool is full.
+        :param grid: 2D list representing a solved Sudoku grid
+        """
+        flat = bytes(value for row in grid for value in row)
+        with self.lock:
+            self.grids.append(flat)
+
+    def refresh(self, build, count):
+        """
+        Add freshly searched grids to the pool. The searches run without holding the lock.
+        :param build: Function returning a new solved grid as a 2D list, such as Generator.search_grid
+        :param count: Number of grids to add
+        """
+        for _ in range(count):
+            self.add(build())
+
+    def refresh_due(self):
+        """
+        Check whether refresh_every draws were made since the last refresh was due. Only the first caller
+        is told, so two threads drawing from the pool do not both search.
+        :return: True if the caller should refresh the pool, False otherwise
+        """
+        with self.lock:
+            if self.stale < self.refresh_every:
+                return False
+            self.stale = 0
+            return True
+
+    def draw(self):
+        """
+        Build a new solved grid by applying a random symmetry to a grid of the pool.
+        :return: 2D list representing a solved Sudoku grid
+        """
+        with self.lock:
+            if not self.grids:
+                raise ValueError("The grid pool is empty, refresh it first")
+            source = random.choice(self.grids)  # Grids are immutable bytes, the lock is only needed to pick one
+            self.draws += 1
+            self.stale += 1
+        size, box = self.geometry.size, self.geometry.box
+        bands = random.sample(range(box), box)  # Band order, then row order inside each band
+        rows = [band * box + row for band in bands for row in random.sample(range(box), box)]
+        stacks = random.sample(range(box), box)  # Stack order, then column order inside each stack
+        cols = [stack * box + col for stack in stacks for col in random.sample(range(box), box)]
+        labels = [0] + random.sample(range(1, size + 1), size)  # New name of each digit
+        if random.random() < 0.5:  # Transpose
+            return [[labels[source[col * size + row]] for col in cols] for row in rows]
+        return [[labels[source[row * size + col]] for col in cols] for row in rows]
+
+    def __len__(self):
+        return len(self.grids)
@@ -0,0 +1,362 @@
+from itertools import combinations  # Import the combinations function
+from interface.LogicalSolverInterface import LogicalSolverInterface  # Import the LogicalSolverInterface class
+
+FULL_MASK = 0b1111111110  # Bits 1-9 set, one bit per digit, as in BitmaskSolver
+ROWS = [[row * 9 + col for col in range(9)] for row in range(9)]  # Cell indexes of each row
+COLS = [[row * 9 + col for row in range(9)] for col in range(9)]  # Cell indexes of each column
+BOXES = [[(box // 3) * 27 + (box % 3) * 3 + (i // 3) * 9 + i % 3 for i in range(9)] for box in range(9)]
+UNITS = ROWS + COLS + BOXES  # All 27 units
+ROW_OF = [i // 9 for i in range(81)]  # Row index of each cell
+COL_OF = [i % 9 for i in range(81)]  # Column index of each cell
+BOX_OF = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]  # Box index of each cell
+PEERS = [sorted(set(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}) for i in range(81)]
+BITS = [1 << digit for digit in range(10)]  # Bit of each digit
+
+# Techniques in the order they are tried, with the level used for grading
+TECHNIQUES = (
+    ('naked single', 1),
+    ('hidden single', 1),
+    ('pointing pair', 2),
+    ('box-line reduction', 2),
+    ('naked pair', 3),
+    ('hidden pair', 3),
+    ('naked triple', 4),
+    ('hidden triple', 4),
+    ('x-wing', 5),
+)
+GUESS_LEVEL = 6  # Level reported when the techniques cannot finish the puzzle
+
+
+class LogicalSolver(LogicalSolverInterface):
+    """
+    Rule-based solver that only uses human techniques, working on candidate bitmasks.
+    Used to grade puzzles by the hardest technique they need.
+    """
+
+    def load(self, board):
+        """
+        Load a board and compute the candidates of every empty cell.
+        :param board: 2D list representing the Sudoku board
+        :return: False if the givens already conflict, True otherwise
+        """
+        self.cells = [value for row in board for value in row]  # Flat cell values
+        self.candidates = [0 if value else FULL_MASK for value in self.cells]  # Candidate bitmask per cell
+        for i, value in enumerate(self.cells):
+            if value:
+                for peer in PEERS[i]:
+                    if self.cells[peer] == value:  # Repeated given
+                        return False
+                    self.candidates[peer] &= ~BITS[value]
+        return True
+
+    def place(self, i, digit):
+        """
+        Place a digit and remove it from the candidates of every peer.
+        :param i: Cell index
+        :param digit: Digit to place
+        """
+        self.cells[i] = digit
+        self.candidates[i] = 0
+        bit = ~BITS[digit]
+        candidates = self.candidates
+        for peer in PEERS[i]:
+            candidates[peer] &= bit
+
+    def eliminate(self, cells, mask):
+        """
+        Remove candidate digits from some cells.
+        :param cells: Cell indexes
+        :param mask: Bitmask of the digits to remove
+        :return: True if any candidate was removed
+        """
+        changed = False
+        candidates = self.candidates
+        for i in cells:
+            if candidates[i] & mask:
+                candidates[i] &= ~mask
+                changed = True
+        return changed
+
+    def naked_single(self):
+        """
+        Place every cell that has a single candidate left.
+        :return: Number of cells placed
+        """
+        placed = 0
+        candidates = self.candidates
+        for i in range(81):
+            mask = candidates[i]
+            if mask and not mask & (mask - 1):  # Exactly one bit set
+                self.place(i, mask.bit_length() - 1)
+                placed += 1
+        return placed
+
+    def hidden_single(self):
+        """
+        Place every digit that has a single possible cell in a unit.
+        :return: Number of cells placed
+        """
+        placed = 0
+        candidates = self.candidates
+        for unit in UNITS:
+            once = more = 0  # Digits seen once, digits seen more than once
+            for i in unit:
+                mask = candidates[i]
+                more |= once & mask
+                once |= mask
+            single = once & ~more
+            while single:
+                bit = single & -single
+                single ^= bit
+                for i in unit:
+                    if candidates[i] & bit:  # Still the only place, unless a placement above removed it
+                        self.place(i, bit.bit_length() - 1)
+                        placed += 1
+                        break
+        return placed
+
+    def pointing_pair(self):
+        """
+        When a digit in a box is confined to one row or column, remove it from the rest of that line.
+        :return: True if any candidate was removed
+        """
+        candidates = self.candidates
+        for box in BOXES:
+            for digit in range(1, 10):
+                bit = BITS[digit]
+                cells = [i for i in box if candidates[i] & bit]
+                if len(cells) < 2:
+                    continue
+                rows = {ROW_OF[i] for i in cells}
+                if len(rows) == 1 and self.eliminate([i for i in ROWS[rows.pop()] if i not in box], bit):
+                    return True
+                cols = {COL_OF[i] for i in cells}
+                if len(cols) == 1 and self.eliminate([i for i in COLS[cols.pop()] if i not in box], bit):
+                    return True
+        return False
+
+    def box_line_reduction(self):
+        """
+        When a digit in a row or column is confined to one box, remove it from the rest of that box.
+        :return: True if any candidate was removed
+        """
+        candidates = self.candidates
+        for line in ROWS + COLS:
+            for digit in range(1, 10):
+                bit = BITS[digit]
+                cells = [i for i in line if candidates[i] & bit]
+                if len(cells) < 2:
+                    continue
+                boxes = {BOX_OF[i] for i in cells}
+                if len(boxes) == 1 and self.eliminate([i for i in BOXES[boxes.pop()] if i not in line], bit):
+                    return True
+        return False
+
+    def naked_subset(self, size):
+        """
+        When size cells of a unit share exactly size candidates, remove those candidates from the rest of the unit.
+        :param size: Subset size (2 for pairs, 3 for triples)
+        :return: True if any candidate was removed
+        """
+        candidates = self.candidates
+        for unit in UNITS:
+            cells = [i for i in unit if candidates[i] and candidates[i].bit_count() <= size]
+            for subset in combinations(cells, size):
+                mask = 0
+                for i in subset:
+                    mask |= candidates[i]
+                if mask.bit_count() == size and self.eliminate([i for i in unit if i not in subset], mask):
+                    return True
+        return False
+
+    def hidden_subset(self, size):
+        """
+        When size digits of a unit fit in exactly size cells, remove every other candidate from those cells.
+        :param size: Subset size (2 for pairs, 3 for triples)
+        :return: True if any candidate was removed
+        """
+        candidates = self.candidates
+        for unit in UNITS:
+            places = {}  # Cells of the unit where each digit can still go
+            for digit in range(1, 10):
+                cells = [i for i in unit if candidates[i] & BITS[digit]]
+                if 2 <= len(cells) <= size:
+                    places[digit] = cells
+            for digits in combinations(places, size):
+                cells = set()
+                for digit in digits:
+                    cells.update(places[digit])
+                if len(cells) == size:
+                    keep = 0
+                    for digit in digits:
+                        keep |= BITS[digit]
+                    if self.eliminate(cells, FULL_MASK & ~keep):
+                        return True
+        return False
+
+    def x_wing(self):
+        """
+        When a digit is confined to the same two columns in two rows (or the same two rows in two columns),
+        remove it from the rest of those columns (or rows).
+        :return: True if any candidate was removed
+        """
+        candidates = self.candidates
+        for lines, cross, position in ((ROWS, COLS, COL_OF), (COLS, ROWS, ROW_OF)):
+            for digit in range(1, 10):
+                bit = BITS[digit]
+                pairs = {}  # Pair of positions -> lines where the digit is confined to them
+                for index, line in enumerate(lines):
+                    cells = [i for i in line if candidates[i] & bit]
+                    if len(cells) == 2:
+                        pairs.setdefault((position[cells[0]], position[cells[1]]), []).append(index)
+                for (first, second), found in pairs.items():
+                    if len(found) < 2:
+                        continue
+                    for a, b in combinations(found, 2):
+                        keep = set(lines[a]) | set(lines[b])
+                        others = [i for i in cross[first] + cross[second] if i not in keep]
+                        if self.eliminate(others, bit):
+                            return True
+        return False
+
+    def apply(self, name):
+        """
+        Apply one technique once.
+        :param name: The technique name
+        :return: True if the technique made progress
+        """
+        if name == 'naked single':
+            return self.naked_single() > 0
+        if name == 'hidden single':
+            return self.hidden_single() > 0
+        if name == 'pointing pair':
+            return self.pointing_pair()
+        if name == 'box-line reduction':
+            return self.box_line_reduction()
+        if name == 'naked pair':
+            return self.naked_subset(2)
+        if name == 'hidden pair':
+            return self.hidden_subset(2)
+        if name == 'naked triple':
+            return self.naked_subset(3)
+        if name == 'hidden triple':
+            return self.hidden_subset(3)
+        if name == 'x-wing':
+            return self.x_wing()
+        raise ValueError(f"Unknown technique: {name}")
+
+    def broken(self):
+        """
+        Check if an empty cell has run out of candidates.
+        :return: True if the current state is contradictory
+        """
+        return any(not value and not mask for value, mask in zip(self.cells, self.candidates))
+
+    def run(self, board):
+        """
+        Apply the easiest technique that makes progress until the puzzle is solved or no technique applies.
+        :param board: 2D list representing the Sudoku board
+        :return: Dictionary with 'solved', 'steps', 'hardest' technique, 'level' and 'used' technique counts
+        """
+        result = {'solved': False, 'steps': 0, 'hardest': None, 'level': 0, 'used': {}}
+        if not self.load(board):  # Conflicting givens
+            return result
+        while 0 in self.cells:
+            for name, level in TECHNIQUES:
+                if self.apply(name):
+                    result['steps'] += 1
+                    result['used'][name] = result['used'].get(name, 0) + 1
+                    if level > result['level']:
+                        result['hardest'], result['level'] = name, level
+                    break
+            else:  # No technique applies
+                result['level'] = GUESS_LEVEL
+                result['hardest'] = 'guess'
+                return result
+            if self.broken():  # The givens have no solution
+                return result
+        result['solved'] = True
+        return result
+
+    def next_step(self, board):
+        """
+        Find the next cell the techniques can fill, without changing the board. Candidate eliminations
+        (pairs, X-Wing, ...) are applied as needed until a single appears.
+        :param board: 2D list representing the Sudoku board
+        :return: Dictionary with 'row', 'col', 'value', the 'technique' that places it, a 'reason' and the
+                 'eliminations' used before it, or None if the techniques are stuck or the board is broken
+        """
+        if not self.load(board) or self.broken():  # Conflicting or contradictory entries
+            return None
+        eliminations = []  # Techniques applied before the single appeared
+        while True:
+            step = self.find_single()
+            if step is not None:
+                step['eliminations'] = eliminations
+                return step
+            for name, _ in TECHNIQUES[2:]:  # Elimination techniques, easiest first
+                if self.apply(name):
+                    eliminations.append(name)
+                    break
+            else:  # No technique applies
+                return None
+            if self.broken():
+                return None
+
+    def find_single(self):
+        """
+        Find one naked or hidden single without placing it.
+        :return: Dictionary with 'row', 'col', 'value', 'technique' and 'reason', or None if there is no single
+        """
+        candidates = self.candidates
+        for i in range(81):
+            mask = candidates[i]
+            if mask and not mask & (mask - 1):  # Exactly one bit set
+                digit = mask.bit_length() - 1
+                return {'row': ROW_OF[i], 'col': COL_OF[i], 'value': digit, 'technique': 'naked single',
+                        'reason': f"{digit} is the only candidate left in row {ROW_OF[i] + 1}, column {COL_OF[i] + 1}"}
+        for u, unit in enumerate(UNITS):
+            once = more = 0  # Digits seen once, digits seen more than once
+            for i in unit:
+                mask = candidates[i]
+                more |= once & mask
+                once |= mask
+            single = once & ~more
+            if single:
+                bit = single & -single
+                digit = bit.bit_length() - 1
+                i = next(i for i in unit if candidates[i] & bit)
+                kind = ('row', 'column', 'box')[u // 9]
+                return {'row': ROW_OF[i], 'col': COL_OF[i], 'value': digit, 'technique': 'hidden single',
+                        'reason': f"{digit} has only one place left in {kind} {u % 9 + 1}"}
+        return None
+
+    def solve(self, board):
+        """
+        Solve the Sudoku puzzle in place using only the logical techniques.
+        :param board: 2D list representing the Sudoku board
+        :return: True if the techniques solved the puzzle, False otherwise (the board keeps the deductions)
+        """
+        try:
+            solved = self.run(board)['solved']
+            for row in range(9):  # Copy the deductions back onto the board
+                board[row][:] = self.cells[row * 9:row * 9 + 9]
+            return solved
+        except Exception as e:
+            print(f"Error solving the board logically: {e}")
+            return False
+
+    def grade(self, board):
+        """
+        Grade a puzzle by the hardest technique it needs and the number of steps.
+        :param board: 2D list representing the Sudoku board
+        :return: Dictionary from run() with an added 'difficulty' ('easy', 'medium' or 'hard')
+        """
+        result = self.run(board)
+        if result['level'] <= 1:  # Singles only
+            result['difficulty'] = 'easy'
+        elif result['level'] <= 3:  # Locked candidates and pairs
+            result['difficulty'] = 'medium'
+        else:  # Triples, X-Wing or guessing
+            result['difficulty'] = 'hard'
+        return result
@@ -0,0 +1,114 @@
+from array import array  # Import the array type
+from interface.MoveLogInterface import MoveLogInterface  # Import the MoveLogInterface class
+
+CHECKPOINT_EVERY = 64  # Moves between two board snapshots
+
+
+class MoveLog(MoveLogInterface):
+    """
+    Unlimited undo/redo history of a Board. Each move is packed into one integer,
+    cell << 10 | old << 5 | new, and a board snapshot is kept every CHECKPOINT_EVERY moves
+    so goto() never replays more than that many moves.
+    """
+
+    def __init__(self, board, checkpoint_every=CHECKPOINT_EVERY):
+        """
+        Initialize the MoveLog with the current board as starting point.
+        :param board: The Board the moves are applied to
+        :param checkpoint_every: Moves between two snapshots (default is CHECKPOINT_EVERY)
+        """
+        self.board = board  # Board the moves are applied to
+        self.checkpoint_every = checkpoint_every  # Moves between two snapshots
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the history and make the current board the starting point.
+        """
+        self.moves = array('I')  # Packed moves, oldest first
+        self.position = 0  # Number of moves applied to the board; moves past it can be redone
+        self.checkpoints = [self.board.snapshot()]  # checkpoints[k] is the board after k * checkpoint_every moves
+
+    def record(self, row, col, value):
+        """
+        Write a value into a cell and log the move, dropping any moves that were undone.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :param value: The value to write, 0 to clear the cell
+        """
+        old = self.board.get(row, col)
+        if old == value:  # Nothing changes, keep the log short
+            return
+        del self.moves[self.position:]  # A new move ends the redo branch
+        del self.checkpoints[self.position // self.checkpoint_every + 1:]  # Snapshots of the dropped branch
+        self.board.set_cell(row, col, value)
+        self.moves.append((row * self.board.size + col) << 10 | old << 5 | value)
+        self.position += 1
+        if self.position % self.checkpoint_every == 0:  # Snapshot the board every checkpoint_every moves
+            self.checkpoints.append(self.board.snapshot())
+
+    def undo(self):
+        """
+        Take back the last move.
+        :return: (row, col, value) of the cell after the undo, or None if there is nothing to undo
+        """
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        return self._apply(self.moves[self.position], False)
+
+    def redo(self):
+        """
+        Play again the last move that was undone.
+        :return: (row, col, value) of the cell after the redo, or None if there is nothing to redo
+        """
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self._apply(self.moves[self.position - 1], True)
+
+    def goto(self, position):
+        """
+        Move the board to any point of the history. Restores the nearest snapshot at or before the
+        target when that is closer than the current position, then replays the moves in between.
+        :param position: Number of moves applied, from 0 (the starting point) to len(self.moves)
+        """
+        if not 0 <= position <= len(self.moves):
+            raise ValueError(f"History position out of range: {position}")
+        checkpoint = position // self.checkpoint_every  # Nearest snapshot at or before the target
+        start = checkpoint * self.checkpoint_every
+        if abs(position - self.position) > position - start:  # Replaying from the snapshot is shorter
+            self.board.restore(self.checkpoints[checkpoint])
+            self.position = start
+        while self.position < position:
+            self.redo()
+        while self.position > position:
+            self.undo()
+
+    def can_undo(self):
+        """
+        Check if there is a move to undo.
+        :return: True if undo() would change the board, False otherwise
+        """
+        return self.position > 0
+
+    def can_redo(self):
+        """
+        Check if there is a move to redo.
+        :return: True if redo() would change the board, False otherwise
+        """
+        return self.position < len(self.moves)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def _apply(self, move, forward):
+        """
+        Write the new value of a packed move (forward) or its old value (backward).
+        :return: (row, col, value) of the cell written
+        """
+        cell = move >> 10
+        value = move & 31 if forward else move >> 5 & 31
+        row, col = divmod(cell, self.board.size)
+        self.board.set_cell(row, col, value)
+        return row, col, value
@@ -0,0 +1,168 @@
+import mmap  # Import the mmap module
+import random  # Import the random module
+import struct  # Import the struct module
+from interface.PuzzleBankInterface import PuzzleBankInterface  # Import the PuzzleBankInterface class
+
+# File layout:
+#   header  magic, version, record size, then (first record, record count) per difficulty, padded to 64 bytes
+#   records fixed-size, grouped by difficulty: difficulty code, clue count, 81 cells packed two per byte,
+#           then (version 2) the 81 cells of the solution packed the same way, all zero when unknown
+MAGIC = b'SDKBANK\0'  # File signature
+VERSION = 2  # Format version written; version 1 files, without solutions, can still be read
+DIFFICULTIES = ('easy', 'medium', 'hard')  # Difficulty codes are positions in this tuple
+HEADER = struct.Struct('<8sHH' + 'II' * len(DIFFICULTIES))  # Header fields
+HEADER_SIZE = 64  # Header is padded so records start at a fixed offset
+PACKED_CELLS = 41  # 81 cells at 4 bits each, rounded up to whole bytes
+RECORD_SIZES = {1: 2 + PACKED_CELLS, 2: 2 + 2 * PACKED_CELLS}  # Record size of each format version
+RECORD_SIZE = RECORD_SIZES[VERSION]  # Difficulty code, clue count, packed puzzle and packed solution
+
+
+class PuzzleBank(PuzzleBankInterface):
+    """
+    Read-only puzzle bank mapped into memory. Looking up a puzzle reads a single
+    fixed-size record, so drawing a random puzzle costs a page read at most.
+    """
+
+    def __init__(self, path):
+        """
+        Open a puzzle bank file.
+        :param path: Path of the bank file
+        """
+        self.file = open(path, 'rb')  # Keep the file open for the lifetime of the map
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)  # Map the file read-only
+            fields = HEADER.unpack_from(self.map, 0)  # Read the header
+        except (ValueError, struct.error):  # Empty or truncated file
+            self.file.close()
+            raise ValueError(f"{path} is not a puzzle bank")
+        magic, version, record_size = fields[:3]
+        if magic != MAGIC or RECORD_SIZES.get(version) != record_size:  # Unknown format
+            self.close()
+            raise ValueError(f"{path} is not a version {' or '.join(map(str, RECORD_SIZES))} puzzle bank")
+        self.version = version  # Format version of the file
+        self.record_size = record_size  # Bytes per record
+        # Index per difficulty: (first record, record count)
+        self.index = {difficulty: (fields[3 + 2 * i], fields[4 + 2 * i]) for i, difficulty in enumerate(DIFFICULTIES)}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def count(self, difficulty):
+        """
+        Get the number of puzzles stored for a difficulty level.
+        :param difficulty: The difficulty level
+        :return: The number of puzzles, 0 for unknown difficulties
+        """
+        return self.index.get(difficulty, (0, 0))[1]
+
+    def get(self, difficulty, index):
+        """
+        Read one puzzle of a difficulty level.
+        :param difficulty: The difficulty level
+        :param index: The position of the puzzle within its difficulty
+        :return: 2D list representing the puzzle, 0 for empty cells
+        """
+        offset = self._offset(difficulty, index)
+        return self.unpack(self.map[offset:offset + PACKED_CELLS])
+
+    def get_solution(self, difficulty, index):
+        """
+        Read the solution stored with one puzzle of a difficulty level.
+        :param difficulty: The difficulty level
+        :param index: The position of the puzzle within its difficulty
+        :return: 2D list representing the solution, or None if the bank does not store it
+        """
+        offset = self._offset(difficulty, index) + PACKED_CELLS
+        if self.version < 2 or not any(self.map[offset:offset + PACKED_CELLS]):  # No solution recorded
+            return None
+        return self.unpack(self.map[offset:offset + PACKED_CELLS])
+
+    def random_puzzle(self, difficulty):
+        """
+        Read a random puzzle of a difficulty level.
+        :param difficulty: The difficulty level
+        :return: 2D list representing the puzzle, or None if there are no puzzles
+        """
+        entry = self.random_entry(difficulty)
+        return entry[0] if entry is not None else None
+
+    def random_entry(self, difficulty):
+        """
+        Read a random puzzle of a difficulty level together with its solution.
+        :param difficulty: The difficulty level
+        :return: Tuple (puzzle, solution or None) of 2D lists, or None if there are no puzzles
+        """
+        count = self.count(difficulty)
+        if count == 0:  # Nothing stored for this difficulty
+            return None
+        index = random.randrange(count)
+        return self.get(difficulty, index), self.get_solution(difficulty, index)
+
+    def _offset(self, difficulty, index):
+        """
+        Get the offset of the packed puzzle of a record.
+        :return: Byte offset in the file
+        """
+        first, count = self.index[difficulty]
+        if not 0 <= index < count:  # Out of range for this difficulty
+            raise IndexError(f"No {difficulty} puzzle at index {index}")
+        return HEADER_SIZE + (first + index) * self.record_size + 2  # Skip the metadata bytes
+
+    def close(self):
+        """
+        Release the memory map and the underlying file.
+        """
+        self.map.close()
+        self.file.close()
+
+    @staticmethod
+    def pack(grid):
+        """
+        Pack a grid into 41 bytes, two cells per byte with the first cell in the high nibble.
+        :param grid: 2D list representing a Sudoku grid
+        :return: The packed cells
+        """
+        cells = [value for row in grid for value in row] + [0]  # Pad to an even number of cells
+        return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, 82, 2))
+
+    @staticmethod
+    def unpack(packed):
+        """
+        Unpack 41 bytes into a grid.
+        :param packed: The packed cells
+        :return: 2D list representing the Sudoku grid
+        """
+        cells = []
+        for byte in packed:
+            cells.append(byte >> 4)
+            cells.append(byte & 0x0F)
+        return [cells[row * 9:row * 9 + 9] for row in range(9)]
+
+    @staticmethod
+    def write(path, puzzles):
+        """
+        Write a puzzle bank file.
+        :param path: Path of the bank file
+        :param puzzles: Iterable of (difficulty, grid) or (difficulty, grid, solution) tuples, grids being 2D lists
+        :return: Dictionary with the number of puzzles written per difficulty
+        """
+        records = {difficulty: bytearray() for difficulty in DIFFICULTIES}  # Packed records per difficulty
+        for difficulty, grid, *solution in puzzles:
+            clues = sum(1 for row in grid for value in row if value)
+            packed_solution = PuzzleBank.pack(solution[0]) if solution and solution[0] else bytes(PACKED_CELLS)
+            records[difficulty] += bytes((DIFFICULTIES.index(difficulty), clues)) + PuzzleBank.pack(grid) + packed_solution
+
+        index = []
+        first = 0
+        for difficulty in DIFFICULTIES:  # Records are stored grouped by difficulty
+            count = len(records[difficulty]) // RECORD_SIZE
+            index += [first, count]
+            first += count
+        with open(path, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE, *index).ljust(HEADER_SIZE, b'\0'))
+            for difficulty in DIFFICULTIES:
+                out.write(records[difficulty])
+        return {difficulty: len(records[difficulty]) // RECORD_SIZE for difficulty in DIFFICULTIES}
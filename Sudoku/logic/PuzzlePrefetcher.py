@@ -0,0 +1,97 @@
+import queue  # Import the queue module
+import threading  # Import the threading module
+from logic.Generator import Generator, SIZE_LEVELS  # Import the Generator class and the levels of each size
+from interface.PuzzlePrefetcherInterface import PuzzlePrefetcherInterface  # Import the PuzzlePrefetcherInterface class
+
+
+class PuzzlePrefetcher(PuzzlePrefetcherInterface):
+    """
+    Keeps a small bounded queue of ready puzzles per difficulty, filled by a background thread,
+    so starting a game does not have to wait for generation.
+    """
+
+    def __init__(self, difficulties=None, size=3, board_size=9):
+        """
+        Initialize the PuzzlePrefetcher.
+        :param difficulties: The difficulty levels to prefetch (default is every level of SIZE_LEVELS[board_size])
+        :param size: The maximum number of ready puzzles per difficulty (default is 3)
+        :param board_size: Board size of the puzzles, 9, 16 or 25 (default is 9)
+        """
+        self.board_size = board_size  # Board size of the generated puzzles
+        if difficulties is None:
+            difficulties = SIZE_LEVELS[board_size]  # Levels this board size can generate quickly
+        self.queues = {difficulty: queue.Queue(maxsize=size) for difficulty in difficulties}  # Ready puzzles
+        self.hits = 0  # Puzzles served from a queue
+        self.misses = 0  # Puzzles generated synchronously because the queue was empty
+        self.wake = threading.Event()  # Set when a puzzle is taken so the worker refills
+        self.stopped = threading.Event()  # Set to stop the worker
+        self.thread = threading.Thread(target=self.run, name="PuzzlePrefetcher", daemon=True)
+
+    def start(self):
+        """
+        Start the background worker that keeps the puzzle queues filled.
+        """
+        self.thread.start()
+
+    def run(self):
+        """
+        Worker loop: top up every queue that is not full, then sleep until a puzzle is taken.
+        """
+        generator = Generator(size=self.board_size, mode='transform')  # The worker has its own generator and solver
+        while not self.stopped.is_set():
+            self.wake.clear()  # Clear before checking so a get() during the pass is not missed
+            filled = False
+            for difficulty, ready in self.queues.items():
+                if self.stopped.is_set():
+                    return
+                if not ready.full():
+                    puzzle = generator.generate(difficulty)
+                    ready.put((puzzle, generator.last_solution))  # Only this thread puts, so this never blocks
+                    filled = True
+            if not filled:  # Every queue is full
+                self.wake.wait()
+
+    def get(self, difficulty):
+        """
+        Take a ready puzzle from the queue, generating one synchronously if the queue is empty.
+        :param difficulty: The difficulty level
+        :return: 2D list representing the puzzle, 0 for empty cells
+        """
+        return self.get_with_solution(difficulty)[0]
+
+    def get_with_solution(self, difficulty):
+        """
+        Take a ready puzzle and its solution from the queue, generating them synchronously if the queue is empty.
+        :param difficulty: The difficulty level
+        :return: Tuple (puzzle, solution) of 2D lists
+        """
+        ready = self.queues.get(difficulty)
+        try:
+            if ready is None:  # Difficulty not prefetched
+                raise queue.Empty
+            entry = ready.get_nowait()  # Never block the caller
+            self.hits += 1
+        except queue.Empty:
+            self.misses += 1
+            generator = Generator(size=self.board_size, mode='transform')  # Fall back to synchronous generation
+            entry = generator.generate(difficulty), generator.last_solution
+        self.wake.set()  # Let the worker refill
+        return entry
+
+    def stats(self):
+        """
+        Get the queue hit and miss counters.
+        :return: Dictionary with hits, misses and the number of puzzles queued per difficulty
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'queued': {difficulty: ready.qsize() for difficulty, ready in self.queues.items()},
+        }
+
+    def stop(self):
+        """
+        Stop the background worker. A puzzle being generated is finished first.
+        """
+        self.stopped.set()
+        self.wake.set()  # Wake the worker so it sees the stop flag
@@ -0,0 +1,138 @@
+import json  # Import the json module
+import os  # Import the os module
+import socket  # Import the socket module
+import tempfile  # Import the tempfile module
+from math import isqrt  # Import the integer square root function
+from logic.Geometry import SYMBOLS  # Import the value characters
+from interface.ServiceClientInterface import ServiceClientInterface  # Import the ServiceClientInterface class
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'sudoku.sock')  # Socket the service listens on by default
+
+
+class ServiceClient(ServiceClientInterface):
+    """
+    Blocking client of the solver service (service.py). Requests and responses are JSON objects, one per line;
+    boards travel as strings of one character per cell (Generator.encode), '0' for empty cells.
+    Only the standard library and Geometry are imported, so clients start without loading the solvers.
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET, timeout=None):
+        """
+        Connect to the service.
+        :param path: Path of the service's Unix domain socket (default is DEFAULT_SOCKET)
+        :param timeout: Socket timeout in seconds (default is None, wait forever)
+        """
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.reader = self.sock.makefile('r', encoding='utf-8')  # Buffered line reader
+        self.next_id = 0  # Id of the next request
+
+    def request(self, op, **fields):
+        """
+        Send one request and wait for its response.
+        :param op: The operation, 'solve', 'count', 'validate', 'generate' or 'stats'
+        :param fields: The operation's arguments
+        :return: Dictionary of the response
+        """
+        return self.many([dict(fields, op=op)])[0]
+
+    def many(self, requests):
+        """
+        Send several requests at once and wait for every response, so the service can batch them.
+        :param requests: List of request dictionaries, each with an 'op' key
+        :return: List of response dictionaries, in request order
+        :raises RuntimeError: If the service reports an error for any request
+        """
+        ids = []
+        lines = []
+        for request in requests:
+            self.next_id += 1
+            ids.append(self.next_id)
+            lines.append(json.dumps(dict(request, id=self.next_id)) + '\n')
+        self.sock.sendall(''.join(lines).encode('utf-8'))
+
+        responses = {}
+        while len(responses) < len(ids):  # Responses arrive in completion order
+            line = self.reader.readline()
+            if not line:
+                raise ConnectionError("The service closed the connection")
+            response = json.loads(line)
+            responses[response.get('id')] = response
+        results = [responses[request_id] for request_id in ids]
+        for response in results:
+            if not response.get('ok'):
+                raise RuntimeError(f"Service error: {response.get('error')}")
+        return results
+
+    def solve(self, puzzle):
+        """
+        Solve a puzzle.
+        :param puzzle: 2D list or encoded string of the puzzle
+        :return: 2D list representing the solution, or None if the puzzle has no solution
+        """
+        solution = self.request('solve', puzzle=self._encode(puzzle))['solution']
+        return self._decode(solution) if solution is not None else None
+
+    def count(self, puzzle, limit=2):
+        """
+        Count the solutions of a puzzle.
+        :param puzzle: 2D list or encoded string of the puzzle
+        :param limit: Number of solutions after which the search stops (default is 2)
+        :return: Number of solutions, at most limit
+        """
+        return self.request('count', puzzle=self._encode(puzzle), limit=limit)['count']
+
+    def validate(self, board):
+        """
+        Find the cells whose digit is repeated in a row, column or box.
+        :param board: 2D list or encoded string of the board
+        :return: List of (row, col) tuples of the conflicting cells, empty if the board is consistent
+        """
+        return [tuple(cell) for cell in self.request('validate', puzzle=self._encode(board))['conflicts']]
+
+    def generate(self, difficulty, size=9):
+        """
+        Generate a puzzle with a unique solution.
+        :param difficulty: The difficulty level ('easy', 'medium' or 'hard')
+        :param size: Board size, 9, 16 or 25 (default is 9)
+        :return: Tuple (puzzle, solution) of 2D lists
+        """
+        response = self.request('generate', difficulty=difficulty, size=size)
+        return self._decode(response['puzzle']), self._decode(response['solution'])
+
+    def stats(self):
+        """
+        Get the service counters.
+        :return: Dictionary with queue depth, latency percentiles in milliseconds and throughput
+        """
+        return self.request('stats')['stats']
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _encode(board):
+        """
+        Encode a 2D list for the wire, leaving strings as they are.
+        """
+        return board if isinstance(board, str) else ''.join(SYMBOLS[value] for row in board for value in row)
+
+    @staticmethod
+    def _decode(text):
+        """
+        Decode a board from the wire into a 2D list.
+        """
+        values = [SYMBOLS.index(char) for char in text]
+        size = isqrt(len(values))
+        return [values[row * size:row * size + size] for row in range(size)]
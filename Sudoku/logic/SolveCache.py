@@ -0,0 +1,76 @@
+from collections import OrderedDict  # Import the OrderedDict class
+from interface.SolveCacheInterface import SolveCacheInterface  # Import the SolveCacheInterface class
+
+DEFAULT_CAPACITY = 1024  # Entries kept by default
+
+
+class SolveCache(SolveCacheInterface):
+    """
+    Bounded least-recently-used cache of solver results, keyed by the canonical form of a grid from Symmetry.
+    Each entry is a dictionary with the first 'solution' found (flat values in canonical space, or None),
+    the number of solutions 'count' and the 'limit' the count was capped at.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Initialize the SolveCache.
+        :param capacity: Maximum number of entries (default is DEFAULT_CAPACITY)
+        """
+        if capacity < 1:
+            raise ValueError(f"Cache capacity must be positive: {capacity}")
+        self.capacity = capacity  # Maximum number of entries
+        self.entries = OrderedDict()  # Entries from least to most recently used
+        self.hits = 0  # Lookups that found an entry
+        self.misses = 0  # Lookups that found none
+        self.evictions = 0  # Entries dropped to make room
+
+    def get(self, key):
+        """
+        Look up the entry of a canonical grid and mark it as recently used.
+        :param key: The canonical grid as bytes
+        :return: The entry, or None on a miss
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)  # Most recently used
+        return entry
+
+    def put(self, key, entry):
+        """
+        Store the entry of a canonical grid, evicting the least recently used entry when full.
+        :param key: The canonical grid as bytes
+        :param entry: The entry to store
+        """
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)  # Least recently used
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Get the cache counters.
+        :return: Dictionary with hits, misses, evictions, size, capacity and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'capacity': self.capacity,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """
+        Drop every entry and reset the counters.
+        """
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
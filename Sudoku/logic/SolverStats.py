@@ -0,0 +1,41 @@
+class SolverStats:
+    """
+    Search counters for one solver call, or totals over many calls.
+    """
+    __slots__ = ('calls', 'nodes', 'backtracks', 'max_depth', 'is_valid_calls', 'wall_time')
+    FIELDS = __slots__
+
+    def __init__(self):
+        """
+        Initialize every counter to zero.
+        """
+        self.calls = 0  # Number of solver calls
+        self.nodes = 0  # Search nodes visited
+        self.backtracks = 0  # Dead ends reached, where a cell or constraint had no option left
+        self.max_depth = 0  # Deepest branching level reached
+        self.is_valid_calls = 0  # Calls to Solver.is_valid (reference mode only)
+        self.wall_time = 0.0  # Seconds spent in the solver
+
+    def merge(self, other):
+        """
+        Add another set of counters to this one; max_depth keeps the maximum.
+        :param other: A SolverStats or a dictionary from as_dict()
+        :return: This SolverStats
+        """
+        values = other if isinstance(other, dict) else other.as_dict()
+        for field in self.FIELDS:
+            if field == 'max_depth':
+                self.max_depth = max(self.max_depth, values[field])
+            else:
+                setattr(self, field, getattr(self, field) + values[field])
+        return self
+
+    def as_dict(self):
+        """
+        Get the counters as a dictionary.
+        :return: Dictionary of counter values
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return "SolverStats(" + ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS) + ")"
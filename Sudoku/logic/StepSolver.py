@@ -0,0 +1,174 @@
+import threading  # Import the threading module
+import time  # Import the time module
+from logic.BitmaskSolver import BitmaskSolver  # Import the BitmaskSolver class for its propagate and undo helpers
+from logic.Geometry import Geometry  # Import the Geometry class
+from interface.StepSolverInterface import StepSolverInterface  # Import the StepSolverInterface class
+
+STATUSES = ('running', 'solved', 'no-solution', 'cancelled')  # Possible values of StepSolver.status
+
+
+class StepSolver(StepSolverInterface):
+    """
+    Resumable version of the BitmaskSolver search. The recursion is replaced by an explicit stack of
+    branching frames, so the search can stop after a node or time budget and pick up where it left off.
+    """
+
+    def __init__(self, board, limit=1, cancel=None):
+        """
+        Initialize the StepSolver. The board is copied, so it can change while the search runs.
+        :param board: 2D list representing the Sudoku board
+        :param limit: Number of solutions after which the search stops (default is 1)
+        :param cancel: threading.Event used as cancellation token (default is a new Event)
+        """
+        self.geometry = Geometry.of(len(board))  # Index tables for this board size
+        self.limit = limit  # Solutions to find before stopping
+        self.cancel_token = cancel if cancel is not None else threading.Event()  # Set to stop the search
+        self.cells = [value for row in board for value in row]  # Flat cell values, changed by the search
+        self.masks = [0] * self.geometry.cells  # Candidates of each empty cell from the last propagation pass
+        self.rows = [0] * self.geometry.size  # Digits used in each row
+        self.cols = [0] * self.geometry.size  # Digits used in each column
+        self.boxes = [0] * self.geometry.size  # Digits used in each box
+        self.stack = []  # Branching frames: [cell, untried candidates, cells placed by propagation, empty cells]
+        self.solutions = []  # Solutions found, each a flat list of values
+        self.nodes = 0  # Search nodes visited
+        self.elapsed = 0.0  # Seconds spent in step()
+        self.started = False  # Whether the root node has been expanded
+        self.status = 'running'  # One of STATUSES
+
+        for i, value in enumerate(self.cells):  # Register the givens
+            if value:
+                bit = 1 << value
+                r, c, b = self.geometry.row_of[i], self.geometry.col_of[i], self.geometry.box_of[i]
+                if (self.rows[r] | self.cols[c] | self.boxes[b]) & bit:  # The givens already conflict
+                    self.status = 'no-solution'
+                    return
+                self.rows[r] |= bit
+                self.cols[c] |= bit
+                self.boxes[b] |= bit
+
+    def step(self, max_nodes=None, max_time=None):
+        """
+        Continue the search until it finishes, is cancelled or a budget runs out.
+        :param max_nodes: Search nodes to visit before pausing (default is None, no limit)
+        :param max_time: Seconds to run before pausing (default is None, no limit)
+        :return: The status, 'running' if the search paused
+        """
+        if self.status != 'running':  # Already finished
+            return self.status
+        started = time.perf_counter()
+        deadline = started + max_time if max_time is not None else None
+        node_limit = self.nodes + max_nodes if max_nodes is not None else None
+        try:
+            if not self.started:  # Expand the root node
+                self.started = True
+                empties = [i for i in range(self.geometry.cells) if self.cells[i] == 0]
+                self._expand(empties)
+            stack = self.stack
+            while stack:
+                if self.cancel_token.is_set():  # Stop at the next node boundary
+                    self.status = 'cancelled'
+                    return self.status
+                if node_limit is not None and self.nodes >= node_limit:  # Node budget spent
+                    return self.status
+                if deadline is not None and time.perf_counter() >= deadline:  # Time budget spent
+                    return self.status
+
+                frame = stack[-1]
+                cell, mask, trail, empties = frame
+                if self.cells[cell]:  # Take back the candidate tried last
+                    self._set(cell, 0)
+                if not mask or len(self.solutions) >= self.limit:  # Frame exhausted, backtrack
+                    stack.pop()
+                    BitmaskSolver.undo(self.geometry, self.cells, self.rows, self.cols, self.boxes, trail)
+                    continue
+                bit = mask & -mask  # Try the next candidate
+                frame[1] = mask ^ bit
+                self._set(cell, bit.bit_length() - 1)
+                self._expand(empties)
+            self.status = 'solved' if self.solutions else 'no-solution'
+            return self.status
+        finally:
+            self.elapsed += time.perf_counter() - started
+
+    def iterate(self, max_nodes=None, max_time=None):
+        """
+        Run the search in slices, yielding progress after each one until the search stops.
+        :param max_nodes: Search nodes per slice (default is None, no limit)
+        :param max_time: Seconds per slice (default is None, no limit)
+        :return: Generator of progress dictionaries, the last one with the final status
+        """
+        while True:
+            status = self.step(max_nodes, max_time)
+            yield self.progress()
+            if status != 'running':
+                return
+
+    def cancel(self):
+        """
+        Cancel the search; the next step returns 'cancelled'.
+        """
+        self.cancel_token.set()
+
+    def progress(self):
+        """
+        Get the progress of the search.
+        :return: Dictionary with status, nodes, depth, filled cells, solutions and elapsed seconds
+        """
+        return {
+            'status': self.status,
+            'nodes': self.nodes,
+            'depth': len(self.stack),
+            'filled': sum(1 for value in self.cells if value),
+            'solutions': len(self.solutions),
+            'elapsed': self.elapsed,
+        }
+
+    def values(self):
+        """
+        Get the current partial assignment of the search, for example to animate it.
+        :return: 2D list of the cells filled so far, 0 for empty cells
+        """
+        size = self.geometry.size
+        return [self.cells[row * size:row * size + size] for row in range(size)]
+
+    def solution(self):
+        """
+        Get the first solution found.
+        :return: 2D list representing the solution, or None if none was found
+        """
+        if not self.solutions:
+            return None
+        size = self.geometry.size
+        return [self.solutions[0][row * size:row * size + size] for row in range(size)]
+
+    def _set(self, i, value):
+        """
+        Place a value in a cell, or clear it with value 0, keeping the unit bitmasks in step.
+        """
+        old = self.cells[i]
+        bit = 1 << (value or old)
+        self.rows[self.geometry.row_of[i]] ^= bit
+        self.cols[self.geometry.col_of[i]] ^= bit
+        self.boxes[self.geometry.box_of[i]] ^= bit
+        self.cells[i] = value
+        self.masks[i] = 0
+
+    def _expand(self, empties):
+        """
+        Visit a search node: propagate singles, then push a frame for the most constrained cell.
+        Dead ends and solutions are undone right away and push nothing.
+        :param empties: Empty cells at this node
+        """
+        self.nodes += 1
+        geometry = self.geometry
+        cells, rows, cols, boxes = self.cells, self.rows, self.cols, self.boxes
+        trail = []  # Cells filled by propagation at this node
+        found = BitmaskSolver.propagate(geometry, cells, self.masks, rows, cols, boxes, empties, trail)
+        if found is None:  # Dead end, propagation is already undone
+            return
+        best, best_mask = found
+        if best < 0:  # Every cell is filled
+            self.solutions.append(cells[:])
+            BitmaskSolver.undo(geometry, cells, rows, cols, boxes, trail)
+            return
+        self.stack.append([best, best_mask, trail, [i for i in empties if not cells[i]]])
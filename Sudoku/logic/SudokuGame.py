@@ -1,17 +1,29 @@
 from logic.Board import Board  # Import the Board class
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.Generator import Generator, SIZE_LEVELS  # Import the Generator class and the levels of each size
+from logic.LogicalSolver import LogicalSolver  # Import the LogicalSolver class
+from logic.MoveLog import MoveLog  # Import the MoveLog class
 from logic.Solver import Solver  # Import the Solver class
+from logic.PuzzleBank import PuzzleBank  # Import the PuzzleBank class
 from interface.SudokuGameInterface import SudokuGameInterface  # Import the SudokuGameInterface class
 
 
 class SudokuGame(SudokuGameInterface):  # Define the SudokuGame class inheriting from SudokuGameInterface
-    def __init__(self):
+    def __init__(self, bank_path=None, size=9):
         """
         Initialize the Sudoku game.
+        :param bank_path: Path of a puzzle bank to draw puzzles from (default is None, always generate)
+        :param size: Number of rows, columns, boxes and digits, 9, 16 or 25 (default is 9)
         """
         try:
-            self.board = Board()  # Create an instance of the Board class
-            self.solver = Solver()  # Create an instance of the Solver class
-            self.difficulty = 36  # Set the default difficulty level
+            self.size = size  # Board size
+            self.board = Board(size)  # Create an instance of the Board class
+            self.moves = MoveLog(self.board)  # Undo/redo history of the player's moves
+            self.solver = Solver.for_size(size)  # Create a Solver with the engine suited to the board size
+            self.checker = ConflictChecker(size)  # Validates the board in a single pass
+            levels = SIZE_LEVELS[size]  # Difficulty levels offered on this board size
+            self.difficulty = 'medium' if 'medium' in levels else levels[-1]  # Set the default difficulty level
+            self.bank = PuzzleBank(bank_path) if bank_path else None  # Open the puzzle bank if one is given
         except Exception as e:
             print(f"Error initializing the game: {e}")
 
@@ -22,7 +34,8 @@ class SudokuGame(SudokuGameInterface):  # Define the SudokuGame class inheriting
         try:
             self.board.reset_board()  # Reset the board to an empty state
             self.board.fill_grid()  # Fill the board with a valid solution
-            self.board.remove_numbers(self.difficulty)  # Remove numbers to create the puzzle
+            self.board.remove_numbers(self.cells_to_remove())  # Remove numbers to create the puzzle
+            self.moves.reset()  # The new puzzle is the start of the history
         except Exception as e:
             print(f"Error starting the game: {e}")
 
@@ -35,77 +48,176 @@ class SudokuGame(SudokuGameInterface):  # Define the SudokuGame class inheriting
         :return: True if the move is valid, False otherwise
         """
         try:
-            if self.board.grid[row][col].is_fixed():  # Check if the cell is fixed (pre-filled and cannot be changed)
+            if self.board.is_fixed(row, col):  # Check if the cell is fixed (pre-filled and cannot be changed)
                 return False  # Return False if the cell is fixed
-            if not self.solver.is_valid(self.board.get_values(), value, (row, col)):  # Check if the move is valid according to Sudoku rules
+            if not self.board.is_move_legal(row, col, value):  # Check if the move is valid according to Sudoku rules
                 return False  # Return False if the move is not valid
-            self.board.grid[row][col].value = value  # Place the number on the board if valid
+            self.moves.record(row, col, value)  # Place the number on the board and log it
             return True  # Return True if the move is valid
         except Exception as e:
             print(f"Error checking move at ({row}, {col}) with value {value}: {e}")
             return False
 
-    def solve_game(self):
+    def solve_game(self, collect_stats=False):
         """
         Solves the current state of the Sudoku board.
+        :param collect_stats: Whether to collect search statistics for the solve (default is False)
+        :return: SolverStats of the solve, or None when not collected
         """
         try:
             temp_board = self.board.get_values()  # Get the current board values
-            self.solver.solve(temp_board)  # Solve the board
+            if collect_stats:
+                with self.solver.collect_stats():
+                    self.solver.solve(temp_board)  # Solve the board, counting the search
+            else:
+                self.solver.solve(temp_board)  # Solve the board
             self.board.set_values(temp_board)  # Set the board with the solved values
+            self.moves.reset()  # The solved board is the new start of the history
+            return self.solver.stats if collect_stats else None
         except Exception as e:
             print(f"Error solving the game: {e}")
+            return None
+
+    def start_solve(self, cancel=None):
+        """
+        Start solving the current board without blocking; advance it with step() on the returned solver.
+        :param cancel: threading.Event used as cancellation token (default is a new Event)
+        :return: StepSolver working on a copy of the board
+        """
+        return self.solver.step_solver(self.board.get_values(), cancel=cancel)
+
+    def finish_solve(self, step_solver):
+        """
+        Copy the solution of a finished resumable solve onto the board.
+        :param step_solver: The StepSolver returned by start_solve
+        :return: True if a solution was applied, False if the solve is unfinished, cancelled or found none
+        """
+        solution = step_solver.solution() if step_solver.status == 'solved' else None
+        if solution is None:
+            return False
+        self.board.set_values(solution)  # Set the board with the solved values
+        self.moves.reset()  # The solved board is the new start of the history
+        return True
+
+    def undo_move(self):
+        """
+        Take back the last move of the player.
+        :return: (row, col, value) of the cell after the undo, or None if there is nothing to undo
+        """
+        return self.moves.undo()
+
+    def redo_move(self):
+        """
+        Play again the last move that was undone.
+        :return: (row, col, value) of the cell after the redo, or None if there is nothing to redo
+        """
+        return self.moves.redo()
+
+    def hint(self):
+        """
+        Suggest the next cell to fill. A wrong entry is pointed out first; otherwise the next cell the
+        logical techniques can deduce is given with the reason (9x9 boards only), and the stored solution
+        fills in when the techniques are stuck.
+        :return: Dictionary with 'row', 'col', 'value', 'technique' and 'reason', or None if the board is full
+        """
+        try:
+            wrong = self.wrong_entries()
+            if wrong:  # Fix mistakes before deducing anything from them
+                row, col = wrong[0]
+                return {'row': row, 'col': col, 'value': self.board.solution[row * self.size + col],
+                        'technique': 'mistake', 'reason': f"The entry at row {row + 1}, column {col + 1} is wrong"}
+            if self.size == 9:  # The logical techniques are written for 9x9 boards
+                step = LogicalSolver().next_step(self.board.get_values())
+                if step is not None:
+                    return step
+            solution = self._solution()
+            for i, value in enumerate(self.board.values):
+                if value == 0:  # First empty cell, straight from the solution
+                    row, col = divmod(i, self.size)
+                    return {'row': row, 'col': col, 'value': solution[i], 'technique': 'solution',
+                            'reason': "No simple deduction is left, this value comes from the solution"}
+            return None
+        except Exception as e:
+            print(f"Error finding a hint: {e}")
+            return None
+
+    def is_entry_wrong(self, row, col):
+        """
+        Check an entry against the stored solution, without any search.
+        :param row: The row index of the cell
+        :param col: The column index of the cell
+        :return: True if the cell holds a wrong value, False if it is empty, right or the puzzle has no solution
+        """
+        try:
+            self._solution()  # Make sure a solution is stored
+            return self.board.is_wrong(row, col)
+        except Exception as e:
+            print(f"Error checking the entry at ({row}, {col}): {e}")
+            return False
+
+    def wrong_entries(self):
+        """
+        Find every entry that differs from the stored solution.
+        :return: List of (row, col) positions of the wrong entries, empty if the puzzle has no solution
+        """
+        try:
+            solution = self._solution()
+            return [divmod(i, self.size) for i, value in enumerate(self.board.values)
+                    if value and value != solution[i]]
+        except Exception as e:
+            print(f"Error finding wrong entries: {e}")
+            return []
+
+    def _solution(self):
+        """
+        Get the stored solution of the puzzle, solving the clues once if the puzzle came without one.
+        :return: The solution as size * size bytes
+        """
+        if self.board.solution is None:  # Older bank records and hand-loaded puzzles
+            clues = self.board.clues()
+            if not self.solver.solve(clues):
+                raise ValueError("The puzzle has no solution")
+            self.board.solution = bytes(value for row in clues for value in row)
+        return self.board.solution
 
     def set_difficulty(self, difficulty):
         """
         Sets the game difficulty.
-        :param difficulty: The difficulty level to set
+        :param difficulty: The difficulty level to set, one of SIZE_LEVELS[self.size]
         """
         try:
+            if difficulty not in SIZE_LEVELS[self.size]:  # Bank lookups and clue counts both need a level offered on the size
+                raise ValueError(f"Unknown difficulty for {self.size}x{self.size} boards: {difficulty}")
             self.difficulty = difficulty  # Assign the difficulty value
         except Exception as e:
             print(f"Error setting difficulty: {e}")
 
     def generate_puzzle(self):
         """
-        Generates a new puzzle.
+        Generates a new puzzle, drawing it from the puzzle bank when it has one for the current difficulty.
         """
         try:
-            self.board.fill_grid()  # Fill the board with a valid solution
-            self.board.remove_numbers(self.difficulty)  # Remove numbers to create the puzzle based on difficulty
+            if self.bank is None or not self.board.load_from_bank(self.bank, self.difficulty):  # Bank miss
+                self.board.fill_grid()  # Fill the board with a valid solution
+                self.board.remove_numbers(self.cells_to_remove())  # Remove numbers to create the puzzle based on difficulty
+            self.moves.reset()  # The new puzzle is the start of the history
         except Exception as e:
             print(f"Error generating puzzle: {e}")
 
+    def cells_to_remove(self):
+        """
+        Pick how many cells to empty for the current difficulty, from its clue range in Generator.clues_for.
+        :return: The number of cells to remove
+        """
+        return self.board.geometry.cells - Generator(size=self.size).clues_for(self.difficulty)
+
     def is_solution_correct(self):
         """
         Checks if the entire board is correctly solved.
         :return: True if the board is solved correctly, False otherwise
         """
         try:
-            # Check each row for duplicates
-            for row in self.board.grid:  # Iterate through each row
-                if len(set(cell.value for cell in row if cell.value != 0)) != 9:  # Check if the row has all unique numbers from 1-9
-                    return False  # Return False if there are duplicates
-
-            # Check each column for duplicates
-            for col in range(9):  # Iterate through each column index
-                col_values = [self.board.grid[row][col].value for row in range(9) if self.board.grid[row][col].value != 0]  # Collect values in the column
-                if len(set(col_values)) != 9:  # Check if the column has all unique numbers from 1-9
-                    return False  # Return False if there are duplicates
-
-            # Check each 3x3 square for duplicates
-            for start_row in range(0, 9, 3):  # Iterate through each 3x3 square starting row index
-                for start_col in range(0, 9, 3):  # Iterate through each 3x3 square starting column index
-                    block_values = []  # Initialize an empty list for block values
-                    for row in range(start_row, start_row + 3):  # Iterate through each row in the 3x3 square
-                        for col in range(start_col, start_col + 3):  # Iterate through each column in the 3x3 square
-                            cell_value = self.board.grid[row][col].value  # Get the cell value
-                            if cell_value != 0:  # If the cell is not empty
-                                block_values.append(cell_value)  # Add the value to the block values list
-                    if len(set(block_values)) != 9:  # Check if the 3x3 square has all unique numbers from 1-9
-                        return False  # Return False if there are duplicates
-
-            return True  # Return True if no duplicates are found in rows, columns, and 3x3 squares
+            return self.checker.is_solution(self.board.values)  # One pass over the board buffer
         except Exception as e:
             print(f"Error checking if the solution is correct: {e}")
             return False
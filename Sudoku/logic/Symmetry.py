@@ -0,0 +1,198 @@
+from itertools import permutations, product  # Import the permutations and product functions
+from math import factorial  # Import the factorial function
+from logic.Geometry import Geometry  # Import the Geometry class
+from interface.SymmetryInterface import SymmetryInterface  # Import the SymmetryInterface class
+
+MAX_CANDIDATES = 2000  # Partial transforms kept per row of the search; past it the form may not be canonical
+FULL_GROUP_SIZES = (9,)  # Sizes searched over every symmetry, larger boards only over transposition and relabeling
+
+
+class Symmetry(SymmetryInterface):
+    """
+    Canonical form of a grid under the Sudoku symmetries: digit relabeling, row and column permutations
+    within bands and stacks, band and stack permutations, and transposition.
+
+    The canonical grid is the smallest one, row by row, when digits are renamed 1, 2, 3... in reading
+    order and empty cells sort after every digit, among the transforms whose first row is a row that
+    leaves the fewest column orders open. It is built one row at a time, keeping only the partial
+    transforms that produce the smallest rows so far.
+
+    A transform is a tuple (transposed, rows, cols, labels): canonical cell (k, j) holds
+    labels[source[rows[k]][cols[j]]], source being the grid or its transpose.
+    """
+
+    _cache = {}  # Symmetry of each size built so far
+
+    def __init__(self, size):
+        """
+        Initialize the Symmetry. Use Symmetry.of(size) to share it between callers.
+        :param size: Number of rows, columns, boxes and digits
+        """
+        self.geometry = Geometry.of(size)  # Board size and box layout
+        self.full_group = size in FULL_GROUP_SIZES  # Whether bands and stacks are permuted
+
+    @classmethod
+    def of(cls, size):
+        """
+        Get the shared Symmetry of a board size.
+        :param size: Number of rows, columns, boxes and digits
+        :return: The Symmetry
+        """
+        symmetry = cls._cache.get(size)
+        if symmetry is None:  # First board of this size
+            symmetry = cls._cache[size] = cls(size)
+        return symmetry
+
+    def canonical(self, board):
+        """
+        Find the canonical form of a grid and the transform that produces it.
+        :param board: 2D list representing the Sudoku board, 0 for empty cells
+        :return: Tuple (key, transform), key being the canonical grid as size * size bytes
+        """
+        size = self.geometry.size
+        empty = size + 1  # Rank of an empty cell, after every digit
+        cells = [value for row in board for value in row]
+        sources = (cells, [cells[col * size + row] for row in range(size) for col in range(size)])
+
+        # Each candidate: (transposed, rows placed, cols, labels, next label, rows allowed next or None)
+        candidates = self._first_rows(sources)
+        for _ in range(size):  # Place one row per pass
+            best = None
+            survivors = []
+            for transposed, rows, cols, labels, next_label, allowed in candidates:
+                source = sources[transposed]
+                for row in allowed if allowed is not None else self._next_rows(rows):
+                    encoded = []  # Ranks of the row under this transform
+                    added = {}  # Labels given to digits first met in this row
+                    label = next_label
+                    for col in cols:
+                        value = source[row * size + col]
+                        if value == 0:
+                            encoded.append(empty)
+                        elif value in labels:
+                            encoded.append(labels[value])
+                        elif value in added:
+                            encoded.append(added[value])
+                        else:
+                            added[value] = label
+                            encoded.append(label)
+                            label += 1
+                    if best is None or encoded < best:  # A smaller row, drop the previous candidates
+                        best = encoded
+                        survivors = []
+                    if encoded == best and len(survivors) < MAX_CANDIDATES:
+                        survivors.append((transposed, rows, cols, labels, added, label, row))
+            candidates = [(transposed, rows + [row], cols, {**labels, **added} if added else labels, label, None)
+                          for transposed, rows, cols, labels, added, label, row in survivors]
+
+        transposed, rows, cols, labels, next_label, _ = candidates[0]
+        table = [0] * (size + 1)  # labels as a list, digits missing from the grid take the remaining labels
+        for digit in range(1, size + 1):
+            if digit in labels:
+                table[digit] = labels[digit]
+            else:
+                table[digit] = next_label
+                next_label += 1
+        source = sources[transposed]
+        key = bytes(table[source[row * size + col]] for row in rows for col in cols)
+        return key, (transposed, tuple(rows), tuple(cols), tuple(table))
+
+    def to_canonical(self, board, transform):
+        """
+        Apply a transform to a grid.
+        :param board: 2D list representing the grid
+        :param transform: Transform from canonical()
+        :return: 2D list representing the transformed grid
+        """
+        transposed, rows, cols, labels = transform
+        if transposed:
+            return [[labels[board[col][row]] for col in cols] for row in rows]
+        return [[labels[board[row][col]] for col in cols] for row in rows]
+
+    def from_canonical(self, cells, transform):
+        """
+        Map a grid in canonical space, such as a cached solution, back through the inverse of a transform.
+        :param cells: Flat row-major sequence of the canonical grid values
+        :param transform: Transform from canonical()
+        :return: 2D list representing the grid in the original space
+        """
+        size = self.geometry.size
+        transposed, rows, cols, labels = transform
+        inverse = [0] * (size + 1)  # Original digit of each label
+        for digit, label in enumerate(labels):
+            inverse[label] = digit
+        board = [[0] * size for _ in range(size)]
+        for k, row in enumerate(rows):
+            for j, col in enumerate(cols):
+                value = inverse[cells[k * size + j]]
+                if transposed:
+                    board[col][row] = value
+                else:
+                    board[row][col] = value
+        return board
+
+    def _first_rows(self, sources):
+        """
+        Start the search: pick the rows whose clue pattern leaves the fewest column orders open once its
+        clues are packed to the left, and every column order that packs them. Digits of a row are distinct,
+        so only the clue positions matter here.
+        :return: List of candidates (transposed, rows, cols, labels, next label, rows allowed first)
+        """
+        geometry = self.geometry
+        size, box = geometry.size, geometry.box
+        if not self.full_group:  # Only transposition and relabeling
+            return [(transposed, [], list(range(size)), {}, 1, None) for transposed in (0, 1)]
+
+        choices = []  # (column orders left open, clue pattern once packed, transposed, row, clue columns per stack)
+        for transposed, source in enumerate(sources):
+            for row in range(size):
+                stacks = []
+                for stack in range(box):
+                    clue_cols = [col for col in range(stack * box, stack * box + box) if source[row * size + col]]
+                    stacks.append(clue_cols)
+                counts = sorted((len(clue_cols) for clue_cols in stacks), reverse=True)
+                pattern = [bit for count in counts for bit in [1] * count + [0] * (box - count)]
+                orders = 1  # Stack orders and column orders inside stacks that give the same packed row
+                for count in set(counts):
+                    orders *= factorial(counts.count(count))
+                for count in counts:
+                    orders *= factorial(count) * factorial(box - count)
+                choices.append((orders, [-bit for bit in pattern], transposed, row, stacks))
+        best = min(choice[:2] for choice in choices)  # Fewest open orders, then clues as far left as possible
+
+        candidates = []
+        for orders, pattern, transposed, row, stacks in choices:
+            if [orders, pattern] != list(best):
+                continue
+            for stack_order in permutations(range(box)):
+                counts = [len(stacks[stack]) for stack in stack_order]
+                if counts != sorted(counts, reverse=True):  # Fuller stacks go first
+                    continue
+                inside = []  # Column orders of each stack: its clue columns first, in any order
+                for stack in stack_order:
+                    empty_cols = [col for col in range(stack * box, stack * box + box) if col not in stacks[stack]]
+                    inside.append([clue + rest for clue in permutations(stacks[stack])
+                                   for rest in permutations(empty_cols)])
+                for orders in product(*inside):
+                    candidates.append((transposed, [], [col for order in orders for col in order], {}, 1, [row]))
+                    if len(candidates) >= MAX_CANDIDATES:
+                        return candidates
+        return candidates
+
+    def _next_rows(self, rows):
+        """
+        List the source rows that can be placed after the rows already placed: any row of an unused band
+        at the start of a band, else the remaining rows of the current band.
+        :param rows: Source rows placed so far
+        :return: List of row indexes
+        """
+        geometry = self.geometry
+        size, box = geometry.size, geometry.box
+        if not self.full_group:  # Rows keep their order
+            return [len(rows)]
+        depth = len(rows)
+        if depth % box == 0:  # Start of a band
+            used = {row // box for row in rows}
+            return [row for row in range(size) if row // box not in used]
+        band = rows[depth - depth % box] // box
+        return [row for row in range(band * box, band * box + box) if row not in rows]
@@ -1,4 +1,10 @@
+import argparse  # Import the argparse module
+from logic.Geometry import SIZES  # Import the supported board sizes
 from ui.SudokuMenu import SudokuMenu
 
 if __name__ == '__main__':
-    SudokuMenu.main()  # Run the main function from the SudokuMenu class
+    parser = argparse.ArgumentParser(description="Play Sudoku.")
+    parser.add_argument('--size', type=int, choices=SIZES, default=9, help="rows, columns and digits of the board; 16x16 offers easy and medium, 25x25 only easy")
+    parser.add_argument('--record', metavar='FILE', help="record the session's events for benchmark.py --replay (ui/ReplayHarness.py)")
+    args = parser.parse_args()
+    SudokuMenu.main(args.size, args.record)  # Run the main function from the SudokuMenu class
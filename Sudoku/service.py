@@ -0,0 +1,285 @@
+import argparse  # Import the argparse module
+import asyncio  # Import the asyncio module
+import json  # Import the json module
+import os  # Import the os module
+import random  # Import the random module
+import sys  # Import the sys module
+import time  # Import the time module
+from collections import deque  # Import the deque class
+from concurrent.futures import ProcessPoolExecutor  # Import the process pool executor
+
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.Generator import Generator  # Import the Generator class
+from logic.ServiceClient import DEFAULT_SOCKET  # Import the default socket path
+from logic.Solver import Solver  # Import the Solver class
+
+OPERATIONS = ('solve', 'count', 'validate', 'generate')  # Operations run in the worker pool
+BATCHED = ('solve', 'count', 'validate')  # Small operations grouped into one worker task
+LATENCY_WINDOW = 10000  # Latencies kept for the percentiles
+
+_solvers = {}  # Solver of each board size in this worker process
+_generators = {}  # Generator of each board size in this worker process
+
+
+def seed_worker():
+    """
+    Reseed the random module in each worker so forked processes do not generate identical puzzles.
+    """
+    random.seed()  # Seed from the operating system
+
+
+def run_request(request):
+    """
+    Run one operation in a worker process.
+    :param request: Dictionary with 'op' and its arguments, boards encoded as strings
+    :return: Dictionary of the result fields
+    """
+    op = request['op']
+    if op == 'generate':
+        size = request.get('size', 9)
+        generator = _generators.get(size)
+        if generator is None:  # First puzzle of this size in this worker
+            generator = _generators[size] = Generator(size=size, mode='transform')
+        puzzle = generator.generate(request['difficulty'], request.get('graded', False))
+        return {'puzzle': Generator.encode(puzzle), 'solution': Generator.encode(generator.last_solution)}
+
+    board = Generator.decode(request['puzzle'])
+    size = len(board)
+    if size * size != len(request['puzzle'].strip()):
+        raise ValueError("The puzzle must have one character per cell of a 9x9, 16x16 or 25x25 board")
+    if op == 'validate':
+        return {'conflicts': sorted(ConflictChecker(size).conflicts(board))}
+    solver = _solvers.get(size)
+    if solver is None:  # First puzzle of this size in this worker
+        solver = _solvers[size] = Solver.for_size(size)
+    if op == 'count':
+        return {'count': solver.count_solutions(board, request.get('limit', 2))}
+    solutions = solver.find_solutions(board, 1)
+    return {'solution': Generator.encode([solutions[0][row * size:row * size + size] for row in range(size)])
+            if solutions else None}
+
+
+def run_batch(requests):
+    """
+    Run a batch of operations in a worker process, one result per request.
+    :param requests: List of request dictionaries
+    :return: List of response dictionaries without ids, in request order
+    """
+    responses = []
+    for request in requests:
+        try:
+            responses.append(dict(run_request(request), ok=True))
+        except Exception as e:  # One bad request does not fail the batch
+            responses.append({'ok': False, 'error': f"{type(e).__name__}: {e}"})
+    return responses
+
+
+class SolverService:
+    """
+    Asyncio server answering newline-delimited JSON requests on a Unix domain socket.
+    Requests wait in a bounded queue: when it is full the service stops reading from the connection
+    that sent the request, which pushes back on the client. A dispatcher groups up to batch_size small
+    requests into one worker task, waiting at most batch_wait seconds for the batch to fill.
+    """
+
+    def __init__(self, workers=None, max_pending=256, timeout=30.0, batch_size=32, batch_wait=0.002):
+        """
+        Initialize the SolverService.
+        :param workers: Number of worker processes (default is os.cpu_count())
+        :param max_pending: Requests queued before reading stops (default is 256)
+        :param timeout: Seconds a request may take before a timeout error is sent back (default is 30)
+        :param batch_size: Maximum requests per worker task (default is 32)
+        :param batch_wait: Seconds the dispatcher waits for a batch to fill (default is 0.002)
+        """
+        self.workers = workers or os.cpu_count()  # Number of worker processes
+        self.max_pending = max_pending  # Size of the request queue
+        self.timeout = timeout  # Seconds before a request times out
+        self.batch_size = batch_size  # Maximum requests per worker task
+        self.batch_wait = batch_wait  # Seconds spent filling a batch
+        self.latencies = deque(maxlen=LATENCY_WINDOW)  # Seconds from receipt to response of recent requests
+        self.completed = 0  # Requests answered
+        self.failed = 0  # Requests answered with an error, timeouts included
+        self.timeouts = 0  # Requests that took longer than the timeout
+        self.batches = 0  # Worker tasks submitted
+        self.running = 0  # Worker tasks not finished yet
+
+    async def serve(self, path):
+        """
+        Listen on a Unix domain socket until cancelled.
+        :param path: Path of the socket, replaced if it exists
+        """
+        self.queue = asyncio.Queue(self.max_pending)  # Requests waiting for a worker
+        self.slots = asyncio.Semaphore(2 * self.workers)  # Worker tasks in flight, two per worker
+        self.started = time.perf_counter()
+        if os.path.exists(path):  # Left over from a previous run
+            os.unlink(path)
+        with ProcessPoolExecutor(self.workers, initializer=seed_worker) as pool:
+            dispatcher = asyncio.ensure_future(self.dispatch(pool))
+            server = await asyncio.start_unix_server(self.handle, path)
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                dispatcher.cancel()
+                if os.path.exists(path):
+                    os.unlink(path)
+
+    async def handle(self, reader, writer):
+        """
+        Read the requests of one connection. Responses are written as they complete, so they can arrive
+        out of order; each carries the id of its request.
+        """
+        tasks = set()  # Requests of this connection still running
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:  # Connection closed
+                    break
+                received = time.perf_counter()
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("A request must be a JSON object")
+                except ValueError as e:
+                    self.respond(writer, {'id': None, 'ok': False, 'error': f"Invalid request: {e}"}, received)
+                    continue
+                op = request.get('op')
+                if op == 'stats':  # Answered by the event loop, even when the queue is full
+                    self.respond(writer, {'id': request.get('id'), 'ok': True, 'stats': self.stats()}, received)
+                elif op not in OPERATIONS:
+                    self.respond(writer, {'id': request.get('id'), 'ok': False,
+                                          'error': f"Unknown operation: {op}"}, received)
+                else:
+                    future = asyncio.get_running_loop().create_future()
+                    await self.queue.put((request, future))  # Blocks reading while the queue is full
+                    task = asyncio.ensure_future(self.reply(writer, request, future, received))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.wait(tasks)
+        except ConnectionError:  # The client went away, its pending results are dropped
+            pass
+        finally:
+            writer.close()
+
+    async def reply(self, writer, request, future, received):
+        """
+        Wait for the result of a request and send it back, or a timeout error after self.timeout seconds.
+        The worker task is not interrupted on timeout; its result is dropped.
+        """
+        try:
+            response = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            response = {'ok': False, 'error': f"Timed out after {self.timeout} s"}
+        self.respond(writer, dict(response, id=request.get('id')), received)
+
+    def respond(self, writer, response, received):
+        """
+        Write one response line and record its latency.
+        """
+        self.completed += 1
+        if not response.get('ok'):
+            self.failed += 1
+        self.latencies.append(time.perf_counter() - received)
+        if not writer.is_closing():
+            writer.write((json.dumps(response) + '\n').encode('utf-8'))
+
+    async def dispatch(self, pool):
+        """
+        Take requests from the queue and submit them to the pool, batching small requests together.
+        """
+        pending = None  # Request taken while filling a batch that could not join it
+        while True:
+            if pending is None:
+                pending = await self.queue.get()
+            batch = [pending]
+            pending = None
+            if batch[0][0]['op'] in BATCHED:
+                deadline = time.perf_counter() + self.batch_wait
+                while len(batch) < self.batch_size:
+                    wait = deadline - time.perf_counter()
+                    try:
+                        item = self.queue.get_nowait() if wait <= 0 else await asyncio.wait_for(self.queue.get(), wait)
+                    except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                        break
+                    if item[0]['op'] not in BATCHED:  # Runs in its own task, after this batch
+                        pending = item
+                        break
+                    batch.append(item)
+            batch = [(request, future) for request, future in batch if not future.done()]  # Drop timed out ones
+            if not batch:
+                continue
+            await self.slots.acquire()  # Never more than two tasks per worker in flight
+            self.batches += 1
+            self.running += 1
+            work = asyncio.get_running_loop().run_in_executor(pool, run_batch, [request for request, _ in batch])
+            work.add_done_callback(lambda done, batch=batch: self.finish(done, batch))
+
+    def finish(self, done, batch):
+        """
+        Hand the results of a worker task to the requests still waiting for them.
+        """
+        self.running -= 1
+        self.slots.release()
+        try:
+            responses = done.result()
+        except Exception as e:  # The worker process died
+            responses = [{'ok': False, 'error': f"Worker failed: {e}"}] * len(batch)
+        for (_, future), response in zip(batch, responses):
+            if not future.done():  # Not timed out
+                future.set_result(response)
+
+    def stats(self):
+        """
+        Get the service counters.
+        :return: Dictionary with queue depth, worker tasks in flight, request counts, latency percentiles
+                 in milliseconds over the last LATENCY_WINDOW requests and throughput in requests per second
+        """
+        latencies = sorted(self.latencies)
+        uptime = time.perf_counter() - self.started
+
+        def percentile(fraction):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000, 3)
+
+        return {
+            'queue_depth': self.queue.qsize(),
+            'running_batches': self.running,
+            'batches': self.batches,
+            'completed': self.completed,
+            'failed': self.failed,
+            'timeouts': self.timeouts,
+            'latency_ms': {'p50': percentile(0.5), 'p90': percentile(0.9), 'p99': percentile(0.99)},
+            'throughput': round(self.completed / uptime, 2) if uptime > 0 else 0.0,
+            'uptime': round(uptime, 1),
+        }
+
+
+def main(argv=None):
+    """
+    Run the solver service until interrupted.
+    :param argv: Command line arguments (default is sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Serve solve, count, validate and generate requests "
+                                                 "as newline-delimited JSON on a Unix domain socket.")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help=f"socket path (default is {DEFAULT_SOCKET})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument('--max-pending', type=int, default=256, help="queued requests before reading stops")
+    parser.add_argument('--timeout', type=float, default=30.0, help="seconds before a request gets a timeout error; its worker task still runs to the end")
+    parser.add_argument('--batch-size', type=int, default=32, help="maximum small requests per worker task")
+    parser.add_argument('--batch-wait', type=float, default=2.0, help="milliseconds spent filling a batch")
+    args = parser.parse_args(argv)
+
+    service = SolverService(args.workers, args.max_pending, args.timeout, args.batch_size, args.batch_wait / 1000)
+    sys.stderr.write(f"Listening on {args.socket} with {service.workers} workers\n")
+    try:
+        asyncio.run(service.serve(args.socket))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+import argparse  # Import the argparse module
+import os  # Import the os module
+import sys  # Import the sys module
+import time  # Import the time module
+from collections import Counter, deque  # Import the Counter and deque classes
+from itertools import islice  # Import the islice function
+from multiprocessing import Pool  # Import the process Pool
+
+from logic.Solver import Solver, SOLVER_MODES  # Import the Solver class and its modes
+
+STATUSES = ('solved', 'no-solution', 'multiple', 'invalid', 'failed')  # Outcome of each puzzle
+
+
+def read_puzzles(stream):
+    """
+    Read puzzles lazily, one per line, skipping blank lines and '#' comments.
+    :param stream: A text stream
+    :return: Generator of 81-character puzzle strings
+    """
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+
+def chunked(puzzles, size):
+    """
+    Group puzzles into lists of at most size items without reading ahead.
+    :param puzzles: Iterable of puzzle strings
+    :param size: Chunk size
+    :return: Generator of lists of puzzle strings
+    """
+    puzzles = iter(puzzles)
+    while True:
+        chunk = list(islice(puzzles, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_puzzle(text):
+    """
+    Parse an 81-character puzzle, '.' or '0' for blanks.
+    :param text: The puzzle string
+    :return: 2D list representing the board, or None if the line is malformed
+    """
+    if len(text) < 81 or any(char not in '.0123456789' for char in text[:81]):
+        return None
+    values = [0 if char == '.' else int(char) for char in text[:81]]
+    return [values[row * 9:row * 9 + 9] for row in range(9)]
+
+
+def solve_chunk(task):
+    """
+    Solve a chunk of puzzles in a worker process.
+    :param task: Tuple (solver mode, list of puzzle strings)
+    :return: List of (status, output line) tuples in input order
+    """
+    mode, puzzles = task
+    solver = Solver(mode)
+    results = []
+    for text in puzzles:
+        board = parse_puzzle(text)
+        if board is None:  # Not a puzzle line
+            results.append(('invalid', f"{text}\tinvalid"))
+            continue
+        solutions = solver.find_solutions(board, 2)  # A second solution means the puzzle is ambiguous
+        if not solutions:
+            results.append(('no-solution', f"{text[:81]}\tno-solution"))
+            continue
+        solution = [solutions[0][row * 9:row * 9 + 9] for row in range(9)]
+        line = ''.join(str(value) for value in solutions[0])
+        if not solver.is_valid_solution(solution):  # Never emit a grid the validator rejects
+            results.append(('failed', f"{text[:81]}\tfailed"))
+        elif len(solutions) > 1:
+            results.append(('multiple', f"{line}\tmultiple"))
+        else:
+            results.append(('solved', line))
+    return results
+
+
+def verify_results(results, validator):
+    """
+    Re-check every emitted solution of a chunk in one vectorized pass.
+    :param results: List of (status, output line) tuples
+    :param validator: The BatchValidator class
+    :return: The results, with solutions that fail the check marked as failed
+    """
+    solved = [i for i, (status, _) in enumerate(results) if status in ('solved', 'multiple')]
+    if not solved:
+        return results
+    valid = validator.validate(validator.from_strings([results[i][1] for i in solved]))
+    for i, ok in zip(solved, valid):
+        if not ok:
+            results[i] = ('failed', results[i][1][:81] + '\tfailed')
+    return results
+
+
+def solve_stream(puzzles, out, mode='bitmask', workers=1, chunk_size=500, max_in_flight=None, validator=None):
+    """
+    Solve a stream of puzzles and write the results in input order.
+    At most max_in_flight chunks are queued in the pool at a time, so memory does not grow with the input.
+    :param puzzles: Iterable of puzzle strings
+    :param out: A text stream for the results
+    :param mode: The solver mode (default is 'bitmask')
+    :param workers: Number of worker processes, 1 or less solves in this process (default is 1)
+    :param chunk_size: Puzzles per worker task (default is 500)
+    :param max_in_flight: Maximum number of queued chunks (default is twice the number of workers)
+    :param validator: Optional BatchValidator class used to re-check each chunk (default is None)
+    :return: Counter of puzzle statuses
+    """
+    stats = Counter()
+
+    def emit(results):
+        if validator is not None:  # Fast post-check of the whole chunk
+            results = verify_results(results, validator)
+        for status, line in results:
+            stats[status] += 1
+            out.write(line + '\n')
+        out.flush()
+
+    tasks = ((mode, chunk) for chunk in chunked(puzzles, chunk_size))
+    if workers <= 1:  # No pool needed
+        for task in tasks:
+            emit(solve_chunk(task))
+        return stats
+
+    max_in_flight = max_in_flight or 2 * workers
+    with Pool(workers) as pool:
+        pending = deque()  # Results in submission order
+        for task in tasks:
+            pending.append(pool.apply_async(solve_chunk, (task,)))
+            if len(pending) >= max_in_flight:  # Wait for the oldest chunk before reading more input
+                emit(pending.popleft().get())
+        while pending:
+            emit(pending.popleft().get())
+    return stats
+
+
+def main(argv=None):
+    """
+    Solve puzzles from a file or stdin and stream the solutions to stdout, with a summary on stderr.
+    :param argv: Command line arguments (default is sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Solve Sudoku puzzles, one 81-character puzzle per line.")
+    parser.add_argument('input', nargs='?', help="puzzle file (default is stdin)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument('--chunk-size', type=int, default=500, help="puzzles per worker task")
+    parser.add_argument('--max-in-flight', type=int, help="maximum queued chunks (default is 2 x workers)")
+    parser.add_argument('--mode', choices=SOLVER_MODES, default='bitmask', help="solver engine")
+    parser.add_argument('--verify', action='store_true', help="re-check solutions with the NumPy batch validator")
+    args = parser.parse_args(argv)
+    validator = None
+    if args.verify:
+        try:
+            from logic.BatchValidator import BatchValidator  # NumPy is only needed for --verify
+        except ImportError:
+            parser.error("--verify requires numpy")
+        validator = BatchValidator
+
+    started = time.perf_counter()
+    stream = open(args.input) if args.input else sys.stdin
+    try:
+        stats = solve_stream(read_puzzles(stream), sys.stdout, args.mode, args.workers,
+                             args.chunk_size, args.max_in_flight, validator)
+    finally:
+        if args.input:
+            stream.close()
+    elapsed = time.perf_counter() - started
+    total = sum(stats.values())
+    rate = total / elapsed if elapsed > 0 else 0.0
+    summary = ', '.join(f"{status} {stats[status]}" for status in STATUSES)
+    sys.stderr.write(f"{total} puzzles in {elapsed:.2f}s ({rate:.0f} puzzles/s): {summary}\n")
+
+
+if __name__ == '__main__':
+    main()
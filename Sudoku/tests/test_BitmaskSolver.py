@@ -0,0 +1,53 @@
+import unittest  # Import the unittest module
+
+from benchmark import load_corpus  # Import the bundled corpus loader
+from logic.BitmaskSolver import BitmaskSolver  # Import the BitmaskSolver class
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.Solver import Solver  # Import the Solver class
+
+
+class BitmaskSolverTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = BitmaskSolver()
+        self.reference = Solver('backtrack')
+
+    def test_solve_matches_backtracker(self):
+        for puzzle in load_corpus('easy')[:5]:
+            board, expected = [row[:] for row in puzzle], [row[:] for row in puzzle]
+            self.assertTrue(self.engine.solve(board))
+            self.assertTrue(self.reference.solve(expected))
+            self.assertEqual(board, expected)
+
+    def test_solves_hard_puzzles_keeping_givens(self):
+        for puzzle in load_corpus('hardest') + load_corpus('minimal17'):
+            board = [row[:] for row in puzzle]
+            self.assertTrue(self.engine.solve(board))
+            self.assertTrue(ConflictChecker().is_solution(board))
+            for row in range(9):
+                for col in range(9):
+                    if puzzle[row][col]:
+                        self.assertEqual(board[row][col], puzzle[row][col])
+
+    def test_count_matches_backtracker(self):
+        empty = [[0] * 9 for _ in range(9)]
+        for limit in (1, 2, 5):
+            self.assertEqual(self.engine.count_solutions(empty, limit), limit)
+            self.assertEqual(self.engine.count_solutions(empty, limit), self.reference.count_solutions(empty, limit))
+        puzzle = load_corpus('easy')[0]
+        self.assertEqual(self.engine.count_solutions(puzzle), 1)
+
+    def test_conflicting_givens_have_no_solution(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[0][0] = board[0][8] = 5
+        self.assertEqual(self.engine.find_solutions(board, 2), [])
+        self.assertFalse(self.engine.solve(board))
+
+    def test_large_boards(self):
+        for size in (16, 25):
+            board = [[0] * size for _ in range(size)]
+            self.assertTrue(self.engine.solve(board))
+            self.assertTrue(ConflictChecker(size).is_solution(board))
+
+
+if __name__ == '__main__':
+    unittest.main()
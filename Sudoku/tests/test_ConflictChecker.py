@@ -0,0 +1,58 @@
+import unittest  # Import the unittest module
+
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.Generator import Generator  # Import the Generator class
+
+
+class ConflictCheckerTest(unittest.TestCase):
+    def setUp(self):
+        self.checker = ConflictChecker()
+        self.solution = Generator().search_grid()
+
+    def test_solution_has_no_conflicts(self):
+        self.assertEqual(self.checker.conflicts(self.solution), {})
+        self.assertTrue(self.checker.is_solution(self.solution))
+        flat = bytes(value for row in self.solution for value in row)
+        self.assertTrue(self.checker.is_solution(flat))
+
+    def test_row_conflict(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[2][0] = board[2][8] = 4
+        self.assertEqual(self.checker.conflicts(board), {(2, 0): [('row', 2)], (2, 8): [('row', 2)]})
+
+    def test_column_conflict(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[0][5] = board[7][5] = 9
+        self.assertEqual(self.checker.conflicts(board), {(0, 5): [('col', 5)], (7, 5): [('col', 5)]})
+
+    def test_box_conflict(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[3][3] = board[5][4] = 1  # Box 4, different rows and columns
+        self.assertEqual(self.checker.conflicts(board), {(3, 3): [('box', 4)], (5, 4): [('box', 4)]})
+
+    def test_cell_in_several_conflicts(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[0][0] = board[0][7] = board[1][1] = board[6][0] = 2
+        conflicts = self.checker.conflicts(board)
+        self.assertEqual(sorted(conflicts[(0, 0)]), [('box', 0), ('col', 0), ('row', 0)])
+        self.assertEqual(set(conflicts), {(0, 0), (0, 7), (1, 1), (6, 0)})
+
+    def test_swapped_cells_are_not_a_solution(self):
+        board = [row[:] for row in self.solution]
+        board[0][0], board[0][1] = board[0][1], board[0][0]  # Row still fine, columns now repeat
+        self.assertFalse(self.checker.is_solution(board))
+        self.assertIn((0, 0), self.checker.conflicts(board))
+        board = [row[:] for row in self.solution]
+        board[4][4] = 0
+        self.assertFalse(self.checker.is_solution(board))
+        self.assertEqual(self.checker.conflicts(board), {})
+
+    def test_large_board(self):
+        checker = ConflictChecker(16)
+        board = [[0] * 16 for _ in range(16)]
+        board[0][0] = board[3][3] = 16  # Box 0 of a 16x16 board
+        self.assertEqual(checker.conflicts(board), {(0, 0): [('box', 0)], (3, 3): [('box', 0)]})
+
+
+if __name__ == '__main__':
+    unittest.main()
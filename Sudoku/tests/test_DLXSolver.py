@@ -0,0 +1,56 @@
+import unittest  # Import the unittest module
+
+from benchmark import load_corpus  # Import the bundled corpus loader
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.Solver import Solver, SOLVER_MODES  # Import the Solver class and its modes
+
+
+class EngineParityTest(unittest.TestCase):
+    def setUp(self):
+        self.solvers = {mode: Solver(mode) for mode in SOLVER_MODES}
+
+    def test_solve_matches_backtracker(self):
+        for puzzle in load_corpus('easy')[:5]:
+            solutions = {}
+            for mode, solver in self.solvers.items():
+                board = [row[:] for row in puzzle]
+                self.assertTrue(solver.solve(board))
+                solutions[mode] = board
+            self.assertEqual(solutions['dlx'], solutions['backtrack'])
+            self.assertEqual(solutions['bitmask'], solutions['backtrack'])
+
+    def test_dlx_solves_hard_puzzles(self):
+        for puzzle in load_corpus('hardest') + load_corpus('minimal17'):
+            board = [row[:] for row in puzzle]
+            self.assertTrue(self.solvers['dlx'].solve(board))
+            self.assertTrue(ConflictChecker().is_solution(board))
+
+    def test_count_stops_at_limit(self):
+        empty = [[0] * 9 for _ in range(9)]
+        for limit in (1, 2, 5):
+            for mode, solver in self.solvers.items():
+                with self.subTest(mode=mode, limit=limit):
+                    self.assertEqual(solver.count_solutions(empty, limit), limit)
+
+    def test_count_matches_on_puzzles(self):
+        puzzle = load_corpus('easy')[0]
+        ambiguous = [row[:] for row in puzzle]
+        for row in range(3):  # Empty the first band, leaving several solutions
+            ambiguous[row] = [0] * 9
+        for board in (puzzle, ambiguous):
+            counts = {mode: solver.count_solutions(board, 3) for mode, solver in self.solvers.items()}
+            self.assertEqual(counts['dlx'], counts['backtrack'])
+            self.assertEqual(counts['bitmask'], counts['backtrack'])
+        self.assertEqual(counts['backtrack'], 3)
+
+    def test_find_solutions_of_large_boards(self):
+        for size in (16, 25):
+            empty = [[0] * size for _ in range(size)]
+            solutions = self.solvers['dlx'].find_solutions(empty, 2)
+            self.assertEqual(len(solutions), 2)
+            self.assertNotEqual(solutions[0], solutions[1])
+            self.assertTrue(all(ConflictChecker(size).is_solution(solution) for solution in solutions))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest  # Import the unittest module
+
+from logic.Generator import Generator, SIZE_LEVELS  # Import the Generator class and the levels of each size
+from logic.PuzzlePrefetcher import PuzzlePrefetcher  # Import the PuzzlePrefetcher class
+from logic.SudokuGame import SudokuGame  # Import the SudokuGame class
+
+
+class SizeLevelsTest(unittest.TestCase):
+    def test_large_board_generates_offered_level(self):
+        generator = Generator(size=25, mode='transform')
+        puzzle = generator.generate('easy')
+        clues = sum(1 for row in puzzle for value in row if value)
+        self.assertLess(clues, 625)
+        self.assertEqual(generator.solver.count_solutions(puzzle), 1)
+
+    def test_large_board_rejects_level_not_offered(self):
+        with self.assertRaises(ValueError):
+            Generator(size=25).generate('medium')
+        with self.assertRaises(ValueError):
+            Generator(size=16).generate('hard')
+
+    def test_game_and_prefetcher_use_offered_levels(self):
+        game = SudokuGame(size=25)
+        self.assertEqual(game.difficulty, 'easy')
+        game.set_difficulty('hard')
+        self.assertEqual(game.difficulty, 'easy')
+        self.assertEqual(tuple(PuzzlePrefetcher(board_size=16).queues), SIZE_LEVELS[16])
+
+
+if __name__ == '__main__':
+    unittest.main()
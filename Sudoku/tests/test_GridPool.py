@@ -0,0 +1,46 @@
+import threading  # Import the threading module
+import unittest  # Import the unittest module
+
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.Generator import Generator  # Import the Generator class
+from logic.GridPool import GridPool, POOL_SEEDS, POOL_REFRESH  # Import the GridPool class and its settings
+
+
+class GridPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = GridPool(9)
+        self.generator = Generator(mode='transform', pool=self.pool)
+        self.checker = ConflictChecker(9)
+
+    def test_draws_are_solved_grids(self):
+        for _ in range(20):
+            grid = self.generator.solved_grid()
+            self.assertTrue(self.checker.is_solution(bytes(value for row in grid for value in row)))
+
+    def test_pool_gains_grids_while_drawing(self):
+        self.generator.solved_grid()
+        self.assertEqual(len(self.pool), POOL_SEEDS)
+        for _ in range(3 * POOL_REFRESH):
+            self.generator.solved_grid()
+        self.assertEqual(len(self.pool), POOL_SEEDS + 3)
+
+    def test_threads_share_the_pool(self):
+        self.generator.solved_grid()
+        grids = []
+
+        def draw():
+            generator = Generator(mode='transform', pool=self.pool)
+            grids.extend(generator.solved_grid() for _ in range(2 * POOL_REFRESH))
+
+        threads = [threading.Thread(target=draw) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(grids), 8 * POOL_REFRESH)
+        self.assertEqual(self.pool.draws, 1 + 8 * POOL_REFRESH)
+        self.assertLessEqual(len(self.pool) - POOL_SEEDS, self.pool.draws // POOL_REFRESH)  # Never two refreshes at once
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import random  # Import the random module
+import unittest  # Import the unittest module
+
+from logic.Board import Board  # Import the Board class
+from logic.MoveLog import MoveLog  # Import the MoveLog class
+
+
+class MoveLogTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.board = Board()
+        self.log = MoveLog(self.board, checkpoint_every=4)
+        self.history = [self.board.snapshot()]  # Board after each move
+        for _ in range(11):  # Crosses two checkpoints, some moves overwrite earlier ones
+            row, col = random.randrange(9), random.randrange(9)
+            value = (self.board.get(row, col) + random.randrange(1, 9)) % 10
+            self.log.record(row, col, value)
+            self.history.append(self.board.snapshot())
+
+    def test_undo_and_redo_walk_the_history(self):
+        for position in range(len(self.history) - 1, 0, -1):
+            self.assertEqual(self.board.snapshot(), self.history[position])
+            self.assertIsNotNone(self.log.undo())
+        self.assertEqual(self.board.snapshot(), self.history[0])
+        self.assertIsNone(self.log.undo())
+        for position in range(1, len(self.history)):
+            self.assertIsNotNone(self.log.redo())
+            self.assertEqual(self.board.snapshot(), self.history[position])
+        self.assertIsNone(self.log.redo())
+
+    def test_goto_across_checkpoints(self):
+        for position in (0, 11, 3, 8, 4, 9, 1, 11, 5):
+            self.log.goto(position)
+            self.assertEqual(self.log.position, position)
+            self.assertEqual(self.board.snapshot(), self.history[position])
+        with self.assertRaises(ValueError):
+            self.log.goto(12)
+
+    def test_counters_follow_undo(self):
+        self.log.goto(0)
+        self.assertEqual(self.board.filled, 0)
+        self.log.goto(11)
+        self.assertEqual(self.board.filled, sum(1 for value in self.board.values if value))
+
+    def test_new_move_ends_redo_branch(self):
+        self.log.goto(5)
+        self.log.record(8, 8, 0 if self.board.get(8, 8) else 1)
+        self.assertEqual(len(self.log), 6)
+        self.assertFalse(self.log.can_redo())
+        branched = self.board.snapshot()
+        self.log.goto(0)
+        self.log.goto(6)
+        self.assertEqual(self.board.snapshot(), branched)
+        self.log.goto(4)
+        self.assertEqual(self.board.snapshot(), self.history[4])
+
+    def test_same_value_is_not_logged(self):
+        self.log.goto(5)
+        self.log.record(0, 0, self.board.get(0, 0))
+        self.assertEqual(len(self.log), 11)  # The redo branch is kept too
+        self.assertTrue(self.log.can_redo())
+
+
+if __name__ == '__main__':
+    unittest.main()
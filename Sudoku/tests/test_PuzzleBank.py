@@ -0,0 +1,63 @@
+import os  # Import the os module
+import tempfile  # Import the tempfile module
+import unittest  # Import the unittest module
+
+from logic.Generator import Generator  # Import the Generator class
+from logic.PuzzleBank import PuzzleBank, HEADER, HEADER_SIZE, MAGIC, RECORD_SIZES  # Import the bank and its format
+
+
+class PuzzleBankTest(unittest.TestCase):
+    def setUp(self):
+        generator = Generator()
+        self.entries = []  # (difficulty, puzzle, solution) written to the bank
+        for difficulty in ('easy', 'easy', 'hard'):
+            puzzle = generator.remove_clues(generator.solved_grid(), 40)
+            self.entries.append((difficulty, puzzle, generator.last_solution))
+        handle, self.path = tempfile.mkstemp(suffix='.bank')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_pack_round_trip(self):
+        for _, puzzle, solution in self.entries:
+            self.assertEqual(len(PuzzleBank.pack(puzzle)), 41)
+            self.assertEqual(PuzzleBank.unpack(PuzzleBank.pack(puzzle)), puzzle)
+            self.assertEqual(PuzzleBank.unpack(PuzzleBank.pack(solution)), solution)
+
+    def test_write_and_read_puzzles_with_solutions(self):
+        counts = PuzzleBank.write(self.path, self.entries)
+        self.assertEqual(counts, {'easy': 2, 'medium': 0, 'hard': 1})
+        with PuzzleBank(self.path) as bank:
+            self.assertEqual(bank.version, 2)
+            self.assertEqual([bank.get('easy', i) for i in range(2)], [self.entries[0][1], self.entries[1][1]])
+            self.assertEqual(bank.get_solution('hard', 0), self.entries[2][2])
+            self.assertIsNone(bank.random_entry('medium'))
+            self.assertEqual(bank.random_entry('hard'), (self.entries[2][1], self.entries[2][2]))
+            with self.assertRaises(IndexError):
+                bank.get('hard', 1)
+
+    def test_record_without_solution(self):
+        PuzzleBank.write(self.path, [('medium', self.entries[0][1])])
+        with PuzzleBank(self.path) as bank:
+            self.assertEqual(bank.random_entry('medium'), (self.entries[0][1], None))
+
+    def test_version_1_bank_still_loads(self):
+        difficulty, puzzle, _ = self.entries[0]
+        record = bytes((0, sum(1 for row in puzzle for value in row if value))) + PuzzleBank.pack(puzzle)
+        with open(self.path, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, 1, RECORD_SIZES[1], 0, 1, 1, 0, 1, 0).ljust(HEADER_SIZE, b'\0'))
+            out.write(record)
+        with PuzzleBank(self.path) as bank:
+            self.assertEqual(bank.version, 1)
+            self.assertEqual(bank.random_entry(difficulty), (puzzle, None))
+
+    def test_other_files_are_rejected(self):
+        with open(self.path, 'wb') as out:
+            out.write(b'not a bank')
+        with self.assertRaises(ValueError):
+            PuzzleBank(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest  # Import the unittest module
+
+from benchmark import load_corpus  # Import the bundled corpus loader
+from logic.BitmaskSolver import BitmaskSolver  # Import the BitmaskSolver class
+from logic.StepSolver import StepSolver  # Import the StepSolver class
+
+
+class StepSolverTest(unittest.TestCase):
+    def setUp(self):
+        self.puzzles = load_corpus('hardest')[:4] + load_corpus('minimal17')[:4]
+
+    def test_resumed_search_finds_the_same_solution(self):
+        for puzzle in self.puzzles:
+            expected = BitmaskSolver().find_solutions(puzzle, 1)[0]
+            whole = StepSolver(puzzle)
+            self.assertEqual(whole.step(), 'solved')
+            sliced = StepSolver(puzzle)
+            steps = 0
+            while sliced.step(max_nodes=1) == 'running':
+                steps += 1
+            self.assertEqual(sliced.status, 'solved')
+            self.assertEqual(sliced.solutions[0], expected)
+            self.assertEqual(whole.solutions[0], expected)
+            self.assertEqual(sliced.nodes, whole.nodes)  # Pausing does not change the search
+            self.assertGreaterEqual(steps, sliced.nodes - 1)
+
+    def test_board_is_copied(self):
+        puzzle = self.puzzles[0]
+        board = [row[:] for row in puzzle]
+        solver = StepSolver(board)
+        board[0][:] = [0] * 9  # Changes after the start do not reach the search
+        solver.step()
+        expected = BitmaskSolver().find_solutions(puzzle, 1)[0]
+        self.assertEqual(solver.solution(), [expected[row * 9:row * 9 + 9] for row in range(9)])
+
+    def test_limit_counts_like_the_engine(self):
+        empty = [[0] * 9 for _ in range(9)]
+        solver = StepSolver(empty, limit=3)
+        for _ in solver.iterate(max_nodes=5):
+            pass
+        self.assertEqual(solver.status, 'solved')
+        self.assertEqual(solver.solutions, BitmaskSolver().find_solutions(empty, 3))
+
+    def test_cancel_stops_at_node_boundary(self):
+        solver = StepSolver(self.puzzles[0])
+        self.assertEqual(solver.step(max_nodes=1), 'running')
+        solver.cancel()
+        self.assertEqual(solver.step(), 'cancelled')
+        self.assertIsNone(solver.solution())
+
+    def test_no_solution(self):
+        board = [row[:] for row in self.puzzles[0]]
+        row = board[0]
+        empty = row.index(0)
+        row[empty] = next(value for value in row if value)  # Repeat a clue of the row
+        self.assertEqual(StepSolver(board).step(), 'no-solution')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os  # Import the os module
+import tempfile  # Import the tempfile module
+import unittest  # Import the unittest module
+
+from logic.Generator import Generator, CLUE_RANGES  # Import the Generator class and difficulty table
+from logic.PuzzleBank import PuzzleBank  # Import the PuzzleBank class
+from logic.SudokuGame import SudokuGame  # Import the SudokuGame class
+
+
+class GeneratePuzzleTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Write a bank holding a single easy puzzle and open a game on it.
+        """
+        generator = Generator()
+        self.puzzle = generator.generate('easy')
+        handle, self.path = tempfile.mkstemp(suffix='.bank')
+        os.close(handle)
+        PuzzleBank.write(self.path, [('easy', self.puzzle, generator.last_solution)])
+        self.game = SudokuGame(bank_path=self.path)
+
+    def tearDown(self):
+        self.game.bank.close()
+        os.remove(self.path)
+
+    def test_bank_hit_loads_stored_puzzle(self):
+        self.game.set_difficulty('easy')
+        self.game.generate_puzzle()
+        self.assertEqual(self.game.board.clues(), self.puzzle)
+
+    def test_bank_miss_generates_puzzle_for_level(self):
+        self.game.set_difficulty('medium')  # The bank has no medium puzzle
+        self.game.generate_puzzle()
+        board = self.game.board
+        clues = sum(1 for row in board.clues() for value in row if value)
+        self.assertFalse(board.is_full())
+        self.assertEqual(clues, board.filled)  # Only the clues are on the board, all of them fixed
+        self.assertGreaterEqual(clues, CLUE_RANGES['medium'][0])
+        self.assertEqual(self.game.solver.count_solutions(board.clues()), 1)
+
+    def test_mistake_checks_without_solution(self):
+        puzzle = [row[:] for row in self.puzzle]
+        puzzle[0][0] = puzzle[0][1] = puzzle[0][1] or puzzle[0][0] or 1  # Repeated clue, no solution exists
+        self.game.board.load_puzzle(puzzle)
+        self.assertFalse(self.game.is_entry_wrong(0, 0))
+        self.assertEqual(self.game.wrong_entries(), [])
+
+    def test_unknown_level_keeps_difficulty(self):
+        self.game.set_difficulty(30)
+        self.assertEqual(self.game.difficulty, 'medium')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os  # Import the os module
+import random  # Import the random module
+import unittest  # Import the unittest module
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # No window, set before Pygame is initialized by SudokuMenu
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # Import the Pygame library
+from ui.SudokuMenu import SudokuMenu  # Import the SudokuMenu class
+
+
+class KeyInputTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.app = SudokuMenu(prefetch=False, bank_path=None)
+        self.app.difficulty = 'easy'
+        self.app.start_game()
+        cells = [divmod(i, 9) for i in range(81)]
+        self.given = next(cell for cell in cells if self.app.board.is_fixed(*cell))
+        self.empty = next(cell for cell in cells if not self.app.board.get(*cell))
+
+    def type_value(self, row, col, value):
+        cell_size = self.app.cell_size
+        self.app.cell_click((col * cell_size + 1, row * cell_size + 1))
+        self.app.key_input(pygame.key.key_code(str(value)), 0)
+
+    def test_givens_cannot_be_overwritten(self):
+        row, col = self.given
+        value = self.app.board.get(row, col)
+        self.type_value(row, col, value % 9 + 1)
+        self.assertEqual(self.app.board.get(row, col), value)
+        self.assertEqual(len(self.app.moves), 0)
+
+    def test_empty_cells_take_entries(self):
+        row, col = self.empty
+        self.type_value(row, col, 5)
+        self.assertEqual(self.app.board.get(row, col), 5)
+        self.assertEqual(len(self.app.moves), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
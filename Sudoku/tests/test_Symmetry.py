@@ -0,0 +1,108 @@
+import random  # Import the random module
+import unittest  # Import the unittest module
+
+from benchmark import load_corpus  # Import the bundled corpus loader
+from logic.SolveCache import SolveCache  # Import the SolveCache class
+from logic.Solver import Solver  # Import the Solver class
+from logic.Symmetry import Symmetry  # Import the Symmetry class
+
+
+def transformed(board, rng, full_group=True):
+    """
+    Apply a random Sudoku symmetry to a board: band, row, stack and column permutations (when full_group),
+    digit relabeling and transposition.
+    """
+    size = len(board)
+    box = int(size ** 0.5)
+    rows, cols = list(range(size)), list(range(size))
+    if full_group:
+        bands, stacks = rng.sample(range(box), box), rng.sample(range(box), box)
+        rows = [band * box + row for band in bands for row in rng.sample(range(box), box)]
+        cols = [stack * box + col for stack in stacks for col in rng.sample(range(box), box)]
+    labels = [0] + rng.sample(range(1, size + 1), size)
+    result = [[labels[board[row][col]] for col in cols] for row in rows]
+    if rng.random() < 0.5:
+        result = [list(column) for column in zip(*result)]
+    return result
+
+
+class SymmetryTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.symmetry = Symmetry.of(9)
+        self.puzzles = load_corpus('hardest')[:3] + load_corpus('easy')[:3]
+
+    def test_key_is_invariant_under_transforms(self):
+        for puzzle in self.puzzles:
+            key, _ = self.symmetry.canonical(puzzle)
+            for _ in range(5):
+                self.assertEqual(self.symmetry.canonical(transformed(puzzle, self.rng))[0], key)
+
+    def test_rotation_and_reflection(self):
+        puzzle = self.puzzles[0]
+        key, _ = self.symmetry.canonical(puzzle)
+        rotated = [list(row) for row in zip(*puzzle[::-1])]
+        mirrored = [row[::-1] for row in puzzle]
+        self.assertEqual(self.symmetry.canonical(rotated)[0], key)
+        self.assertEqual(self.symmetry.canonical(mirrored)[0], key)
+
+    def test_different_puzzles_have_different_keys(self):
+        keys = {self.symmetry.canonical(puzzle)[0] for puzzle in self.puzzles}
+        self.assertEqual(len(keys), len(self.puzzles))
+
+    def test_transform_round_trip(self):
+        for puzzle in self.puzzles:
+            key, transform = self.symmetry.canonical(puzzle)
+            canonical = self.symmetry.to_canonical(puzzle, transform)
+            self.assertEqual(bytes(value for row in canonical for value in row), key)
+            self.assertEqual(self.symmetry.from_canonical(key, transform), puzzle)
+
+    def test_large_boards_use_transposition_and_relabeling(self):
+        symmetry = Symmetry.of(16)
+        board = [[0] * 16 for _ in range(16)]
+        Solver('bitmask').solve(board)
+        puzzle = [[value if self.rng.random() < 0.5 else 0 for value in row] for row in board]
+        key, _ = symmetry.canonical(puzzle)
+        for _ in range(3):
+            self.assertEqual(symmetry.canonical(transformed(puzzle, self.rng, full_group=False))[0], key)
+
+
+class SolveCacheTest(unittest.TestCase):
+    def test_symmetric_copy_hits_the_cache(self):
+        cache = SolveCache()
+        solver = Solver(cache=cache)
+        puzzle = load_corpus('hardest')[0]
+        copy = transformed(puzzle, random.Random(3))
+        first, second = [row[:] for row in puzzle], [row[:] for row in copy]
+        self.assertTrue(solver.solve(first))
+        self.assertTrue(solver.solve(second))
+        self.assertEqual(cache.stats()['hits'], 1)
+        expected = [row[:] for row in copy]
+        Solver().solve(expected)
+        self.assertEqual(second, expected)  # The cached solution is mapped back onto the copy
+        self.assertEqual(solver.count_solutions(copy), 1)
+
+    def test_count_limit_above_cached_one_searches_again(self):
+        cache = SolveCache()
+        solver = Solver(cache=cache)
+        ambiguous = load_corpus('easy')[0]
+        ambiguous[:3] = [[0] * 9 for _ in range(3)]  # Empty the first band, leaving several solutions
+        self.assertEqual(solver.count_solutions(ambiguous, 2), 2)
+        self.assertEqual(solver.count_solutions(ambiguous, 3), Solver().count_solutions(ambiguous, 3))
+        self.assertEqual(next(iter(cache.entries.values()))['limit'], 3)  # The capped count was replaced
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SolveCache(capacity=2)
+        cache.put(b'a', 1)
+        cache.put(b'b', 2)
+        cache.get(b'a')
+        cache.put(b'c', 3)
+        self.assertIsNone(cache.get(b'b'))
+        self.assertEqual(cache.get(b'a'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        with self.assertRaises(ValueError):
+            SolveCache(capacity=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
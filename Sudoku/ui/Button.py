@@ -44,7 +44,7 @@ class Button:
         :param event: The Pygame event
         :return: True if the button is clicked, False otherwise
         """
-        x, y = pygame.mouse.get_pos()  # Get the current mouse position
+        x, y = event.pos  # Position of the click, not of the mouse now, so replayed clicks land the same
         if self.rect.collidepoint(x, y):  # Check if the mouse position is within the button rectangle
             return True  # Return True if the button is clicked
         return False  # Return False if the button is not clicked
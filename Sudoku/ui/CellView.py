@@ -1,4 +1,6 @@
 import pygame  # Import the Pygame library
+from logic.Geometry import SYMBOLS  # Import the value characters
+from interface.CellViewInterface import CellViewInterface  # Import the CellViewInterface class
 
 # Define colors
 BLACK = (0, 0, 0)  # RGB color for black
@@ -7,10 +9,10 @@ BLUE = (0, 0, 255)  # RGB color for blue
 RED = (255, 0, 0)  # RGB color for red
 
 
-class Cell:
+class CellView(CellViewInterface):  # Define the CellView class inheriting from CellViewInterface
     def __init__(self, row, col, size, value=0, fixed=False):
         """
-        Initialize the Cell.
+        Initialize the CellView, the on-screen representation of a board cell.
         :param row: The row index of the cell
         :param col: The column index of the cell
         :param size: The size of the cell
@@ -25,6 +27,7 @@ class Cell:
             self.fixed = fixed  # Initialize fixed status from parameter
             self.selected = False  # Initialize the selected status as False
             self.color = BLACK  # Default text color
+            self.dirty = True  # The cell needs to be drawn
         except Exception as e:
             print(f"Error initializing the cell: {e}")
 
@@ -35,6 +38,8 @@ class Cell:
         :param color: The color of the value text
         """
         try:
+            if value != self.value or color != self.color:  # Only a visible change needs a redraw
+                self.dirty = True
             self.value = value  # Assign the new value to the cell
             self.color = color  # Assign the color to the cell text
         except Exception as e:
@@ -46,15 +51,19 @@ class Cell:
         :param color: The color to be set
         """
         try:
+            if color != self.color:  # Only a visible change needs a redraw
+                self.dirty = True
             self.color = color  # Assign the color to the cell text
         except Exception as e:
             print(f"Error setting cell color: {e}")
 
-    def draw(self, surface, font):
+    def draw(self, surface, font, glyphs=None):
         """
-        Draw the cell on the given surface.
+        Draw the cell on the given surface and mark it clean.
         :param surface: The surface where the cell will be drawn
         :param font: The font to be used for drawing the cell value
+        :param glyphs: Optional GlyphCache holding pre-rendered values (default is None, render with the font)
+        :return: The rectangle that was drawn
         """
         try:
             x1 = self.col * self.size  # Calculate the x-coordinate of the top-left corner
@@ -64,12 +73,17 @@ class Cell:
             pygame.draw.rect(surface, BLACK, rect, 1)  # Draw the rectangle outline
 
             if self.value != 0:  # If the cell value is not zero
-                value_surf = font.render(str(self.value), True, self.color)  # Render the text with the assigned color
+                if glyphs is not None:  # Reuse the pre-rendered glyph
+                    value_surf = glyphs.get(self.value, self.color)
+                else:
+                    value_surf = font.render(SYMBOLS[self.value], True, self.color)  # Render the text with the assigned color
                 value_rect = value_surf.get_rect(center=(x1 + self.size // 2, y1 + self.size // 2))  # Center the text in the cell
                 surface.blit(value_surf, value_rect)  # Draw the text on the surface
 
             if self.selected:  # If the cell is selected
                 pygame.draw.rect(surface, BLUE, rect, 3)  # Draw a highlight border
+            self.dirty = False  # The screen now matches the cell
+            return rect
         except Exception as e:
             print(f"Error drawing the cell: {e}")
 
@@ -78,6 +92,7 @@ class Cell:
         Select the cell.
         """
         try:
+            self.dirty = self.dirty or not self.selected  # Redraw if the highlight changes
             self.selected = True  # Set the selected status to True
         except Exception as e:
             print(f"Error selecting the cell: {e}")
@@ -87,6 +102,7 @@ class Cell:
         Deselect the cell.
         """
         try:
+            self.dirty = self.dirty or self.selected  # Redraw if the highlight changes
             self.selected = False  # Set the selected status to False
         except Exception as e:
             print(f"Error deselecting the cell: {e}")
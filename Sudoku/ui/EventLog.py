@@ -0,0 +1,90 @@
+import json  # Import the json module
+import pygame  # Import the Pygame library
+
+# Attributes kept for each recorded event type; other events do not change the game
+RECORDED_EVENTS = {
+    'QUIT': (),
+    'MOUSEBUTTONDOWN': ('pos', 'button'),
+    'KEYDOWN': ('key', 'mod', 'unicode'),
+}
+
+
+class EventLog:
+    """
+    Recorded input of a game session for the replay harness, as JSON lines: a header with the random seed and
+    board size, then one line per frame that received input, each a list of events such as
+    {"type": "KEYDOWN", "key": 49, "mod": 0, "unicode": "1"}.
+    """
+
+    def __init__(self, stream):
+        """
+        Initialize the EventLog. Use EventLog.create to start a recording.
+        :param stream: A text stream open for writing
+        """
+        self.stream = stream  # Where the frames are written
+
+    @classmethod
+    def create(cls, path, seed, size):
+        """
+        Start a recording.
+        :param path: Path of the log file, replaced if it exists
+        :param seed: Random seed the session was started with
+        :param size: Board size of the session
+        :return: The EventLog
+        """
+        log = cls(open(path, 'w'))
+        log.stream.write(json.dumps({'seed': seed, 'size': size}) + '\n')
+        return log
+
+    def write(self, events):
+        """
+        Record the events of one frame, skipping the frame if none of them is recorded.
+        :param events: The Pygame events of the frame
+        """
+        frame = [data for data in map(self.encode, events) if data is not None]
+        if frame:
+            self.stream.write(json.dumps(frame) + '\n')
+
+    def close(self):
+        """
+        Finish the recording.
+        """
+        self.stream.close()
+
+    @staticmethod
+    def read(path):
+        """
+        Read a recorded session.
+        :param path: Path of the log file
+        :return: Tuple (header dictionary, list of frames, each a list of event dictionaries)
+        """
+        with open(path) as stream:
+            header = json.loads(stream.readline())
+            return header, [json.loads(line) for line in stream if line.strip()]
+
+    @staticmethod
+    def encode(event):
+        """
+        Convert a Pygame event to a dictionary.
+        :param event: The Pygame event
+        :return: Dictionary with its type name and recorded attributes, or None if the type is not recorded
+        """
+        name = pygame.event.event_name(event.type).upper()
+        if name not in RECORDED_EVENTS:
+            return None
+        data = {'type': name}
+        for attribute in RECORDED_EVENTS[name]:
+            value = getattr(event, attribute)
+            data[attribute] = list(value) if isinstance(value, tuple) else value
+        return data
+
+    @staticmethod
+    def decode(data):
+        """
+        Convert a dictionary from encode() back to a Pygame event.
+        :param data: The event dictionary
+        :return: The Pygame event
+        """
+        attributes = {key: tuple(value) if isinstance(value, list) else value
+                      for key, value in data.items() if key != 'type'}
+        return pygame.event.Event(getattr(pygame, data['type']), attributes)
@@ -0,0 +1,25 @@
+from logic.Geometry import SYMBOLS  # Import the value characters
+
+
+class GlyphCache:
+    def __init__(self, font):
+        """
+        Initialize the GlyphCache.
+        :param font: The font used to render the glyphs
+        """
+        self.font = font  # Font used for every glyph
+        self.glyphs = {}  # Rendered surfaces keyed by (text, color)
+
+    def get(self, value, color):
+        """
+        Get the rendered surface for a value, rendering it only the first time it is requested.
+        :param value: The value to render
+        :param color: The text color
+        :return: The rendered surface
+        """
+        key = (value, color)
+        glyph = self.glyphs.get(key)
+        if glyph is None:  # First use of this value and color
+            glyph = self.font.render(SYMBOLS[value], True, color)  # Render it once, letters for values above 9
+            self.glyphs[key] = glyph
+        return glyph
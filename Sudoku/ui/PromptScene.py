@@ -0,0 +1,47 @@
+import pygame  # Import the Pygame library
+from ui.InputBox import InputBox  # Import the InputBox class
+
+WHITE = (255, 255, 255)  # RGB color for white
+BLACK = (0, 0, 0)  # RGB color for black
+
+
+class PromptScene:
+    def __init__(self, text, choices, font):
+        """
+        Initialize the PromptScene, a question answered by typing into an input box.
+        It only handles the events it is given and draws when something changed, it never waits itself.
+        :param text: The question to display
+        :param choices: The accepted answers, lowercase, or None to accept any answer
+        :param font: The font used for the question and the answer
+        """
+        self.text = text  # Question displayed above the input box
+        self.choices = choices  # Accepted answers
+        self.font = font  # Font of the question and the answer
+        self.input_box = InputBox(150, 300, 200, 40, font)  # Create an input box with font
+        self.dirty = True  # The scene must be drawn
+
+    def handle_event(self, event):
+        """
+        Pass an event to the input box.
+        :param event: The Pygame event
+        :return: The answer in lowercase when an accepted one is submitted, None otherwise
+        """
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):  # Only these change the input box
+            self.dirty = True
+        result = self.input_box.handle_event(event)  # Handle input box events
+        if result and (self.choices is None or result.lower() in self.choices):  # Check if the answer is accepted
+            return result.lower()
+        return None
+
+    def draw(self, screen):
+        """
+        Draw the scene if it changed since the last call.
+        :param screen: The screen to draw on
+        """
+        if not self.dirty:  # Nothing changed
+            return
+        screen.fill(WHITE)  # Fill screen with white
+        self.input_box.draw(screen)  # Draw input box
+        screen.blit(self.font.render(self.text, True, BLACK), (50, 250))  # Draw prompt
+        pygame.display.flip()  # Update display
+        self.dirty = False
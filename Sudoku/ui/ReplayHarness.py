@@ -0,0 +1,173 @@
+import gc  # Import the gc module
+import os  # Import the os module
+import random  # Import the random module
+import sys  # Import the sys module
+import time  # Import the time module
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # No window, set before Pygame is initialized by SudokuMenu
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # Import the Pygame library
+from logic.Geometry import SYMBOLS  # Import the value characters
+from logic.GridPool import GridPool  # Import the GridPool class
+from ui.EventLog import EventLog  # Import the EventLog class
+from ui.SudokuMenu import SudokuMenu, WINDOW_SIZE  # Import the SudokuMenu class and the board's width
+
+SEED = 1234  # Random seed of scripted sessions
+INSTRUMENTED = ('update_screen', 'check_solution', 'start_game')  # SudokuMenu methods timed separately
+INPUT_BOX = (250, 320)  # Center of the prompt's input box
+
+
+class ReplayHarness:
+    """
+    Runs SudokuMenu without a window (SDL dummy video driver) on a recorded or scripted stream of input frames
+    and measures every frame, as fast as the frames can run. A frame is one call of SudokuMenu.frame; while the
+    Solve button's search animates, empty frames are run until it finishes before the next input frame.
+    """
+
+    def __init__(self, size=9, seed=SEED):
+        """
+        Initialize the ReplayHarness.
+        :param size: Board size of the session (default is 9)
+        :param seed: Random seed, so the same puzzles are generated on every run (default is SEED)
+        """
+        self.size = size  # Board size
+        self.seed = seed  # Random seed of the session
+
+    @classmethod
+    def from_log(cls, path):
+        """
+        Load a session recorded with main.py --record.
+        :param path: Path of the EventLog file
+        :return: Tuple (ReplayHarness with the recorded seed and size, list of frames)
+        """
+        header, frames = EventLog.read(path)
+        return cls(header['size'], header['seed']), frames
+
+    def run(self, frames):
+        """
+        Replay a session.
+        :param frames: List of frames, each a list of event dictionaries as written by EventLog
+        :return: Dictionary of metrics: frames run, mean, 95th percentile and longest frame time, seconds spent
+                 in each INSTRUMENTED method, and net memory blocks allocated per frame (sys.getallocatedblocks)
+        """
+        random.seed(self.seed)
+        GridPool.reset_shared()  # Same pooled grids on every run
+        app = SudokuMenu(self.size, prefetch=False, bank_path=None)
+        spent = {name: 0.0 for name in INSTRUMENTED}
+        for name in INSTRUMENTED:  # Time the calls made through the instance, including internal ones
+            setattr(app, name, self._timed(getattr(app, name), name, spent))
+
+        frame_times = []  # Seconds of each frame
+        frame_blocks = []  # Net memory blocks allocated by each frame
+        gc.collect()
+        gc.disable()  # A collection inside a frame would free older objects and hide the frame's allocations
+        try:
+            self._replay(app, frames, frame_times, frame_blocks)
+        finally:
+            gc.enable()
+        app.cancel_solve()
+        blocks = sum(frame_blocks)
+
+        frame_times.sort()
+        metrics = {
+            'frames': len(frame_times),
+            'frame_time': sum(frame_times) / len(frame_times),
+            'frame_p95_time': frame_times[min(len(frame_times) - 1, int(0.95 * len(frame_times)))],
+            'frame_max_time': frame_times[-1],
+            'blocks_per_frame': round(blocks / len(frame_times), 1),
+        }
+        for name in INSTRUMENTED:
+            metrics[f"{name}_time"] = spent[name]
+        return metrics
+
+    def scripted(self):
+        """
+        Build the standard session: choose easy, type into cells, check, undo and redo, start a medium game,
+        solve it, check it, and answer the replay prompt for a hard game.
+        :return: List of frames
+        """
+        cell_size = WINDOW_SIZE // self.size  # As in SudokuMenu
+        frames = self.answer('easy')
+        for i in range(2 * self.size):  # Select a cell and type a value, some on givens
+            row, col = i % self.size, (i * 2 + i // self.size) % self.size
+            frames.append([self.click((col * cell_size + cell_size // 2, row * cell_size + cell_size // 2))])
+            frames.append([self.key(SYMBOLS[1 + i % self.size].lower())])
+        frames.append([self.click(self.button('Check Me'))])
+        frames += [[self.key('z', pygame.KMOD_LCTRL)] for _ in range(5)]
+        frames += [[self.key('y', pygame.KMOD_LCTRL)] for _ in range(3)]
+        frames.append([self.click(self.button('New Game'))])
+        frames += self.answer('medium')
+        frames.append([self.click(self.button('Solve'))])
+        frames.append([self.click(self.button('Check Me'))])
+        frames += self.answer('yes') + self.answer('hard')
+        return frames
+
+    def answer(self, text):
+        """
+        Build the frames that activate the prompt's input box, type text and press Enter.
+        :return: List of frames
+        """
+        return [[self.click(INPUT_BOX)]] + [[self.key(char)] for char in text] + [[self.key('return')]]
+
+    @staticmethod
+    def click(pos):
+        """
+        Build a left click event.
+        :param pos: Position (x, y) of the click
+        :return: Event dictionary
+        """
+        return {'type': 'MOUSEBUTTONDOWN', 'pos': list(pos), 'button': 1}
+
+    @staticmethod
+    def key(name, mod=0):
+        """
+        Build a key press event.
+        :param name: Pygame key name, such as '5', 'a' or 'return'
+        :param mod: Modifier keys held (default is 0, none)
+        :return: Event dictionary
+        """
+        key = pygame.key.key_code(name)
+        return {'type': 'KEYDOWN', 'key': key, 'mod': mod, 'unicode': '\r' if name == 'return' else name}
+
+    @staticmethod
+    def button(label):
+        """
+        Get the position of a menu button, as created by SudokuMenu.create_menu.
+        :param label: The button text
+        :return: Position (x, y) inside the button
+        """
+        left = {'New Game': 50, 'Check Me': 200, 'Quit': 350, 'Solve': 440}[label]
+        return left + 10, WINDOW_SIZE + 20
+
+    @staticmethod
+    def _replay(app, frames, frame_times, frame_blocks):
+        """
+        Run the frames on the app, appending the time and net allocated blocks of each frame.
+        """
+        for frame in frames:
+            pending = [EventLog.decode(data) for data in frame]
+            while True:
+                allocated = sys.getallocatedblocks()
+                started = time.perf_counter()
+                app.frame(pending)
+                frame_times.append(time.perf_counter() - started)
+                frame_blocks.append(sys.getallocatedblocks() - allocated)
+                pending = []
+                if not (app.running and app.is_animating()):  # Animations run until they end
+                    break
+            if not app.running:
+                break
+
+    @staticmethod
+    def _timed(method, name, spent):
+        """
+        Wrap a method so the time spent in it is added to spent[name].
+        """
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                spent[name] += time.perf_counter() - started
+        return timed
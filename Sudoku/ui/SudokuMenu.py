@@ -1,19 +1,31 @@
-import pygame  # Import the Pygame library
+import os  # Import the os module
 import random  # Import the random module
+import pygame  # Import the Pygame library
 
 from logic.Board import Board  # Import the Board class
+from logic.ConflictChecker import ConflictChecker  # Import the ConflictChecker class
+from logic.MoveLog import MoveLog  # Import the MoveLog class
 from logic.Solver import Solver  # Import the Solver class
-from logic.Cell import Cell  # Import the Cell class
+from logic.PuzzlePrefetcher import PuzzlePrefetcher  # Import the PuzzlePrefetcher class
+from logic.PuzzleBank import PuzzleBank  # Import the PuzzleBank class
+from logic.Generator import SIZE_LEVELS  # Import the difficulty levels of each board size
+from logic.Geometry import Geometry, SYMBOLS  # Import the Geometry class and value characters
+from ui.CellView import CellView  # Import the CellView class
 from ui.Button import Button  # Import the Button class
-from ui.InputBox import InputBox  # Import the InputBox class
+from ui.GlyphCache import GlyphCache  # Import the GlyphCache class
+from ui.PromptScene import PromptScene  # Import the PromptScene class
+from ui.EventLog import EventLog  # Import the EventLog class
 
 pygame.init()  # Initialize Pygame
 
 # Define constants for the game
 WINDOW_SIZE = 550  # The new size of the game window
-CELL_SIZE = WINDOW_SIZE // 9  # The size of each cell
 FPS = 30  # Frames per second
 FOOTER_HEIGHT = 50  # Height of the footer where the buttons are located
+SOLVE_BUDGET = 0.5 / FPS  # Seconds of solving per frame, half a frame so the window stays responsive
+BANK_PATH = 'puzzles.bank'  # Puzzle bank used for new games when the file exists
+IDLE_TIMEOUT = 1000  # Milliseconds the main loop sleeps waiting for an event when nothing is animating
+SCENES = ('difficulty', 'playing', 'replay')  # States of the window, each with its own event handling
 
 # Colors
 WHITE = (255, 255, 255)  # RGB color for white
@@ -27,21 +39,45 @@ font = pygame.font.SysFont('Arial', 24)  # Set the font for drawing text
 
 
 class SudokuMenu:
-    def __init__(self):
+    def __init__(self, size=9, animate_solve=True, prefetch=True, bank_path=BANK_PATH):
         """
         Initialize the Sudoku game menu.
+        :param size: Number of rows, columns, boxes and digits, 9, 16 or 25 (default is 9)
+        :param animate_solve: Whether the Solve button shows the search as it runs (default is True)
+        :param prefetch: Whether puzzles are generated by a background thread (default is True); without it
+                         every puzzle is generated when the game starts, so a seeded session is reproducible
+        :param bank_path: Puzzle bank used for new games when the file exists (default is BANK_PATH, None for none)
         """
         self.screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE + FOOTER_HEIGHT))  # Create the game window
         pygame.display.set_caption("Sudoku Game")  # Set the window title
-        self.board = Board()  # Create a Board instance
-        self.solver = Solver()  # Create a Solver instance
-        self.cells = [[Cell(row, col, CELL_SIZE) for col in range(9)] for row in range(9)]  # Create a 9x9 grid of Cell instances
+        self.size = size  # Board size
+        self.box = Geometry.of(size).box  # Rows and columns of each box
+        self.cell_size = WINDOW_SIZE // size  # The size of each cell
+        self.board = Board(size)  # Create a Board instance
+        self.moves = MoveLog(self.board)  # Undo/redo history of the player's moves
+        self.solver = Solver.for_size(size)  # Create a Solver with the engine suited to the board size
+        self.checker = ConflictChecker(size)  # Finds repeated digits in a single pass
+        self.cells = [[CellView(row, col, self.cell_size) for col in range(size)] for row in range(size)]  # Create the grid of CellView instances
         self.selected_cell = None  # Initialize the selected cell as None
         self.buttons = []  # List to store buttons
+        self.cell_font = pygame.font.SysFont('Arial', min(24, self.cell_size * 2 // 3))  # Font scaled to the cells
+        self.glyphs = GlyphCache(self.cell_font)  # Digits rendered once per color
+        self.full_redraw = True  # The whole window must be drawn on the next update
+        self.bank = PuzzleBank(bank_path) if size == 9 and bank_path and os.path.exists(bank_path) else None  # Open the puzzle bank if present
+        self.prefetcher = PuzzlePrefetcher(board_size=size)  # Generate puzzles in the background
+        self.step_solver = None  # Resumable solve started by the Solve button, advanced once per frame
+        self.animate_solve = animate_solve  # Show the partial assignment while solving
+        self.levels = SIZE_LEVELS[size]  # Answers accepted by the difficulty prompt
+        self.difficulty = None  # Difficulty of the current game
+        self.scene = None  # Current scene, one of SCENES
+        self.prompt = None  # PromptScene of the difficulty and replay scenes
+        self.running = True  # Cleared to leave the main loop
+        pygame.event.set_blocked(pygame.MOUSEMOTION)  # Nothing follows the mouse, so moving it need not wake the loop
+        if prefetch:
+            self.prefetcher.start()  # Start filling the puzzle queues
 
         self.create_menu()  # Create the menu
-        self.difficulty = self.get_difficulty()  # Get the difficulty from the user
-        self.start_game()  # Start a new game
+        self.get_difficulty()  # Ask for the difficulty, the game starts once it is entered
 
     def create_menu(self):
         """
@@ -52,6 +88,7 @@ class SudokuMenu:
         self.buttons.append(Button("New Game", (50, button_y), font))  # Create the "New Game" button
         self.buttons.append(Button("Check Me", (200, button_y), font))  # Create the "Check Me" button
         self.buttons.append(Button("Quit", (350, button_y), font))  # Create the "Quit" button
+        self.buttons.append(Button("Solve", (440, button_y), font))  # Create the "Solve" button
 
     def draw_menu(self):
         """
@@ -67,60 +104,125 @@ class SudokuMenu:
         for button in self.buttons:  # Iterate through the buttons
             if button.click(event):  # Check if a button is clicked
                 if button.feedback == "New Game":
-                    self.difficulty = self.get_difficulty()  # Get the difficulty from the user
-                    self.start_game()  # Start a new game
+                    self.cancel_solve()  # Stop a running solve
+                    self.get_difficulty()  # Ask for the difficulty of the new game
                 elif button.feedback == "Check Me":
                     self.check_solution()  # Check the current solution
+                elif button.feedback == "Solve":
+                    self.start_solve()  # Solve over the next frames
                 elif button.feedback == "Quit":
-                    pygame.quit()  # Quit Pygame
-                    exit()  # Exit the program
+                    self.running = False  # Leave the main loop
 
     def start_game(self):
         """
-        Start a new game by resetting the board, solving it, and then removing some numbers based on difficulty.
+        Start a new game with a puzzle from the puzzle bank, or from the prefetch queue when the bank has none.
+        The prefetcher only generates synchronously when its queue for the difficulty is empty.
         """
-        self.board.reset_board()  # Reset the board
-        self.board.fill_grid()  # Fill the board with a solved Sudoku grid
-        if self.difficulty == 'easy':
-            num_clear = random.randint(50, 67)  # Define the number of cells to clear for easy difficulty
-        elif self.difficulty == 'medium':
-            num_clear = random.randint(32, 49)  # Define the number of cells to clear for medium difficulty
-        elif self.difficulty == 'hard':
-            num_clear = random.randint(28, 31)  # Define the number of cells to clear for hard difficulty
-        else:
-            num_clear = 36  # Default number if difficulty is not set properly
-        self.board.remove_numbers(81 - num_clear)  # Remove numbers from the board to create the puzzle
+        if self.bank is None or not self.board.load_from_bank(self.bank, self.difficulty):  # Bank miss
+            self.board.load_puzzle(*self.prefetcher.get_with_solution(self.difficulty))  # Take a prefetched puzzle
+        self.moves.reset()  # The new puzzle is the start of the history
         self.update_cells()  # Update cells with the current board state
-        self.update_screen()  # Update the screen with the current board state
+        self.scene = 'playing'
+        self.prompt = None
+        self.full_redraw = True  # The prompts drew over the board
+
+    def start_solve(self):
+        """
+        Start solving the board in the background of the game loop; advance_solve runs it a slice per frame.
+        """
+        self.cancel_solve()  # Only one solve at a time
+        self.step_solver = self.solver.step_solver(self.board.get_values())  # Search a copy of the board
+
+    def advance_solve(self):
+        """
+        Run the current solve for at most SOLVE_BUDGET seconds and show its progress.
+        When it finishes, the solution is copied onto the board.
+        """
+        if self.step_solver is None:  # Nothing to solve
+            return
+        status = self.step_solver.step(max_time=SOLVE_BUDGET)  # One slice of the search
+        if status == 'running':
+            if self.animate_solve:  # Show the cells filled so far
+                self.show_values(self.step_solver.values())
+            return
+        if status == 'solved':
+            self.board.set_values(self.step_solver.solution())  # Copy the solution onto the board
+            self.moves.reset()  # The solved board is the new start of the history
+            print(f"Solved in {self.step_solver.nodes} nodes")
+        elif status == 'no-solution':
+            print("This puzzle has no solution from the current entries!")
+        self.step_solver = None
+        self.update_cells()  # Show the final board
+
+    def cancel_solve(self):
+        """
+        Cancel the current solve, if any, and show the board as it was.
+        """
+        if self.step_solver is None:  # Nothing to cancel
+            return
+        self.step_solver.cancel()
+        self.step_solver = None
+        self.update_cells()  # Drop the partial assignment from the screen
+
+    def show_values(self, values):
+        """
+        Show values in the non-fixed cells without writing them to the board.
+        :param values: 2D list of values, 0 for empty cells
+        """
+        for row in range(self.size):  # Iterate through each row
+            for col in range(self.size):  # Iterate through each column
+                if not self.cells[row][col].fixed:  # Givens never change
+                    self.cells[row][col].set_value(values[row][col], BLUE)  # Solver values in blue
 
     def update_cells(self):
         """
-        Update the cell values from the board.
+        Update the cell views from the board.
         """
-        for row in range(9):  # Iterate through each row
-            for col in range(9):  # Iterate through each column
-                self.cells[row][col].set_value(self.board.grid[row][col].value)  # Set the value for each cell
+        for row in range(self.size):  # Iterate through each row
+            for col in range(self.size):  # Iterate through each column
+                self.cells[row][col].set_value(self.board.get(row, col))  # Set the value for each cell
+                self.cells[row][col].fixed = self.board.is_fixed(row, col)  # Mirror the fixed status
 
     def cell_click(self, pos):
         """
         Handle cell click events to select a cell.
         :param pos: The position of the mouse click
         """
-        col, row = pos[0] // CELL_SIZE, pos[1] // CELL_SIZE  # Calculate the column and row index based on click position
-        if 0 <= col < 9 and 0 <= row < 9:  # Check if the click is within the board boundaries
+        col, row = pos[0] // self.cell_size, pos[1] // self.cell_size  # Calculate the column and row index based on click position
+        if 0 <= col < self.size and 0 <= row < self.size:  # Check if the click is within the board boundaries
             if self.selected_cell:  # If a cell is already selected
                 self.selected_cell.deselect()  # Deselect the currently selected cell
             self.selected_cell = self.cells[row][col]  # Update the selected cell
             self.selected_cell.select()  # Select the new cell
 
-    def key_input(self, key):
+    def key_input(self, key, mods=None):
         """
-        Handle key input events to set cell values.
+        Handle key input events to set cell values. Values above 9 are typed as letters, A for 10.
+        Ctrl+Z undoes the last move and Ctrl+Y redoes it. Keys typed on a given are ignored.
         :param key: The key that was pressed
-        """
-        if self.selected_cell and key in range(pygame.K_1, pygame.K_9 + 1):  # Check if a valid digit key is pressed
-            self.selected_cell.set_value(key - pygame.K_0, BLACK)  # Set the value of the selected cell
-            self.board.grid[self.selected_cell.row][self.selected_cell.col].value = key - pygame.K_0  # Update the board with the new value
+        :param mods: Modifier keys held with it (default is None, the current state of the keyboard)
+        """
+        name = pygame.key.name(key).upper()  # '1'-'9' for digit keys, 'A'-'Z' for letter keys
+        value = SYMBOLS.find(name) if len(name) == 1 else -1  # Value typed, -1 if the key is not a value
+        if key == pygame.K_ESCAPE:  # Escape stops a running solve
+            self.cancel_solve()
+            return
+        if self.step_solver is not None:  # The board is locked while the solver runs
+            return
+        if mods is None:
+            mods = pygame.key.get_mods()
+        if mods & pygame.KMOD_CTRL and key in (pygame.K_z, pygame.K_y):  # Undo or redo
+            move = self.moves.undo() if key == pygame.K_z else self.moves.redo()
+            if move is not None:
+                row, col, value = move
+                self.cells[row][col].set_value(value, BLACK)  # Show the restored value
+            return
+        if self.selected_cell and 1 <= value <= self.size:  # Check if a valid value key is pressed
+            row, col = self.selected_cell.row, self.selected_cell.col
+            if self.board.is_fixed(row, col):  # Givens cannot be overwritten
+                return
+            self.selected_cell.set_value(value, BLACK)  # Set the value of the selected cell
+            self.moves.record(row, col, value)  # Update the board and log the move
             self.check_after_move()  # Check the solution after each move
 
     def check_after_move(self):
@@ -128,50 +230,66 @@ class SudokuMenu:
         Check the solution after each move.
         """
         if self.is_board_full():  # Check if the board is full
-            if self.solver.is_valid_solution(self.board.get_values()):  # Validate the solution using the Solver
+            if self.board.is_solved():  # Validate the solution from the board counters
                 print("Congratulations! You solved the puzzle!")  # Print success message
                 self.ask_replay()  # Ask the player if they want to play again
 
     def update_screen(self):
         """
         Update the screen with the current values of the board.
-        """
-        self.screen.fill(WHITE)  # Fill the screen with white color
-        self.draw_grid()  # Draw the Sudoku grid
-        for row in range(9):  # Iterate through each row
-            for col in range(9):  # Iterate through each column
-                self.cells[row][col].draw(self.screen, font)  # Draw each cell
-        self.draw_menu()  # Draw the menu
-        pygame.display.flip()  # Update the display
+        Only cells whose value, color or selection changed are redrawn and pushed to the display,
+        unless a full redraw was requested.
+        """
+        if self.full_redraw:  # Draw the whole window
+            self.screen.fill(WHITE)  # Fill the screen with white color
+            self.draw_grid()  # Draw the Sudoku grid
+            for row in range(self.size):  # Iterate through each row
+                for col in range(self.size):  # Iterate through each column
+                    self.cells[row][col].draw(self.screen, self.cell_font, self.glyphs)  # Draw each cell
+            self.draw_menu()  # Draw the menu
+            pygame.display.flip()  # Update the display
+            self.full_redraw = False
+            return
+
+        dirty_rects = []  # Areas of the screen that changed
+        for row in range(self.size):  # Iterate through each row
+            for col in range(self.size):  # Iterate through each column
+                cell = self.cells[row][col]
+                if cell.dirty:  # Only redraw cells that changed
+                    dirty_rects.append(cell.draw(self.screen, self.cell_font, self.glyphs))
+        if dirty_rects:  # Push only the changed areas
+            pygame.display.update(dirty_rects)
 
     def draw_grid(self):
         """
         Draw the Sudoku grid on the screen.
         """
-        for x in range(0, WINDOW_SIZE, CELL_SIZE):  # Draw vertical lines
-            pygame.draw.line(self.screen, BLACK if x % (3 * CELL_SIZE) == 0 else GRAY, (x, 0), (x, WINDOW_SIZE))
-        for y in range(0, WINDOW_SIZE, CELL_SIZE):  # Draw horizontal lines
-            pygame.draw.line(self.screen, BLACK if y % (3 * CELL_SIZE) == 0 else GRAY, (0, y), (WINDOW_SIZE, y))
+        extent = self.cell_size * self.size  # Width and height of the grid
+        box_size = self.box * self.cell_size  # Width and height of each box
+        for x in range(0, extent, self.cell_size):  # Draw vertical lines
+            pygame.draw.line(self.screen, BLACK if x % box_size == 0 else GRAY, (x, 0), (x, extent))
+        for y in range(0, extent, self.cell_size):  # Draw horizontal lines
+            pygame.draw.line(self.screen, BLACK if y % box_size == 0 else GRAY, (0, y), (extent, y))
 
     def is_board_full(self):
         """
         Check if the board is completely filled.
         :return: True if the board is full, False otherwise
         """
-        return all(self.board.grid[row][col].value != 0 for row in range(9) for col in range(9))  # Check if all cells are filled
+        return self.board.is_full()  # Read the filled-cell counter of the board
 
     def check_solution(self):
         """
         Check if the current board is a valid Sudoku solution.
         """
-        correct = True
-        for row in range(9):  # Iterate through each row
-            for col in range(9):  # Iterate through each column
-                if not self.solver.is_valid(self.board.get_values(), self.board.grid[row][col].value, (row, col)):  # Validate each cell
+        conflicts = self.checker.conflicts(self.board.values)  # Every repeated digit, in one pass
+        for row in range(self.size):  # Iterate through each row
+            for col in range(self.size):  # Iterate through each column
+                if (row, col) in conflicts:  # The digit is repeated in its row, column or box
                     self.cells[row][col].set_color(RED)  # Highlight errors in red
-                    correct = False  # Mark as incorrect
                 elif not self.cells[row][col].fixed:  # Only reset color for non-fixed cells
                     self.cells[row][col].set_color(BLACK)  # Reset to black if correct
+        correct = not conflicts and self.board.is_full()  # Solved when full without repeated digits
         if correct:
             print("Congratulations! You solved the puzzle!")  # Print success message
             self.ask_replay()  # Ask the player if they want to play again
@@ -180,84 +298,106 @@ class SudokuMenu:
 
     def ask_replay(self):
         """
-        Ask the player if they want to play again.
-        """
-        input_box = InputBox(150, 300, 200, 40, font)  # Create an input box with font
-        done = False
-        while not done:  # Loop until done
-            for event in pygame.event.get():  # Iterate through events
-                if event.type == pygame.QUIT:  # Quit event
-                    pygame.quit()  # Quit Pygame
-                    exit()  # Exit program
-                result = input_box.handle_event(event)  # Handle input box events
-                if result:  # If result is returned
-                    response = result.lower()  # Convert to lowercase
-                    done = True  # Exit loop
-
-            self.screen.fill(WHITE)  # Fill screen with white
-            input_box.draw(self.screen)  # Draw input box
-            prompt_surface = font.render("Congratulations!"
-                                         "Do you want to play again? (yes/no): ", True, BLACK)  # Render prompt
-            self.screen.blit(prompt_surface, (50, 250))  # Draw prompt
-            pygame.display.flip()  # Update display
-
-        if response == 'yes':  # If the player wants to play again
-            difficulty = self.get_difficulty()  # Get the difficulty
-            self.difficulty = difficulty  # Set the difficulty
-            self.start_game()  # Start a new game
-        else:
-            pygame.quit()  # Quit Pygame
-            exit()  # Exit the program
+        Ask the player if they want to play again; the answer is handled by handle_event.
+        """
+        self.scene = 'replay'
+        self.prompt = PromptScene("Congratulations! Do you want to play again? (yes/no): ", None, font)
 
     def get_difficulty(self):
         """
-        Prompt the player to enter the difficulty level.
-        :return: The chosen difficulty level
-        """
-        input_box = InputBox(150, 300, 200, 40, font)  # Create an input box with font
-        done = False
-        while not done:  # Loop until done
-            for event in pygame.event.get():  # Iterate through events
-                if event.type == pygame.QUIT:  # Quit event
-                    pygame.quit()  # Quit Pygame
-                    exit()  # Exit program
-                result = input_box.handle_event(event)  # Handle input box events
-                if result:  # If result is returned
-                    response = result.lower()  # Convert to lowercase
-                    if response in ['easy', 'medium', 'hard']:  # Check if valid difficulty
-                        done = True  # Exit loop
-
-            self.screen.fill(WHITE)  # Fill screen with white
-            input_box.draw(self.screen)  # Draw input box
-            prompt_surface = font.render("Enter difficulty (easy, medium, hard): ", True, BLACK)  # Render prompt
-            self.screen.blit(prompt_surface, (50, 250))  # Draw prompt
-            pygame.display.flip()  # Update display
-
-        return response  # Return the chosen difficulty
+        Prompt the player to enter the difficulty level; a new game starts once a level offered on the board size
+        is entered.
+        """
+        self.scene = 'difficulty'
+        self.prompt = PromptScene(f"Enter difficulty ({', '.join(self.levels)}): ", self.levels, font)
 
-    @staticmethod
-    def main():
+    def handle_event(self, event):
         """
-        The main function to run the game.
+        Pass an event to the current scene.
+        :param event: The Pygame event
         """
-        app = SudokuMenu()  # Create the SudokuMenu application
+        if event.type == pygame.QUIT:  # The window was closed
+            self.running = False
+        elif self.scene == 'playing':
+            if event.type == pygame.MOUSEBUTTONDOWN:  # If a mouse button is pressed
+                self.cell_click(event.pos)  # Handle the cell click event
+                self.handle_menu(event)  # Handle the menu click event
+            elif event.type == pygame.KEYDOWN:  # If a key is pressed
+                self.key_input(event.key, event.mod)  # Handle key input events
+        elif self.prompt is not None:
+            response = self.prompt.handle_event(event)
+            if response is None:  # Nothing submitted yet
+                return
+            if self.scene == 'difficulty':
+                self.difficulty = response  # Set the difficulty
+                self.start_game()  # Start a new game
+            elif response == 'yes':  # The player wants to play again
+                self.get_difficulty()
+            else:
+                self.running = False  # Leave the main loop
 
-        clock = pygame.time.Clock()  # Create a clock object to control the frame rate
-        running = True  # Set the running flag to True
-
-        while running:  # Main game loop
-            for event in pygame.event.get():  # Iterate through the event queue
-                if event.type == pygame.QUIT:  # If the quit event is triggered
-                    running = False  # Set the running flag to False
-                elif event.type == pygame.MOUSEBUTTONDOWN:  # If a mouse button is pressed
-                    app.cell_click(pygame.mouse.get_pos())  # Handle the cell click event
-                    app.handle_menu(event)  # Handle the menu click event
-                elif event.type == pygame.KEYDOWN:  # If a key is pressed
-                    app.key_input(event.key)  # Handle key input events
+    def is_animating(self):
+        """
+        Check if the window changes without input, so the main loop must keep running frames.
+        :return: True while the Solve button's search runs, False otherwise
+        """
+        return self.step_solver is not None
 
-            app.update_screen()  # Update the screen
-            clock.tick(FPS)  # Control the frame rate
+    def draw(self):
+        """
+        Draw the current scene; only what changed since the last call is drawn.
+        """
+        if self.scene == 'playing':
+            self.update_screen()  # Update the screen
+        elif self.prompt is not None:
+            self.prompt.draw(self.screen)
 
-        pygame.quit()  # Quit Pygame
+    def frame(self, events):
+        """
+        Run one pass of the main loop: handle the events, advance the solve and draw.
+        :param events: The Pygame events received since the last frame
+        """
+        for event in events:  # Iterate through the events
+            self.handle_event(event)
+            if not self.running:
+                break
+        self.advance_solve()  # Run the solve started by the Solve button for part of the frame
+        self.draw()  # Update the screen
 
+    @staticmethod
+    def main(size=9, record=None):
+        """
+        The main function to run the game. A single event loop serves every scene: it sleeps in
+        pygame.event.wait until an event arrives, or for at most IDLE_TIMEOUT milliseconds, and only
+        runs FPS frames per second while something is animating.
+        :param size: Number of rows, columns, boxes and digits, 9, 16 or 25 (default is 9)
+        :param record: Path of an EventLog to record the session to, for the replay harness (default is None).
+                       Recorded sessions are seeded and run without prefetching or puzzle bank so they replay
+                       with the same puzzles.
+        """
+        log = None
+        if record:
+            seed = random.randrange(2 ** 32)
+            random.seed(seed)
+            log = EventLog.create(record, seed, size)
+            app = SudokuMenu(size, prefetch=False, bank_path=None)
+        else:
+            app = SudokuMenu(size)  # Create the SudokuMenu application
+        clock = pygame.time.Clock()  # Create a clock object to control the frame rate
 
+        while app.running:  # Main game loop
+            if app.is_animating():  # Take the pending events without waiting
+                events = pygame.event.get()
+            else:  # Sleep until an event arrives
+                events = [pygame.event.wait(IDLE_TIMEOUT)] + pygame.event.get()
+            if log is not None:
+                log.write(events)
+            app.frame(events)
+            if app.is_animating():
+                clock.tick(FPS)  # Control the frame rate
+
+        if log is not None:
+            log.close()
+        app.cancel_solve()  # Stop a running solve
+        app.prefetcher.stop()  # Stop the background generator
+        pygame.quit()  # Quit Pygame